@@ -0,0 +1,251 @@
+# Filename: benchmarks/element_finder_bench.py
+# Description: Times ElementFinder operations in headless Chrome against generated fixture pages served locally, saves JSON baselines and flags regressions.
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from selenium.webdriver.common.by import By
+
+from utils.browser_profiles import PROFILES
+from utils.config_provider import ConfigProvider
+from utils.driver_factory import create_chrome_driver
+from utils.element_finder import ElementFinder
+
+logger = logging.getLogger(__name__)
+
+PAGE_NAME = "Benchmark"
+ELEMENT_NAME = "Bench Target"
+
+# Same priority order as the page objects; a fixture page only satisfies the strategy at its depth
+TARGET_LOCATORS = {
+    "accessibility": (By.CSS_SELECTOR, "[aria-label='Bench Target']"),
+    "data-testid": (By.CSS_SELECTOR, "[data-testid='bench-target']"),
+    "semantic": (By.CSS_SELECTOR, "main button.bench-target"),
+    "text": (By.XPATH, "//button[normalize-space()='Bench Target']"),
+}
+
+TARGET_ATTRIBUTES = (
+    ' aria-label="Bench Target"',
+    ' data-testid="bench-target"',
+    ' class="bench-target"',
+    "",
+)
+
+OPERATIONS = ("find", "find_clickable", "click", "assert_visible")
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "element_finder.json")
+
+
+def fixture_page(depth, size, delay_ms):
+    """
+    HTML page with `size` filler elements and one target button that only the strategy at `depth`
+    (0 = accessibility ... 3 = text) resolves first. With delay_ms > 0 the button is inserted by script.
+    """
+    button = f'<button{TARGET_ATTRIBUTES[depth]} onclick="this.dataset.clicked=1">Bench Target</button>'
+    filler = "".join(f'<div class="row"><span>Item {i}</span></div>' for i in range(size // 2))
+    if delay_ms:
+        insert = (
+            f"<script>setTimeout(function () {{"
+            f"document.querySelector('main').insertAdjacentHTML('beforeend', {json.dumps(button)});"
+            f"}}, {int(delay_ms)});</script>"
+        )
+        body = f"<main>{filler}</main>{insert}"
+    else:
+        body = f"<main>{filler}{button}</main>"
+    return f"<!DOCTYPE html><html><head><title>Benchmark</title></head><body>{body}</body></html>"
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        page = fixture_page(
+            int(query.get("depth", ["0"])[0]),
+            int(query.get("size", ["100"])[0]),
+            int(query.get("delay", ["0"])[0]),
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Serves fixture pages at /?depth=<0-3>&size=<elements>&delay=<ms> on a free local port.
+    """
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, depth, size, delay_ms):
+        return f"http://127.0.0.1:{self._server.server_port}/?depth={depth}&size={size}&delay={delay_ms}"
+
+
+def scenario_key(operation, depth, size, delay_ms, poll, backend, timeout):
+    return f"{operation}/depth={depth}/size={size}/delay={delay_ms}/poll={poll}/backend={backend}/timeout={timeout}"
+
+
+def run_operation(finder, operation):
+    if operation == "find":
+        finder.find(ELEMENT_NAME, PAGE_NAME, TARGET_LOCATORS)
+    elif operation == "find_clickable":
+        finder.find_clickable(ELEMENT_NAME, PAGE_NAME, TARGET_LOCATORS)
+    elif operation == "click":
+        finder.find_clickable(ELEMENT_NAME, PAGE_NAME, TARGET_LOCATORS).click()
+    elif operation == "assert_visible":
+        finder.assert_all_visible(PAGE_NAME, {ELEMENT_NAME: TARGET_LOCATORS})
+    else:
+        raise ValueError(f"Unknown operation '{operation}'. Expected one of {OPERATIONS}")
+
+
+def run_benchmarks(driver, server, operations, depths, sizes, delays, polls, backend, repetitions, timeout):
+    """
+    Times every operation in every scenario; each sample reloads the page so delayed insertion restarts.
+    With the sequential poll backend a fallback at depth d waits out the timeout of the strategies before it,
+    so timeout dominates the cost of deep scenarios and is part of the scenario key.
+    Returns {scenario_key: {'median_ms', 'p90_ms', 'min_ms', 'runs'}}.
+    """
+    results = {}
+    for depth, size, delay_ms, poll in itertools.product(depths, sizes, delays, polls):
+        finder = ElementFinder(
+            driver, timeout=timeout, poll_frequency=poll, race=backend == "race", use_strategy_cache=False,
+            wait_backend="observer" if backend == "observer" else "poll",
+        )
+        finder.snapshot_recorder = None
+        for operation in operations:
+            samples = []
+            for _ in range(repetitions):
+                driver.get(server.url(depth, size, delay_ms))
+                start = time.perf_counter()
+                run_operation(finder, operation)
+                samples.append((time.perf_counter() - start) * 1000)
+            samples.sort()
+            key = scenario_key(operation, depth, size, delay_ms, poll, backend, timeout)
+            results[key] = {
+                "median_ms": round(statistics.median(samples), 2),
+                "p90_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.9))], 2),
+                "min_ms": round(samples[0], 2),
+                "runs": len(samples),
+            }
+            logger.info(f"{key}: median {results[key]['median_ms']} ms")
+    return results
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """
+    Returns a list of regressions: scenarios whose median grew by more than `threshold` (a fraction)
+    and by at least min_delta_ms, so sub-millisecond jitter is not reported.
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        delta = current["median_ms"] - previous["median_ms"]
+        if delta >= min_delta_ms and current["median_ms"] > previous["median_ms"] * (1 + threshold):
+            regressions.append(
+                f"{key}: {previous['median_ms']} ms -> {current['median_ms']} ms "
+                f"(+{delta / previous['median_ms'] * 100 if previous['median_ms'] else float('inf'):.0f}%)"
+            )
+    return regressions
+
+
+def _write_json(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",")]
+
+
+def _float_list(value):
+    return [float(v) for v in value.split(",")]
+
+
+def main(argv=None):
+    """
+    Usage: python -m benchmarks.element_finder_bench [--update-baseline] [--threshold 0.2] [matrix options]
+    The default matrix (primary strategy vs last fallback, 2s timeout) finishes in a few minutes; widen it with the matrix options.
+    """
+    config = ConfigProvider()
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.element_finder_bench", description=main.__doc__)
+    parser.add_argument("--operations", default=",".join(OPERATIONS))
+    parser.add_argument("--depths", type=_int_list, default=[0, 3], help="fallback depth of the matching strategy (0-3)")
+    parser.add_argument("--sizes", type=_int_list, default=[200, 2000], help="DOM elements per page")
+    parser.add_argument("--delays", type=_int_list, default=[0, 500], help="ms before the target is inserted")
+    parser.add_argument("--polls", type=_float_list, default=[0.1, 0.5], help="poll frequencies in seconds")
+    parser.add_argument("--backend", choices=("poll", "race", "observer"), default="poll")
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=2.0, help="ElementFinder timeout in seconds per lookup")
+    parser.add_argument("--baseline", default=config.get("SELENIUM_BENCH_BASELINE", DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=float(config.get("SELENIUM_BENCH_THRESHOLD", "0.2")))
+    parser.add_argument("--min-delta-ms", type=float, default=float(config.get("SELENIUM_BENCH_MIN_DELTA_MS", "5")))
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    operations = [op.strip() for op in args.operations.split(",") if op.strip()]
+    if args.timeout * 1000 <= max(args.delays):
+        parser.error(f"--timeout {args.timeout}s must exceed the longest --delays entry ({max(args.delays)} ms)")
+
+    driver = create_chrome_driver(config, profile=PROFILES["standard"])
+    try:
+        with FixtureServer() as server:
+            results = run_benchmarks(
+                driver, server, operations, args.depths, args.sizes, args.delays, args.polls, args.backend, args.repetitions,
+                args.timeout,
+            )
+    finally:
+        driver.quit()
+
+    output = os.path.join(config.artifacts_dir, "benchmarks", "element_finder.json")
+    _write_json(output, results)
+    print(f"{len(results)} scenarios timed; results written to {output}")
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as handle:
+                baseline = json.load(handle)
+        baseline.update(results)
+        _write_json(args.baseline, baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+    with open(args.baseline) as handle:
+        regressions = compare(results, json.load(handle), args.threshold, args.min_delta_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regressions past {args.threshold:.0%} (minimum {args.min_delta_ms} ms)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"), format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    sys.exit(main())
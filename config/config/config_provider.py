@@ -12,7 +12,9 @@ class ConfigProvider:
         self.env = os.environ.get("TEST_ENV", "PIE").upper()
         self.base_urls = {
             "PIE": os.environ.get("BASE_URL_PIE", "https://smb.pie.portalshell.int.hp.com"),
-            "STAGE": os.environ.get("BASE_URL_STAGE", "https://smb.stage.portalshell.int.hp.com")
+            "STAGE": os.environ.get("BASE_URL_STAGE", "https://smb.stage.portalshell.int.hp.com"),
+            # Replays a recorded HTTP archive through the local proxy; URLs match the recorded environment
+            "REPLAY": os.environ.get("BASE_URL_REPLAY", os.environ.get("BASE_URL_PIE", "https://smb.pie.portalshell.int.hp.com"))
         }
         self.credentials = {
             "PIE": {
@@ -22,6 +24,10 @@ class ConfigProvider:
             "STAGE": {
                 "username": os.environ.get("STAGE_USERNAME", ""),
                 "password": os.environ.get("STAGE_PASSWORD", "")
+            },
+            "REPLAY": {
+                "username": os.environ.get("REPLAY_USERNAME", os.environ.get("PIE_USERNAME", "")),
+                "password": os.environ.get("REPLAY_PASSWORD", os.environ.get("PIE_PASSWORD", ""))
             }
         }
 
@@ -1,12 +1,252 @@
 # Filename: conftest.py
-# Description: Ensures environment variables are loaded for secure config management and provides logging setup.
+# Description: Ensures environment variables are loaded for secure config management and provides logging setup and pooled browser sessions.
 
 import os
 import logging
+import pytest
+from utils.driver_factory import ChromeLauncher
+from utils.driver_pool import DriverPool
+from utils.command_profiler import CommandProfiler
+from utils.config_provider import ConfigProvider
+from utils.archive_proxy import ArchiveProxy
+from utils.browser_profiles import ProfileMeter, select_profile
+from utils.parallel_runner import DurationHistory
+from utils.failure_artifacts import FailureArtifacts, activate
+from utils.event_log import EventLog, activate as activate_event_log
+from utils.wait_budget import WaitBudgets, activate as activate_wait_budgets
+from utils.mutation_wait import install_activity_hook
+from utils.checkpoints import CheckpointStore
+from utils.page_telemetry import PageTelemetry, activate as activate_page_telemetry
+from utils.strategy_cache import StrategyCache, activate as activate_strategy_cache
+
+_driver_pool = None
+_launcher = None
+_command_profiler = None
+_archive_proxy = None
+_profile_meter = None
+_test_durations = {}
+_failure_artifacts = None
+_event_log = None
+_wait_budgets = None
+_checkpoint_store = None
+_page_telemetry = None
+
+def _worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER") or os.environ.get("SELENIUM_WORKER_ID", "")
 
 def pytest_configure(config):
-    # Set up logging for diagnostics
+    # Set up logging for diagnostics; parallel workers log to their own file instead of interleaving
+    worker = _worker_id()
+    handlers = None
+    if worker:
+        log_dir = os.path.join(ConfigProvider().artifacts_dir, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        handlers = [logging.FileHandler(os.path.join(log_dir, f"{worker}.log"))]
     logging.basicConfig(
         level=os.environ.get("LOG_LEVEL", "INFO"),
-        format="%(asctime)s %(levelname)s %(name)s %(message)s"
+        format=f"%(asctime)s {worker + ' ' if worker else ''}%(levelname)s %(name)s %(message)s",
+        handlers=handlers
+    )
+    config.addinivalue_line(
+        "markers", "command_budget(max_commands): fail the test if it sends more WebDriver commands than this"
     )
+    global _command_profiler
+    if os.environ.get("SELENIUM_COMMAND_PROFILE", "true").lower() not in ("0", "false"):
+        _command_profiler = CommandProfiler(slowest=int(os.environ.get("SELENIUM_COMMAND_PROFILE_SLOWEST", "5")))
+
+@pytest.fixture(scope="session")
+def archive_proxy():
+    # Record/replay proxy: TEST_ENV=REPLAY serves the HTTP archive, SELENIUM_HTTP_RECORD=true fills it
+    global _archive_proxy
+    _archive_proxy = ArchiveProxy.from_env(ConfigProvider())
+    if _archive_proxy is None:
+        yield None
+        return
+    _archive_proxy.start()
+    yield _archive_proxy
+    _archive_proxy.stop()
+
+@pytest.fixture(scope="session")
+def driver_pool(archive_proxy):
+    global _driver_pool, _profile_meter, _launcher
+    config = ConfigProvider()
+    profile = select_profile(config)
+    _profile_meter = ProfileMeter(profile, os.path.join(config.cache_dir, "resource_sizes.json"))
+    # SELENIUM_FAST_LAUNCH=true shares one chromedriver and clones a pre-warmed profile per session
+    _launcher = ChromeLauncher(config, proxy_url=archive_proxy.url if archive_proxy else None, profile=profile)
+    _driver_pool = DriverPool(
+        _launcher.launch,
+        size=int(os.environ.get("SELENIUM_POOL_SIZE", "1")),
+        max_uses=int(os.environ.get("SELENIUM_POOL_MAX_USES", "20"))
+    )
+    yield _driver_pool
+    _driver_pool.close()
+    _launcher.close()
+    _profile_meter.save()
+    logging.getLogger(__name__).info(_profile_meter.summary())
+
+@pytest.fixture(scope="session")
+def failure_artifacts():
+    # Screenshot, DOM, console and command log on failure; written on a background thread
+    global _failure_artifacts
+    _failure_artifacts = FailureArtifacts.from_env(ConfigProvider())
+    if _failure_artifacts is not None and _command_profiler is not None:
+        _failure_artifacts.command_history = _command_profiler.recent
+    yield _failure_artifacts
+    if _failure_artifacts is not None:
+        _failure_artifacts.close()
+
+@pytest.fixture(scope="session")
+def event_log():
+    # Lookup/action events per test: JSONL for failed tests, one summary line for every test
+    global _event_log
+    _event_log = EventLog.from_env(ConfigProvider())
+    yield _event_log
+    if _event_log is not None:
+        _event_log.close()
+
+@pytest.fixture(scope="session")
+def wait_budgets():
+    # Per-element wait budgets learned from earlier runs; this session's latencies are added at the end
+    global _wait_budgets
+    _wait_budgets = WaitBudgets.from_env(ConfigProvider())
+    yield _wait_budgets
+    if _wait_budgets is not None:
+        _wait_budgets.flush()
+
+@pytest.fixture(scope="session")
+def page_telemetry():
+    # Navigation Timing and Web Vitals of every page the tests load, kept per environment and build
+    global _page_telemetry
+    _page_telemetry = PageTelemetry.from_env(ConfigProvider())
+    yield _page_telemetry
+    if _page_telemetry is not None:
+        _page_telemetry.flush()
+
+@pytest.fixture(scope="session")
+def strategy_cache():
+    # Winning locator strategies of real pages; unit tests with fake drivers never read or write it
+    return StrategyCache.from_env()
+
+@pytest.fixture
+def driver(driver_pool, failure_artifacts, event_log, wait_budgets, page_telemetry, strategy_cache, request):
+    # Warm session from the per-worker pool; state is reset when it is handed back
+    driver = driver_pool.acquire()
+    if _command_profiler is not None:
+        _command_profiler.attach(driver)
+        _command_profiler.begin(request.node.nodeid)
+    install_activity_hook(driver)
+    if failure_artifacts is not None:
+        failure_artifacts.install_console_hook(driver)
+        failure_artifacts.begin(request.node.nodeid)
+    if event_log is not None:
+        event_log.begin(request.node.nodeid)
+    if page_telemetry is not None:
+        page_telemetry.begin(request.node.nodeid)
+    # Session collectors are live only while a browser test runs, so unit tests with fake drivers never feed them
+    activate(failure_artifacts)
+    activate_event_log(event_log)
+    activate_wait_budgets(wait_budgets)
+    activate_page_telemetry(page_telemetry)
+    activate_strategy_cache(strategy_cache)
+    yield driver
+    activate(None)
+    activate_event_log(None)
+    activate_wait_budgets(None)
+    activate_page_telemetry(None)
+    activate_strategy_cache(None)
+    if failure_artifacts is not None:
+        failure_artifacts.end()
+    if _command_profiler is not None:
+        _command_profiler.end()
+    _profile_meter.collect(driver)
+    driver_pool.release(driver)
+
+@pytest.fixture
+def steps(driver, request):
+    # Named test steps checkpointed after each one; failing steps retry, reruns resume from the last good step
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = CheckpointStore.from_env(ConfigProvider())
+    return _checkpoint_store.runner(driver, request.node.nodeid)
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    result = yield
+    marker = item.get_closest_marker("command_budget")
+    if marker is not None and _command_profiler is not None:
+        budget = marker.args[0]
+        sent = _command_profiler.command_count
+        if sent > budget:
+            pytest.fail(f"WebDriver command budget exceeded: {sent} commands sent, budget is {budget}")
+    runner = item.funcargs.get("steps")
+    if runner is not None and runner.skipped_every_step:
+        # Checkpoints are cleared in makereport, so the next run executes every step
+        pytest.fail(f"Resumed run skipped all {len(runner.checkpoints)} steps without reaching the one that failed; rerun in full")
+    return result
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    if _event_log is not None and (report.when == "call" or (report.when == "setup" and report.failed)):
+        _event_log.end(report.outcome)
+    if report.when == "call" and "steps" in item.funcargs:
+        item.funcargs["steps"].finish(report.outcome)
+    # Failures already captured by ElementFinder or selenium_actions are not captured twice
+    if report.failed and report.when == "call" and _failure_artifacts is not None:
+        driver = item.funcargs.get("driver")
+        if driver is not None and not _failure_artifacts.captured_for(item.nodeid):
+            _failure_artifacts.capture(driver, report.longreprtext[-2000:])
+    return report
+
+def pytest_runtest_logreport(report):
+    # Setup + call + teardown time per test, fed to the duration history used by the parallel runner
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+
+def pytest_sessionfinish(session):
+    if _test_durations and os.environ.get("SELENIUM_DURATION_HISTORY_RECORD", "true").lower() not in ("0", "false"):
+        config = ConfigProvider()
+        DurationHistory.from_env(config).record(config.env, _test_durations)
+
+def pytest_terminal_summary(terminalreporter):
+    if _driver_pool is not None:
+        terminalreporter.write_sep("-", "webdriver pool")
+        terminalreporter.write_line(_driver_pool.summary())
+        terminalreporter.write_line(_launcher.summary())
+        terminalreporter.write_line(_profile_meter.summary())
+    if _event_log is not None and _event_log.stats["tests"]:
+        terminalreporter.write_sep("-", "event log")
+        terminalreporter.write_line(_event_log.summary())
+    if _wait_budgets is not None and _wait_budgets.stats["observed"]:
+        terminalreporter.write_sep("-", "wait budgets")
+        terminalreporter.write_line(_wait_budgets.summary())
+        drifting = _wait_budgets.drift()
+        if drifting:
+            terminalreporter.write_line(f"{len(drifting)} elements are getting slower; details: python -m utils.wait_budget")
+    if _page_telemetry is not None and _page_telemetry.recorded:
+        terminalreporter.write_sep("-", "page telemetry")
+        terminalreporter.write_line(_page_telemetry.summary())
+    if _checkpoint_store is not None and _checkpoint_store.stats["steps"]:
+        terminalreporter.write_sep("-", "checkpoints")
+        terminalreporter.write_line(_checkpoint_store.summary())
+    if _failure_artifacts is not None and _failure_artifacts.stats["captured"]:
+        _failure_artifacts.flush()
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(_failure_artifacts.summary())
+    if _archive_proxy is not None:
+        terminalreporter.write_sep("-", "http archive")
+        terminalreporter.write_line(_archive_proxy.summary())
+        if _archive_proxy.missing:
+            path = os.path.join(ConfigProvider().artifacts_dir, "http_archive_missing.txt")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as handle:
+                handle.write("\n".join(_archive_proxy.missing) + "\n")
+            terminalreporter.write_line(f"{len(_archive_proxy.missing)} requests missing from the archive, listed in {path}")
+    if _command_profiler is not None and _command_profiler.summaries:
+        terminalreporter.write_sep("-", "webdriver commands")
+        for line in _command_profiler.report_lines():
+            terminalreporter.write_line(line)
+        worker = _worker_id()
+        path = os.path.join(ConfigProvider().artifacts_dir, f"command_profile{'_' + worker if worker else ''}.json")
+        _command_profiler.write_json(path)
+        terminalreporter.write_line(f"Command profile written to {path}")
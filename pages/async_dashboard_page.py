@@ -0,0 +1,70 @@
+# Filename: pages/async_dashboard_page.py
+# Description: Asyncio Page Object Model for Dashboard, sharing locators with DashboardPage.
+
+import asyncio
+from pages.dashboard_page import DashboardPage
+from utils.async_element_finder import AsyncElementFinder
+from utils.link_checker import LinkChecker
+
+
+class AsyncDashboardPage:
+    WELCOME_BANNER = DashboardPage.WELCOME_BANNER
+    INSTALL_HP_SMART_APP_BUTTON = DashboardPage.INSTALL_HP_SMART_APP_BUTTON
+    DOWNLOAD_NOW_LINK = DashboardPage.DOWNLOAD_NOW_LINK
+    LEARN_MORE_LINK = DashboardPage.LEARN_MORE_LINK
+    SUSTAINABILITY_PAGE = DashboardPage.SUSTAINABILITY_PAGE
+    SMOKE_ELEMENTS = DashboardPage.SMOKE_ELEMENTS
+    LINKS = DashboardPage.LINKS
+
+    def __init__(self, page):
+        self.page = page
+        self.element_finder = AsyncElementFinder(page)
+
+    async def get_welcome_banner(self):
+        return await self.element_finder.find("Welcome Banner", "Dashboard", self.WELCOME_BANNER)
+
+    async def get_install_hp_smart_app_button(self):
+        return await self.element_finder.find_clickable("Install HP Smart App Button", "Dashboard", self.INSTALL_HP_SMART_APP_BUTTON)
+
+    async def get_download_now_link(self):
+        return await self.element_finder.find_clickable("Download Now Link", "Dashboard", self.DOWNLOAD_NOW_LINK)
+
+    async def get_learn_more_link(self):
+        return await self.element_finder.find_clickable("Learn More Link", "Dashboard", self.LEARN_MORE_LINK)
+
+    async def get_sustainability_page(self):
+        return await self.element_finder.find("Sustainability Page", "Dashboard", self.SUSTAINABILITY_PAGE)
+
+    async def assert_dashboard_visible(self):
+        return await self.element_finder.assert_all_visible("Dashboard", self.SMOKE_ELEMENTS)
+
+    async def get_link_targets(self, names=None):
+        names = names or list(self.LINKS)
+        return await self.element_finder.read_links("Dashboard", {name: self.LINKS[name] for name in names})
+
+    async def verify_link_redirects(self, expected):
+        """
+        Same contract as DashboardPage.verify_link_redirects; redirect chains are followed off the event loop
+        with this context's cookies.
+        """
+        links = await self.get_link_targets(list(expected))
+        checker = LinkChecker(cookies=await self.page.cookies())
+        hrefs = [link["href"] for link in links.values() if link["href"]]
+        try:
+            chains = await asyncio.get_running_loop().run_in_executor(None, checker.resolve_all, hrefs)
+        finally:
+            checker.close()
+        failures = [f"'{name}' has no href" for name, link in links.items() if not link["href"]]
+        results = {}
+        for name, link in links.items():
+            if not link["href"]:
+                continue
+            chain = chains[link["href"]]
+            results[name] = chain
+            if chain.error or not any(part.lower() in chain.final_url.lower() for part in expected[name]):
+                failures.append(
+                    f"'{name}' ({link['href']}) ended at {chain.final_url} [status {chain.status}], "
+                    f"expected one of {expected[name]}. Error: {chain.error}"
+                )
+        assert not failures, "Link verification failed on 'Dashboard':\n" + "\n".join(failures)
+        return results
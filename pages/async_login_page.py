@@ -0,0 +1,97 @@
+# Filename: pages/async_login_page.py
+# Description: Asyncio Page Object Model for the portal login form, for flows running in isolated browser contexts.
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from pages.login_page import LoginPage
+from utils.async_element_finder import AsyncElementFinder
+from utils.config_provider import ConfigProvider
+from utils.session_state import LoginStateCache, capture_async_session_state, restore_async_session_state
+
+logger = logging.getLogger(__name__)
+
+# One in-process lock per state file: flows share a process, so the file lock alone cannot serialize them
+_sign_in_locks = {}
+
+
+@asynccontextmanager
+async def _exclusive(cache):
+    async with _sign_in_locks.setdefault(cache.path, asyncio.Lock()):
+        file_lock = cache.lock()
+        # flock blocks, so it is taken off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, file_lock.__enter__)
+        try:
+            yield
+        finally:
+            file_lock.__exit__(None, None, None)
+
+
+class AsyncLoginPage:
+    USERNAME = {"semantic": LoginPage.USERNAME}
+    PASSWORD = {"semantic": LoginPage.PASSWORD}
+    SUBMIT = {"semantic": LoginPage.SUBMIT}
+
+    def __init__(self, page, timeout=10):
+        self.page = page
+        self.timeout = timeout
+        self.element_finder = AsyncElementFinder(page, timeout)
+
+    async def login(self, username, password):
+        await (await self.element_finder.find("Username", "Login", self.USERNAME)).type(username)
+        await (await self.element_finder.find("Password", "Login", self.PASSWORD)).type(password)
+        await (await self.element_finder.find_clickable("Login Button", "Login", self.SUBMIT)).click()
+        # The form disappears once the identity provider redirects back to the portal
+        deadline = time.monotonic() + self.timeout
+        while await self.is_displayed():
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Login form still displayed after {self.timeout}s")
+            await asyncio.sleep(0.5)
+
+    async def is_displayed(self):
+        return await self.page.evaluate(f"document.getElementsByName({LoginPage.USERNAME[1]!r}).length > 0")
+
+    async def _state_accepted(self):
+        """
+        LoginPage._state_accepted for this page: True once the dashboard shows, False on the login form or timeout.
+        """
+        landing = [selector for by, selector in LoginPage.LANDING.values() if by == By.CSS_SELECTOR]
+        landed = f"{json.dumps(landing)}.some(function (selector) {{ return document.querySelector(selector); }})"
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if await self.is_displayed():
+                return False
+            if await self.page.evaluate(landed):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.5)
+
+    async def sign_in(self, config=None, cache=None):
+        """
+        Same contract as LoginPage.sign_in, inside this page's browser context.
+        """
+        config = config or ConfigProvider()
+        cache = cache or LoginStateCache.for_env(config)
+        state = cache.load()
+        if state is not None:
+            await restore_async_session_state(self.page, state, config.base_url)
+            if await self._state_accepted():
+                logger.info(f"[Login] Restored cached login state for {config.env}.")
+                return
+            logger.info(f"[Login] Cached login state for {config.env} was rejected; logging in again.")
+        async with _exclusive(cache):
+            fresh = cache.load()
+            if fresh is not None and (state is None or fresh["captured_at"] != state["captured_at"]):
+                await restore_async_session_state(self.page, fresh, config.base_url)
+                if await self._state_accepted():
+                    return
+            cache.invalidate()
+            await self.page.goto(config.base_url)
+            await self.login(config.username, config.password)
+            cache.save(await capture_async_session_state(self.page))
+            logger.info(f"[Login] Captured login state for {config.env}.")
@@ -1,56 +1,121 @@
 # Filename: pages/dashboard_page.py
 # Description: Page Object Model for Dashboard, using centralized locator utility and improved error handling
 
-from selenium.webdriver.common.by import By
+from pages.locator_catalog import CATALOG
 from utils.element_finder import ElementFinder
+from utils.element_proxy import LazyElement
+from utils.locator_race import PRESENT, CLICKABLE
+from utils.link_checker import LinkChecker
+from utils.page_telemetry import collect_page_telemetry
 from utils.selenium_actions import click_element, assert_element_visible
 
+DASHBOARD_LOCATORS = CATALOG["Dashboard"]
+
 class DashboardPage:
+    # Immutable entries compiled once from pages/locators.json
+    WELCOME_BANNER = DASHBOARD_LOCATORS["Welcome Banner"]
+    INSTALL_HP_SMART_APP_BUTTON = DASHBOARD_LOCATORS["Install HP Smart App Button"]
+    DOWNLOAD_NOW_LINK = DASHBOARD_LOCATORS["Download Now Link"]
+    LEARN_MORE_LINK = DASHBOARD_LOCATORS["Learn More Link"]
+    SUSTAINABILITY_PAGE = DASHBOARD_LOCATORS["Sustainability Page"]
+    SUSTAINABILITY_CARD = DASHBOARD_LOCATORS["Sustainability Card"]
+    # Elements every dashboard smoke check expects to see
+    SMOKE_ELEMENTS = {
+        "Welcome Banner": WELCOME_BANNER,
+        "Install HP Smart App Button": INSTALL_HP_SMART_APP_BUTTON,
+        "Download Now Link": DOWNLOAD_NOW_LINK,
+        "Sustainability Card": SUSTAINABILITY_CARD,
+    }
+    # Outbound links whose targets can be verified without leaving the dashboard
+    LINKS = {
+        "Install HP Smart App Button": INSTALL_HP_SMART_APP_BUTTON,
+        "Download Now Link": DOWNLOAD_NOW_LINK,
+        "Learn More Link": LEARN_MORE_LINK,
+    }
+
     def __init__(self, driver):
         self.driver = driver
         self.element_finder = ElementFinder(driver)
+        self._elements = {}
+        self._measured = False
+
+    def _measure(self, element=None):
+        # Load performance of the dashboard, taken on first use rather than right after sign-in so the
+        # sample is not frozen before load, LCP and CLS have settled; retried until the document is complete
+        if not self._measured:
+            self._measured = collect_page_telemetry(self.driver, "Dashboard") is not None
+
+    def _lazy(self, element_name, locator_dict, condition=PRESENT, on_resolve=None):
+        """
+        Returns the page's handle for element_name: looked up on first use, reused by later getter calls
+        and re-resolved once if a re-render made it stale.
+        """
+        if element_name not in self._elements:
+            self._elements[element_name] = LazyElement(
+                self.element_finder, element_name, "Dashboard", locator_dict, condition, on_resolve or self._measure)
+        return self._elements[element_name]
 
     def get_welcome_banner(self):
-        locators = {
-            'accessibility': (By.XPATH, "//*[@aria-label='Welcome Banner']"),
-            'data-testid': (By.CSS_SELECTOR, "[data-testid='welcome-banner']"),
-            'semantic': (By.CSS_SELECTOR, "section.welcome-banner"),
-            'text': (By.XPATH, "//*[text()='Welcome Banner']")
-        }
-        return self.element_finder.find("Welcome Banner", "Dashboard", locators)
+        return self._lazy("Welcome Banner", self.WELCOME_BANNER)
 
     def get_install_hp_smart_app_button(self):
-        locators = {
-            'accessibility': (By.XPATH, "//*[@aria-label='Install HP Smart App']"),
-            'data-testid': (By.CSS_SELECTOR, "[data-testid='install-hp-smart-app']"),
-            'semantic': (By.CSS_SELECTOR, "button.install-hp-smart-app"),
-            'text': (By.XPATH, "//button[text()='Install HP Smart App']")
-        }
-        return self.element_finder.find_clickable("Install HP Smart App Button", "Dashboard", locators)
+        return self._lazy("Install HP Smart App Button", self.INSTALL_HP_SMART_APP_BUTTON, CLICKABLE)
 
     def get_download_now_link(self):
-        locators = {
-            'accessibility': (By.XPATH, "//*[@aria-label='Download now']"),
-            'data-testid': (By.CSS_SELECTOR, "[data-testid='download-now']"),
-            'semantic': (By.CSS_SELECTOR, "a.download-now"),
-            'text': (By.XPATH, "//a[text()='Download now']")
-        }
-        return self.element_finder.find_clickable("Download Now Link", "Dashboard", locators)
+        return self._lazy("Download Now Link", self.DOWNLOAD_NOW_LINK, CLICKABLE)
 
     def get_learn_more_link(self):
-        locators = {
-            'accessibility': (By.XPATH, "//*[@aria-label='Learn more']"),
-            'data-testid': (By.CSS_SELECTOR, "[data-testid='learn-more']"),
-            'semantic': (By.CSS_SELECTOR, "a.learn-more"),
-            'text': (By.XPATH, "//a[text()='Learn more']")
-        }
-        return self.element_finder.find_clickable("Learn More Link", "Dashboard", locators)
+        return self._lazy("Learn More Link", self.LEARN_MORE_LINK, CLICKABLE)
 
     def get_sustainability_page(self):
-        locators = {
-            'accessibility': (By.XPATH, "//*[@aria-label='Sustainability page']"),
-            'data-testid': (By.CSS_SELECTOR, "[data-testid='sustainability-page']"),
-            'semantic': (By.CSS_SELECTOR, "section.sustainability-page"),
-            'text': (By.XPATH, "//*[text()='Sustainability']")
-        }
-        return self.element_finder.find("Sustainability Page", "Dashboard", locators)
\ No newline at end of file
+        # Measured once the page has rendered far enough for the section to resolve
+        return self._lazy("Sustainability Page", self.SUSTAINABILITY_PAGE,
+                          on_resolve=lambda element: collect_page_telemetry(self.driver, "Sustainability"))
+
+    def assert_dashboard_visible(self):
+        """
+        Asserts the smoke elements are visible with one script call per poll.
+        Returns {element_name: {'strategy', 'element', 'visible'}}.
+        """
+        results = self.element_finder.assert_all_visible("Dashboard", self.SMOKE_ELEMENTS)
+        self._measure()
+        return results
+
+    def get_link_targets(self, names=None):
+        """
+        Reads href and target of the outbound links in one script call.
+        Returns {link_name: {'strategy', 'href', 'target'}}.
+        """
+        names = names or list(self.LINKS)
+        links = self.element_finder.read_links("Dashboard", {name: self.LINKS[name] for name in names})
+        self._measure()
+        return links
+
+    def verify_link_redirects(self, expected, link_checker=None):
+        """
+        Follows each link's redirect chain over HTTP while the dashboard stays loaded.
+        Args:
+            expected (dict): Link name to a list of substrings; the final URL must contain at least one (case-insensitive).
+            link_checker (LinkChecker): Optional client; defaults to one carrying the session cookies.
+        Returns:
+            {link_name: RedirectChain}. Raises AssertionError listing every link that did not land as expected.
+        """
+        links = self.get_link_targets(list(expected))
+        checker = link_checker or LinkChecker(cookies=self.driver.get_cookies())
+        failures = [f"'{name}' has no href" for name, link in links.items() if not link["href"]]
+        chains = checker.resolve_all([link["href"] for link in links.values() if link["href"]])
+        results = {}
+        for name, link in links.items():
+            if not link["href"]:
+                continue
+            chain = chains[link["href"]]
+            results[name] = chain
+            if chain.error or not any(part.lower() in chain.final_url.lower() for part in expected[name]):
+                failures.append(
+                    f"'{name}' ({link['href']}) ended at {chain.final_url} [status {chain.status}], "
+                    f"expected one of {expected[name]}. Error: {chain.error}"
+                )
+        if link_checker is None:
+            checker.close()
+        assert not failures, "Link verification failed on 'Dashboard':\n" + "\n".join(failures)
+        return results
@@ -0,0 +1,179 @@
+# Filename: pages/locator_catalog.py
+# Description: Declarative locator catalog (pages/locators.json) parsed, validated and compiled once per process into immutable entries for the page objects.
+
+import json
+import os
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from selenium.webdriver.common.by import By
+
+try:
+    import cssselect
+    from lxml import etree
+except ImportError:  # pragma: no cover - without the parsers only structural checks are made
+    etree = None
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locators.json")
+
+STRATEGIES = ("accessibility", "data-testid", "semantic", "text")
+
+KINDS = {
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "id": By.ID,
+    "name": By.NAME,
+    "link_text": By.LINK_TEXT,
+}
+
+_XPATH_START = re.compile(r"^(\(|\.|/)")
+
+
+class LocatorCatalogError(ValueError):
+    """Raised at import time when the locator catalog is malformed."""
+
+
+def _check_balanced(selector, pairs):
+    """
+    Returns an error message if brackets or quotes are unbalanced, else None.
+    """
+    stack = []
+    quote = None
+    closers = {close: open_ for open_, close in pairs}
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char in dict(pairs):
+            stack.append(char)
+        elif char in closers:
+            if not stack or stack.pop() != closers[char]:
+                return f"unbalanced '{char}'"
+    if quote:
+        return f"unterminated {quote} string"
+    if stack:
+        return f"unclosed '{stack[-1]}'"
+    return None
+
+
+def check_xpath(expr):
+    if not _XPATH_START.match(expr):
+        return "XPath must start with '/', '.' or '('"
+    if etree is not None:
+        try:
+            etree.XPath(expr)
+        except etree.XPathSyntaxError as e:
+            return str(e).lower()
+        return None
+    error = _check_balanced(expr, (("[", "]"), ("(", ")")))
+    if error:
+        return error
+    if "[]" in expr.replace(" ", ""):
+        return "empty predicate"
+    if expr.rstrip().endswith(("/", "[", "@", "=", "|")):
+        return "incomplete expression"
+    return None
+
+
+def check_css(selector):
+    if etree is not None:
+        try:
+            cssselect.parse(selector)
+        except cssselect.SelectorError as e:
+            return str(e)
+        return None
+    error = _check_balanced(selector, (("[", "]"), ("(", ")")))
+    if error:
+        return error
+    if selector.rstrip().endswith((",", ">", "+", "~")) or selector.lstrip().startswith(","):
+        return "dangling combinator"
+    return None
+
+
+class LocatorEntry(Mapping):
+    """
+    Immutable, ordered mapping of strategy name to (By, selector) for one element.
+    probe: (union CSS selector, strategy names it covers) for the leading run of CSS strategies, or None.
+    A probe keeps priority semantics because it only gates waiting; the matching strategy is still
+    chosen in declared order.
+    """
+
+    def __init__(self, page_name, element_name, locators):
+        self.page_name = page_name
+        self.element_name = element_name
+        self._locators = MappingProxyType(dict(locators))
+        leading = []
+        for strategy, locator in self._locators.items():
+            if not locator:
+                continue
+            if locator[0] != By.CSS_SELECTOR:
+                break
+            leading.append((strategy, locator[1]))
+        self.probe = None
+        if len(leading) > 1:
+            self.probe = (", ".join(selector for _, selector in leading), frozenset(s for s, _ in leading))
+
+    def __getitem__(self, strategy):
+        return self._locators[strategy]
+
+    def __iter__(self):
+        return iter(self._locators)
+
+    def __len__(self):
+        return len(self._locators)
+
+    def __repr__(self):
+        return f"LocatorEntry({self.page_name!r}, {self.element_name!r}, {dict(self._locators)!r})"
+
+
+def compile_catalog(data):
+    """
+    Validates raw catalog data and returns {page_name: {element_name: LocatorEntry}} as read-only mappings.
+    Every problem found is reported in a single LocatorCatalogError.
+    """
+    errors = []
+    pages = {}
+    for page_name, elements in data.items():
+        entries = {}
+        for element_name, strategies in elements.items():
+            where = f"{page_name} / {element_name}"
+            unknown = [s for s in strategies if s not in STRATEGIES]
+            if unknown:
+                errors.append(f"{where}: unknown strategies {unknown}; expected {list(STRATEGIES)}")
+                continue
+            locators = {}
+            for strategy in STRATEGIES:
+                spec = strategies.get(strategy)
+                if spec is None:
+                    continue
+                if not isinstance(spec, list) or len(spec) != 2 or spec[0] not in KINDS or not spec[1]:
+                    errors.append(f"{where} [{strategy}]: expected [kind, selector] with kind in {list(KINDS)}, got {spec!r}")
+                    continue
+                kind, selector = spec
+                error = check_xpath(selector) if kind == "xpath" else check_css(selector) if kind == "css" else None
+                if error:
+                    errors.append(f"{where} [{strategy}]: invalid {kind} {selector!r}: {error}")
+                    continue
+                locators[strategy] = (KINDS[kind], selector)
+            if not locators:
+                errors.append(f"{where}: no usable strategies")
+                continue
+            entries[element_name] = LocatorEntry(page_name, element_name, locators)
+        pages[page_name] = MappingProxyType(entries)
+    if errors:
+        raise LocatorCatalogError("Invalid locator catalog:\n  " + "\n  ".join(errors))
+    return MappingProxyType(pages)
+
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path) as handle:
+        try:
+            data = json.load(handle)
+        except ValueError as e:
+            raise LocatorCatalogError(f"Locator catalog {path} is not valid JSON: {e}") from None
+    return compile_catalog(data)
+
+
+CATALOG = load_catalog()
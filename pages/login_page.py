@@ -0,0 +1,83 @@
+# Filename: pages/login_page.py
+# Description: Page Object Model for the portal login form.
+
+import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from pages.locator_catalog import CATALOG
+from utils.config_provider import ConfigProvider
+from utils.selenium_actions import click_element
+from utils.session_state import LoginStateCache, capture_session_state, restore_session_state
+
+logger = logging.getLogger(__name__)
+
+class LoginPage:
+    USERNAME = (By.NAME, "username")
+    PASSWORD = (By.NAME, "password")
+    SUBMIT = (By.XPATH, "//button[@type='submit']")
+    # Rendered only for an authenticated session; tells a replayed login state apart from a pending IdP redirect
+    LANDING = CATALOG["Dashboard"]["Welcome Banner"]
+
+    def __init__(self, driver, timeout=10):
+        self.driver = driver
+        self.timeout = timeout
+
+    def login(self, username, password):
+        wait = WebDriverWait(self.driver, self.timeout)
+        email_field = wait.until(EC.presence_of_element_located(self.USERNAME))
+        email_field.clear()
+        email_field.send_keys(username)
+        password_field = wait.until(EC.presence_of_element_located(self.PASSWORD))
+        password_field.clear()
+        password_field.send_keys(password)
+        login_button = wait.until(EC.element_to_be_clickable(self.SUBMIT))
+        click_element(login_button, "Login Button", "Login", self.driver)
+        # The form disappears once the identity provider redirects back to the portal
+        wait.until(lambda d: not self.is_displayed())
+
+    def is_displayed(self):
+        return len(self.driver.find_elements(*self.USERNAME)) > 0
+
+    def _state_accepted(self):
+        """
+        Waits for the dashboard or the login form after a replayed state, since the identity provider may
+        redirect to the form by script after the load event. Returns True when the dashboard showed up.
+        """
+        landmarks = [EC.presence_of_element_located(locator) for locator in self.LANDING.values()]
+        try:
+            WebDriverWait(self.driver, self.timeout).until(
+                EC.any_of(EC.presence_of_element_located(self.USERNAME), *landmarks))
+        except TimeoutException:
+            logger.info(f"[Login] Neither the dashboard nor the login form appeared within {self.timeout}s.")
+            return False
+        return not self.is_displayed()
+
+    def sign_in(self, config=None, cache=None):
+        """
+        Opens the portal authenticated as the configured user.
+        Replays the cached login state for the current TEST_ENV when it is valid; otherwise logs in
+        through the form once and caches the resulting state for other sessions.
+        """
+        config = config or ConfigProvider()
+        cache = cache or LoginStateCache.for_env(config)
+        state = cache.load()
+        if state is not None:
+            restore_session_state(self.driver, state, config.base_url)
+            if self._state_accepted():
+                logger.info(f"[Login] Restored cached login state for {config.env}.")
+                return
+            logger.info(f"[Login] Cached login state for {config.env} was rejected; logging in again.")
+        with cache.lock():
+            # Another worker may have refreshed the state while we waited for the lock
+            fresh = cache.load()
+            if fresh is not None and (state is None or fresh["captured_at"] != state["captured_at"]):
+                restore_session_state(self.driver, fresh, config.base_url)
+                if self._state_accepted():
+                    return
+            cache.invalidate()
+            self.driver.get(config.base_url)
+            self.login(config.username, config.password)
+            cache.save(capture_session_state(self.driver))
+            logger.info(f"[Login] Captured login state for {config.env}.")
@@ -1,9 +1,12 @@
 # Filename: pages/dashboard_page.py
 # Description: Dashboard Page Object using centralized ElementFinder utility for robust locator strategy.
 
-from selenium.webdriver.common.by import By
+from pages.locator_catalog import CATALOG
 from utils.element_finder import ElementFinder
 
+# Shared with pages/dashboard_page.py so the two page objects cannot drift apart
+DASHBOARD_LOCATORS = CATALOG["Dashboard"]
+
 class DashboardPage:
     def __init__(self, driver):
         self.driver = driver
@@ -13,48 +16,28 @@ class DashboardPage:
         self.ef.assert_visible(
             "Welcome Banner",
             "Dashboard",
-            {
-                "accessibility": (By.CSS_SELECTOR, "[aria-label='Welcome Banner']"),
-                "data-testid": (By.CSS_SELECTOR, "[data-testid='welcome-banner']"),
-                "semantic": (By.CSS_SELECTOR, "div.welcome-banner"),
-                "text": None  # Avoid XPaths unless absolutely necessary
-            }
+            DASHBOARD_LOCATORS["Welcome Banner"]
         )
 
     def click_install_hp_smart_app(self):
         self.ef.click(
             "Install HP Smart App Button",
             "Dashboard",
-            {
-                "accessibility": (By.CSS_SELECTOR, "[aria-label='Install HP Smart App']"),
-                "data-testid": (By.CSS_SELECTOR, "[data-testid='install-hp-smart-app']"),
-                "semantic": (By.CSS_SELECTOR, "button.install-hp-smart-app"),
-                "text": (By.XPATH, "//button[normalize-space()='Install HP Smart App']")
-            }
+            DASHBOARD_LOCATORS["Install HP Smart App Button"]
         )
 
     def click_download_now_link(self):
         self.ef.click(
             "Download Now Link",
             "Dashboard",
-            {
-                "accessibility": (By.CSS_SELECTOR, "[aria-label='Download now']"),
-                "data-testid": (By.CSS_SELECTOR, "[data-testid='download-now']"),
-                "semantic": (By.CSS_SELECTOR, "a.download-now"),
-                "text": (By.XPATH, "//a[normalize-space()='Download now']")
-            }
+            DASHBOARD_LOCATORS["Download Now Link"]
         )
 
     def click_learn_more_link(self):
         self.ef.click(
             "Learn More Link",
             "Dashboard",
-            {
-                "accessibility": (By.CSS_SELECTOR, "[aria-label='Learn more']"),
-                "data-testid": (By.CSS_SELECTOR, "[data-testid='learn-more']"),
-                "semantic": (By.CSS_SELECTOR, "a.learn-more"),
-                "text": (By.XPATH, "//a[normalize-space()='Learn more']")
-            }
+            DASHBOARD_LOCATORS["Learn More Link"]
         )
 
     # Add similar methods for other critical elements as needed
@@ -0,0 +1,187 @@
+# Filename: tests/test_async_browser.py
+# Description: Verifies the asyncio CDP connection, AsyncElementFinder and concurrent flow runner without a browser.
+
+import asyncio
+import json
+import queue
+import pytest
+import websocket
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from utils.async_browser import AsyncPage, CDPConnection, CDPError
+from utils.async_element_finder import AsyncElementFinder
+from utils.async_runner import run_flows
+
+BANNER = {
+    "accessibility": (By.CSS_SELECTOR, "[aria-label='Welcome']"),
+    "text": (By.XPATH, "//h1[contains(., 'Welcome')]"),
+}
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.inbox = queue.Queue()
+
+    def send(self, data):
+        self.sent.append(json.loads(data))
+
+    def recv(self):
+        message = self.inbox.get()
+        if message is None:
+            raise websocket.WebSocketConnectionClosedException("closed")
+        return json.dumps(message)
+
+    def close(self):
+        self.inbox.put(None)
+
+
+async def sent(ws, count):
+    # Frames are written from an executor thread
+    while len(ws.sent) < count:
+        await asyncio.sleep(0.001)
+
+
+def test_connection_routes_responses_and_events():
+    async def scenario():
+        ws = FakeWebSocket()
+        connection = CDPConnection(ws, asyncio.get_running_loop())
+        loaded = connection.expect_event("Page.loadEventFired", "S1")
+        pending = asyncio.ensure_future(connection.send("Page.navigate", {"url": "about:blank"}, "S1"))
+        await sent(ws, 1)
+        ws.inbox.put({"method": "Page.loadEventFired", "sessionId": "S2", "params": {"timestamp": 1}})
+        ws.inbox.put({"method": "Page.loadEventFired", "sessionId": "S1", "params": {"timestamp": 2}})
+        ws.inbox.put({"id": ws.sent[0]["id"], "result": {"frameId": "F"}})
+        assert await pending == {"frameId": "F"}
+        assert (await loaded)["timestamp"] == 2
+
+        failing = asyncio.ensure_future(connection.send("Bogus.call"))
+        await sent(ws, 2)
+        ws.inbox.put({"id": ws.sent[1]["id"], "error": {"code": -32601, "message": "'Bogus.call' wasn't found"}})
+        with pytest.raises(CDPError, match="wasn't found"):
+            await failing
+        assert ws.sent[0]["sessionId"] == "S1" and "sessionId" not in ws.sent[1]
+        await connection.close()
+
+    asyncio.run(scenario())
+
+
+class FakeAsyncBrowser:
+    profile = None
+
+    def __init__(self, connection):
+        self.connection = connection
+
+
+def test_missing_load_event_fails_the_navigation_and_drops_its_waiter():
+    async def scenario():
+        ws = FakeWebSocket()
+        connection = CDPConnection(ws, asyncio.get_running_loop())
+        page = AsyncPage(FakeAsyncBrowser(connection), "C1", "T1", "S1")
+        navigation = asyncio.ensure_future(page.goto("https://portal.test/", timeout=0.2))
+        await sent(ws, 1)
+        assert ws.sent[0]["method"] == "Runtime.releaseObjectGroup"
+        ws.inbox.put({"id": ws.sent[0]["id"], "result": {}})
+        await sent(ws, 2)
+        ws.inbox.put({"id": ws.sent[1]["id"], "result": {"frameId": "F", "loaderId": "L"}})
+        # A CDPError is a WebDriverException, so run_flows records it as one failed flow
+        with pytest.raises(CDPError, match="Page.loadEventFired not received"):
+            await navigation
+        assert connection._waiters == []
+        await connection.close()
+
+    asyncio.run(scenario())
+
+
+class FakePage:
+    """Answers the finder's DESCRIBE/HANDLES scripts from a queue of per-poll descriptions."""
+
+    def __init__(self, polls):
+        self.polls = polls
+        self.evaluations = 0
+        self.released = []
+
+    async def evaluate(self, expression, by_value=True):
+        self.evaluations += 1
+        if by_value:
+            return self.polls.pop(0) if len(self.polls) > 1 else self.polls[0]
+        return {"objectId": "handles"}
+
+    async def properties(self, object_id):
+        return {"0": {"subtype": "node", "objectId": "node-1"}}
+
+    async def release(self, object_id):
+        self.released.append(object_id)
+
+    async def current_url(self):
+        return "https://portal.test/dashboard"
+
+
+def test_finder_polls_until_found_and_names_strategy():
+    found = {"index": 1, "visible": True, "href": None, "target": None}
+    page = FakePage([[None], [None], [found]])
+
+    element = asyncio.run(AsyncElementFinder(page, timeout=5, poll_frequency=0.01).find("Welcome Banner", "Dashboard", BANNER))
+
+    assert (element.strategy, element.object_id) == ("text", "node-1")
+    assert page.evaluations == 4
+    assert page.released == ["handles"]
+
+
+def test_finder_timeout_reports_strategies():
+    finder = AsyncElementFinder(FakePage([[None]]), timeout=0.05, poll_frequency=0.01)
+
+    with pytest.raises(NoSuchElementException, match=r"'Welcome Banner' not found .* \['accessibility', 'text'\]"):
+        asyncio.run(finder.find("Welcome Banner", "Dashboard", BANNER))
+
+
+class FakeContextPage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def close(self):
+        self.browser.open -= 1
+
+
+class FakeBrowser:
+    def __init__(self, refuse=0):
+        self.open = 0
+        self.peak = 0
+        self.refuse = refuse
+
+    async def new_page(self):
+        if self.refuse:
+            self.refuse -= 1
+            raise CDPError("Target.createBrowserContext: browser is shutting down")
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        return FakeContextPage(self)
+
+
+def test_flows_run_concurrently_in_separate_contexts():
+    browser = FakeBrowser()
+
+    async def idle_flow(page):
+        await asyncio.sleep(0.05)
+
+    async def failing_flow(page):
+        raise AssertionError("banner missing")
+
+    flows = [(f"flow-{i}", idle_flow) for i in range(6)] + [("broken", failing_flow)]
+    results = asyncio.run(run_flows(browser, flows, concurrency=3))
+
+    assert browser.peak == 3 and browser.open == 0
+    assert [r.passed for r in results] == [True] * 6 + [False]
+    assert results[-1].error == "banner missing"
+
+
+def test_context_that_fails_to_open_fails_only_its_flow():
+    browser = FakeBrowser(refuse=1)
+
+    async def idle_flow(page):
+        await asyncio.sleep(0.01)
+
+    results = asyncio.run(run_flows(browser, [("refused", idle_flow), ("ok", idle_flow)], concurrency=1))
+
+    assert [r.passed for r in results] == [False, True] and browser.open == 0
+    assert "shutting down" in results[0].error
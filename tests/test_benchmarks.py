@@ -0,0 +1,41 @@
+# Filename: tests/test_benchmarks.py
+# Description: Verifies the benchmark fixture pages and baseline regression check without a browser.
+
+from urllib.request import urlopen
+import pytest
+from benchmarks.element_finder_bench import TARGET_LOCATORS, FixtureServer, compare, fixture_page, main
+from utils.dom_snapshot import DomSnapshot, OfflineElementFinder
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+def test_fixture_page_matches_first_at_requested_depth(depth):
+    pytest.importorskip("lxml")
+    snapshot = DomSnapshot(fixture_page(depth, 50, 0))
+
+    strategy, _ = OfflineElementFinder(snapshot).resolve(TARGET_LOCATORS)
+
+    assert strategy == list(TARGET_LOCATORS)[depth]
+    assert len(snapshot.select(("css selector", "div.row"))) == 25
+
+
+def test_server_serves_delayed_fixture():
+    with FixtureServer() as server:
+        html = urlopen(server.url(1, 10, 300)).read().decode()
+
+    assert "setTimeout" in html and ", 300);" in html
+    assert 'data-testid=\\"bench-target\\"' in html
+
+
+def test_compare_flags_only_meaningful_regressions():
+    baseline = {"find/a": {"median_ms": 100.0}, "find/b": {"median_ms": 2.0}, "find/c": {"median_ms": 50.0}}
+    results = {"find/a": {"median_ms": 130.0}, "find/b": {"median_ms": 4.0}, "find/c": {"median_ms": 55.0}, "find/new": {"median_ms": 1.0}}
+
+    regressions = compare(results, baseline, threshold=0.2, min_delta_ms=5)
+
+    assert regressions == ["find/a: 100.0 ms -> 130.0 ms (+30%)"]
+
+
+def test_timeout_must_outlast_delayed_insertion():
+    # Rejected before a browser is launched
+    with pytest.raises(SystemExit):
+        main(["--timeout", "0.5", "--delays", "0,750"])
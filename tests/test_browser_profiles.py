@@ -0,0 +1,94 @@
+# Filename: tests/test_browser_profiles.py
+# Description: Verifies browser profile selection per environment, option/CDP application and the saved-traffic meter without a browser.
+
+import json
+import pytest
+from selenium.webdriver.chrome.options import Options
+from utils.browser_profiles import PROFILES, ProfileMeter, apply_network, apply_options, select_profile
+from utils.config_provider import ConfigProvider
+
+
+def event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    def __init__(self, log):
+        self.log = log
+        self.cdp = []
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+
+def test_environment_specific_profile_wins(monkeypatch):
+    monkeypatch.setenv("TEST_ENV", "stage")
+    monkeypatch.setenv("SELENIUM_BROWSER_PROFILE", "standard")
+    monkeypatch.setenv("SELENIUM_BROWSER_PROFILE_STAGE", "lean")
+    monkeypatch.setenv("SELENIUM_BLOCKED_URLS", "*chat-widget*, *survey*")
+
+    profile = select_profile(ConfigProvider())
+    assert profile.name == "lean"
+    assert profile.blocked_urls[-2:] == ("*chat-widget*", "*survey*")
+
+
+def test_unknown_profile_is_rejected(monkeypatch):
+    monkeypatch.setenv("SELENIUM_BROWSER_PROFILE", "turbo")
+    with pytest.raises(ValueError, match="turbo"):
+        select_profile(ConfigProvider())
+
+
+def test_profile_is_applied_to_options_and_session():
+    profile = PROFILES["lean"]
+    options = apply_options(profile, Options())
+    assert options.page_load_strategy == "eager"
+    assert "--disable-background-networking" in options.arguments
+
+    driver = FakeDriver([])
+    apply_network(profile, driver)
+    assert ("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)}) in driver.cdp
+
+
+def test_cache_and_network_log_differ_per_profile():
+    standard = apply_options(PROFILES["standard"], Options())
+    assert "goog:loggingPrefs" not in standard.to_capabilities()
+    assert "goog:loggingPrefs" in apply_options(PROFILES["lean"], Options()).to_capabilities()
+
+    driver = FakeDriver([])
+    apply_network(PROFILES["cold"], driver)
+    assert ("Network.setCacheDisabled", {"cacheDisabled": True}) in driver.cdp
+    assert not PROFILES["lean"].cache_disabled
+
+    meter = ProfileMeter(PROFILES["standard"])
+    meter.collect(FakeDriver([event("Network.requestWillBeSent", requestId="1", request={"url": "https://portal.test/"})]))
+    assert meter.stats["requests"] == 0
+    assert meter.summary().endswith("network meter off")
+
+
+def test_meter_estimates_saved_bytes_from_earlier_runs(tmp_path):
+    sizes_path = str(tmp_path / "sizes.json")
+    unblocked = ProfileMeter(PROFILES["cold"], sizes_path)
+    unblocked.collect(FakeDriver([
+        event("Network.requestWillBeSent", requestId="1", request={"url": "https://cdn.test/hero.png?v=3"}),
+        event("Network.loadingFinished", requestId="1", encodedDataLength=50000),
+    ]))
+    unblocked.save()
+
+    meter = ProfileMeter(PROFILES["lean"], sizes_path)
+    meter.collect(FakeDriver([
+        event("Network.requestWillBeSent", requestId="1", request={"url": "https://cdn.test/hero.png?v=4"}),
+        event("Network.loadingFailed", requestId="1", blockedReason="inspector"),
+        event("Network.requestWillBeSent", requestId="2", request={"url": "https://tags.test/gtm.js"}),
+        event("Network.loadingFailed", requestId="2", blockedReason="inspector"),
+        event("Network.requestWillBeSent", requestId="3", request={"url": "https://portal.test/"}),
+        event("Network.loadingFinished", requestId="3", encodedDataLength=1200),
+    ]))
+
+    assert meter.stats["blocked"] == 2
+    assert meter.stats["blocked_bytes"] == 50000
+    assert meter.stats["bytes"] == 1200
+    assert "1 blocked resources never seen unblocked" in meter.summary()
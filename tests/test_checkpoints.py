@@ -0,0 +1,123 @@
+# Filename: tests/test_checkpoints.py
+# Description: Verifies step checkpoints: in-process retries from the last good step and resuming a failed test on rerun.
+
+import pytest
+from utils.checkpoints import CheckpointStore
+
+
+class FakeDriver:
+    """Keeps a URL and cookies; enough for capture_session_state/restore_session_state without CDP."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.cookies = []
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        return {"origin": "https://portal.test", "local": {}, "session": {}}
+
+
+def navigate(driver, url):
+    driver.get(url)
+
+
+def test_flaky_step_is_retried_from_previous_checkpoint(tmp_path):
+    store = CheckpointStore(str(tmp_path), retries=1)
+    driver = FakeDriver()
+    steps = store.runner(driver, "tests/test_demo.py::test_links")
+    driver.cookies.append({"name": "session", "value": "abc"})
+    steps.run("Sign in", navigate, driver, "https://portal.test/dashboard")
+
+    attempts = []
+
+    def flaky():
+        attempts.append(driver.current_url)
+        driver.get("https://portal.test/elsewhere")
+        if len(attempts) == 1:
+            raise AssertionError("banner not visible yet")
+        return "ok"
+
+    assert steps.run("Welcome banner", flaky) == "ok"
+    assert attempts == ["https://portal.test/dashboard", "https://portal.test/dashboard"]
+    assert store.stats["retried"] == 1 and store.stats["saved_seconds"] >= 0
+    steps.finish("passed")
+    assert store.load("tests/test_demo.py::test_links") == []
+
+
+def test_rerun_resumes_after_last_completed_step(tmp_path):
+    store = CheckpointStore(str(tmp_path), retries=0)
+    first = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    first.run("Sign in", navigate, first.driver, "https://portal.test/dashboard")
+    first.run("Install link", navigate, first.driver, "https://portal.test/dashboard#install")
+    with pytest.raises(AssertionError):
+        first.run("Download link", lambda: (_ for _ in ()).throw(AssertionError("popup never opened")))
+    first.finish("failed")
+
+    driver = FakeDriver()
+    ran = []
+    rerun = store.runner(driver, "tests/test_demo.py::test_links")
+    assert rerun.run("Sign in", ran.append, "sign in") is None
+    assert rerun.run("Install link", ran.append, "install") is None
+    rerun.run("Download link", ran.append, "download")
+
+    assert ran == ["download"]
+    assert driver.visited[-1] == "https://portal.test/dashboard#install"
+    assert store.stats["skipped"] == 2 and store.stats["resumed"] == 1
+    assert [c["name"] for c in rerun.checkpoints] == ["Sign in", "Install link", "Download link"]
+
+
+def test_changed_step_sequence_discards_checkpoints(tmp_path):
+    store = CheckpointStore(str(tmp_path), retries=0)
+    first = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    first.run("Sign in", navigate, first.driver, "https://portal.test/dashboard")
+    with pytest.raises(AssertionError):
+        first.run("Install link", lambda: (_ for _ in ()).throw(AssertionError("link missing")))
+    first.finish("failed")
+
+    ran = []
+    rerun = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    rerun.run("Log in", ran.append, "log in")
+    assert ran == ["log in"] and store.stats["skipped"] == 0
+
+
+def test_failure_outside_the_steps_keeps_no_checkpoints(tmp_path):
+    store = CheckpointStore(str(tmp_path), retries=0)
+    first = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    first.run("Sign in", navigate, first.driver, "https://portal.test/dashboard")
+    first.run("Install link", navigate, first.driver, "https://portal.test/dashboard#install")
+    # e.g. an assertion after the last step
+    first.finish("failed")
+    assert store.load("tests/test_demo.py::test_links") == []
+
+    ran = []
+    rerun = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    rerun.run("Sign in", ran.append, "sign in")
+    rerun.run("Install link", ran.append, "install")
+    assert ran == ["sign in", "install"] and not rerun.skipped_every_step
+
+
+def test_rerun_that_never_reaches_the_failed_step_is_flagged(tmp_path):
+    store = CheckpointStore(str(tmp_path), retries=0)
+    first = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    first.run("Sign in", navigate, first.driver, "https://portal.test/dashboard")
+    with pytest.raises(AssertionError):
+        first.run("Download link", lambda: (_ for _ in ()).throw(AssertionError("popup never opened")))
+    first.finish("failed")
+    assert [c["name"] for c in store.load("tests/test_demo.py::test_links")] == ["Sign in"]
+
+    # The failing step was removed from the test: only skipped steps remain
+    rerun = store.runner(FakeDriver(), "tests/test_demo.py::test_links")
+    rerun.run("Sign in", navigate, rerun.driver, "https://portal.test/dashboard")
+    assert rerun.skipped_every_step
+    rerun.finish("failed")
+    assert store.load("tests/test_demo.py::test_links") == []
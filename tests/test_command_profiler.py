@@ -0,0 +1,55 @@
+# Filename: tests/test_command_profiler.py
+# Description: Verifies WebDriver command recording and per-test summaries without a browser.
+
+import json
+from selenium.webdriver.common.by import By
+from utils.command_profiler import CommandProfiler
+from utils.element_finder import ElementFinder
+
+
+class FakeExecutor:
+    def execute(self, command, params=None):
+        if command == "executeScript":
+            return {"value": [{"index": 0, "element": "banner", "visible": True, "href": None, "target": None}]}
+        return {"value": "https://portal.test/dashboard"}
+
+
+class ExecutorDriver:
+    """Routes calls through command_executor the way WebDriver.execute does."""
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+    @property
+    def current_url(self):
+        return self.command_executor.execute("getCurrentUrl")["value"]
+
+    def execute_script(self, script, *args):
+        return self.command_executor.execute("executeScript", {"script": script, "args": args})["value"]
+
+
+def test_records_commands_with_callers(tmp_path):
+    driver = ExecutorDriver()
+    profiler = CommandProfiler()
+    profiler.attach(driver)
+    profiler.attach(driver)
+
+    profiler.begin("tests/test_command_profiler.py::demo")
+    driver.current_url
+    ElementFinder(driver, timeout=1, use_strategy_cache=False).find_many(
+        "Dashboard", {"Welcome Banner": {"data-testid": (By.CSS_SELECTOR, "[data-testid='welcome-banner']")}})
+    summary = profiler.end()
+
+    assert summary["commands"] == 2
+    assert summary["by_command"]["executeScript"]["count"] == 1
+    assert summary["by_caller"] == {
+        "tests/test_command_profiler.py:test_records_commands_with_callers": 1,
+        "utils/element_finder.py:ElementFinder.find_many": 1,
+    }
+
+    driver.current_url
+    assert len(profiler.summaries) == 1
+
+    path = tmp_path / "profile.json"
+    profiler.write_json(str(path))
+    assert json.loads(path.read_text())[0]["test"] == "tests/test_command_profiler.py::demo"
@@ -0,0 +1,84 @@
+# Filename: tests/test_driver_factory.py
+# Description: Verifies fast launch (shared chromedriver, cloned profile template) and launch timing without a browser.
+
+import os
+import pytest
+from utils import driver_factory
+from utils.browser_profiles import PROFILES
+from utils.config_provider import ConfigProvider
+from utils.driver_factory import ChromeLauncher, SharedService
+
+
+class FakeProcess:
+    def poll(self):
+        return None
+
+
+class FakeChrome:
+    """Writes what Chrome leaves in a user-data-dir; records the service and profile it was started with."""
+
+    sessions = []
+    profile_dir = None
+
+    def __init__(self, options, service):
+        self.options = options
+        self.service = service
+        self.capabilities = {"browserVersion": "130.0"}
+        self.user_data_dir = next(a.split("=", 1)[1] for a in options.arguments if a.startswith("--user-data-dir="))
+        os.makedirs(os.path.join(self.user_data_dir, "Default"), exist_ok=True)
+        if not os.path.exists(os.path.join(self.user_data_dir, "First Run")):
+            open(os.path.join(self.user_data_dir, "First Run"), "w").close()
+            self.first_run = True
+        else:
+            self.first_run = False
+        open(os.path.join(self.user_data_dir, "SingletonLock"), "w").close()
+        FakeChrome.sessions.append(self)
+
+    def get(self, url):
+        pass
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def quit(self):
+        os.remove(os.path.join(self.user_data_dir, "SingletonLock"))
+        if self.profile_dir:
+            driver_factory.shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def launcher(tmp_path, monkeypatch):
+    monkeypatch.setenv("SELENIUM_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(driver_factory, "_FastChrome", FakeChrome)
+    monkeypatch.setattr(SharedService, "_start_process", lambda self, path: setattr(self, "process", FakeProcess()))
+    monkeypatch.setattr(SharedService, "is_connectable", lambda self: True)
+    FakeChrome.sessions = []
+    launcher = ChromeLauncher(ConfigProvider(), profile=PROFILES["standard"], fast=True)
+    launcher._service = SharedService(executable_path="/usr/bin/true")
+    return launcher
+
+
+def test_sessions_share_one_service_and_start_from_template(launcher):
+    first = launcher.launch()
+    second = launcher.launch()
+
+    template, clone_a, clone_b = FakeChrome.sessions
+    assert template.first_run and not first.first_run and not second.first_run
+    assert template.service is first.service is second.service
+    assert first.user_data_dir != second.user_data_dir != launcher.template_dir
+    assert "--window-size=1920,1080" in first.options.arguments
+    # Clones never inherit the template browser's lock files
+    assert not os.path.exists(os.path.join(launcher.template_dir, "SingletonLock"))
+
+    first.quit()
+    assert not os.path.exists(first.user_data_dir)
+    assert launcher.summary().startswith("browser launch (fast): 2 sessions")
+
+
+def test_shared_service_survives_session_quit(launcher):
+    service = launcher._service
+    service.start()
+    process = service.process
+    service.stop()
+    service.start()
+    assert service.process is process
@@ -0,0 +1,110 @@
+# Filename: tests/test_driver_pool.py
+# Description: Verifies reuse, reset and recycling of pooled WebDriver sessions without a browser.
+
+from selenium.common.exceptions import WebDriverException
+from utils.driver_pool import DriverPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ["main", "popup"]
+        self.current_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.cookies_cleared = False
+        self.url = "https://portal.test/dashboard"
+        self.quit_called = False
+
+    def close(self):
+        self.window_handles.remove(self.current_handle)
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies_cleared = True
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class BrokenDriver(FakeDriver):
+    def execute_script(self, script):
+        raise WebDriverException("session deleted")
+
+
+def test_reused_session_is_reset():
+    pool = DriverPool(FakeDriver, size=1, max_uses=5)
+    driver = pool.acquire()
+    pool.release(driver)
+
+    assert pool.acquire() is driver
+    assert driver.window_handles == ["main"]
+    assert driver.cookies_cleared
+    assert driver.url == "about:blank"
+    assert pool.stats["hits"] == 1 and pool.stats["misses"] == 1
+
+
+def test_session_recycled_after_max_uses():
+    pool = DriverPool(FakeDriver, size=1, max_uses=2)
+    first = pool.acquire()
+    pool.release(first)
+    pool.release(pool.acquire())
+
+    assert first.quit_called
+    assert pool.acquire() is not first
+    assert pool.stats["recycled"] == 1
+
+
+def test_unhealthy_session_is_discarded():
+    pool = DriverPool(BrokenDriver, size=1, max_uses=5)
+    driver = pool.acquire()
+    pool.release(driver)
+
+    assert driver.quit_called
+    assert pool.stats["unhealthy"] == 1
+    assert "1 misses" in pool.summary()
+
+
+class FakeCdpDriver(FakeDriver):
+    """Chrome-like driver whose tabs went through an IdP login."""
+
+    def __init__(self):
+        super().__init__()
+        self.history = {
+            "main": ["https://portal.test/dashboard", "https://login.idp.test/authorize", "https://portal.test/"],
+            "popup": ["https://docs.vendor.test/page"],
+        }
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.history[self.current_handle]]}
+        if cmd == "Network.getAllCookies":
+            return {"cookies": [{"domain": ".sso.idp.test", "secure": True}]}
+        return {}
+
+
+def test_reset_clears_storage_of_every_visited_origin():
+    driver = FakeCdpDriver()
+    DriverPool.reset(driver)
+
+    cleared = {params["origin"] for cmd, params in driver.cdp_calls if cmd == "Storage.clearDataForOrigin"}
+    assert cleared == {
+        "https://portal.test", "https://login.idp.test", "https://docs.vendor.test", "https://sso.idp.test",
+    }
+    session_cleared = {params["storageId"]["securityOrigin"] for cmd, params in driver.cdp_calls if cmd == "DOMStorage.clear"}
+    assert session_cleared == cleared
+    assert ("Network.clearBrowserCookies", {}) in driver.cdp_calls
+    assert driver.window_handles == ["main"] and driver.url == "about:blank"
@@ -0,0 +1,97 @@
+# Filename: tests/test_element_proxy.py
+# Description: Verifies lazy element handles: resolution on first use, reuse, and one re-resolution on staleness.
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+import utils.selenium_actions
+from utils.element_proxy import LazyElement, unwrap
+from utils.locator_race import CLICKABLE
+from utils.selenium_actions import click_element
+
+LOCATORS = {
+    "accessibility": ("css selector", "[aria-label='Download now']"),
+    "data-testid": ("css selector", "[data-testid='download-now']"),
+}
+
+
+class FakeElement:
+    def __init__(self, label, stale=False):
+        self.label = label
+        self.stale = stale
+        self.clicks = 0
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element reference")
+        return self.label
+
+    def click(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element reference")
+        self.clicks += 1
+
+
+class FakeFinder:
+    def __init__(self, elements):
+        self.elements = list(elements)
+        self.orders = []
+
+    def locate(self, element_name, page_name, locator_dict, condition):
+        self.orders.append((list(locator_dict), condition))
+        return "data-testid", self.elements.pop(0)
+
+
+def test_resolves_on_first_use_and_reuses_the_handle():
+    finder = FakeFinder([FakeElement("Download now")])
+    resolved = []
+    link = LazyElement(finder, "Download Now Link", "Dashboard", LOCATORS, CLICKABLE, on_resolve=resolved.append)
+    assert finder.orders == []
+
+    link.click()
+    assert link.text == "Download now"
+    assert finder.orders == [(["accessibility", "data-testid"], CLICKABLE)]
+    assert len(resolved) == 1 and link.strategy == "data-testid"
+
+
+def test_stale_handle_is_re_resolved_once_with_last_strategy_first():
+    fresh = FakeElement("Download now")
+    finder = FakeFinder([FakeElement("Download now"), fresh])
+    link = LazyElement(finder, "Download Now Link", "Dashboard", LOCATORS, CLICKABLE)
+    link.resolve().stale = True
+
+    link.click()
+    assert fresh.clicks == 1
+    assert finder.orders[1][0] == ["data-testid", "accessibility"]
+
+
+def test_second_staleness_in_a_row_is_raised():
+    finder = FakeFinder([FakeElement("a", stale=True), FakeElement("b", stale=True)])
+    link = LazyElement(finder, "Download Now Link", "Dashboard", LOCATORS)
+    with pytest.raises(StaleElementReferenceException):
+        link.text
+
+
+class MissingFinder:
+    def locate(self, element_name, page_name, locator_dict, condition):
+        raise NoSuchElementException(f"'{element_name}' not found on '{page_name}'")
+
+
+def test_lookup_failure_is_raised_before_the_click(monkeypatch):
+    captured = []
+    monkeypatch.setattr(utils.selenium_actions, "capture_failure", lambda driver, message: captured.append(message))
+    link = LazyElement(MissingFinder(), "Download Now Link", "Dashboard", LOCATORS, CLICKABLE)
+
+    with pytest.raises(NoSuchElementException, match="'Download Now Link' not found"):
+        click_element(link, "Download Now Link", "Dashboard", driver=None)
+    # The finder captured its own artifacts; no second 'Error clicking' capture
+    assert captured == []
+
+
+def test_unwrap_hands_selenium_the_resolved_element():
+    element = WebElement(parent=None, id_="node-1")
+    link = LazyElement(FakeFinder([element]), "Download Now Link", "Dashboard", LOCATORS)
+
+    assert not isinstance(link, WebElement)
+    assert unwrap(link) is element and unwrap(element) is element
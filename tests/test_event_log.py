@@ -0,0 +1,108 @@
+# Filename: tests/test_event_log.py
+# Description: Verifies the per-test event ring buffer: JSONL on failure, summary only on success.
+
+import json
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException
+from selenium.webdriver.common.by import By
+from utils.element_finder import ElementFinder
+from utils.event_log import EventLog, activate
+from utils.selenium_actions import assert_element_visible, click_element
+
+BANNER = {
+    "accessibility": (By.XPATH, "//*[@aria-label='Welcome']"),
+    "text": (By.XPATH, "//h1[contains(., 'Welcome')]"),
+}
+
+
+class FakeDriver:
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, present):
+        self.present = present
+
+    def find_element(self, by, value):
+        if value in self.present:
+            return object()
+        raise NoSuchElementException(value)
+
+
+@pytest.fixture
+def log(tmp_path):
+    event_log = EventLog(str(tmp_path), capacity=3, worker="w0-pie")
+    activate(event_log)
+    yield event_log
+    activate(None)
+    event_log.close()
+
+
+def test_passing_test_writes_only_a_summary(log):
+    log.begin("tests/test_demo.py::test_banner")
+    ElementFinder(FakeDriver({BANNER["text"][1]}), timeout=0.01, poll_frequency=0.01, use_strategy_cache=False).find(
+        "Welcome Banner", "Dashboard", BANNER)
+    log.end("passed")
+    log.close()
+
+    with open(log.summary_path) as handle:
+        summary = json.loads(handle.readline())
+    assert summary["outcome"] == "passed" and summary["actions"]["found"] == 1
+    assert summary["events"] == 4 and summary["dropped"] == 1
+    assert log.summary_path.endswith("summary_w0-pie.jsonl")
+    with pytest.raises(FileNotFoundError):
+        open(log.events_path)
+
+
+def test_failed_test_flushes_buffered_events(log):
+    log.begin("tests/test_demo.py::test_missing_banner")
+    with pytest.raises(NoSuchElementException):
+        ElementFinder(FakeDriver(set()), timeout=0.01, poll_frequency=0.01, use_strategy_cache=False).find(
+            "Welcome Banner", "Dashboard", BANNER)
+    log.end("failed")
+    log.close()
+
+    with open(log.events_path) as handle:
+        events = [json.loads(line) for line in handle]
+    assert [e["action"] for e in events] == ["try", "miss", "not_found"]
+    assert events[-1]["element"] == "Welcome Banner" and events[-1]["url"] == FakeDriver.current_url
+    assert events[-1]["elapsed_ms"] > 0 and events[-1]["condition"] == "present"
+
+
+class FakeElement:
+    def __init__(self, displayed=True, intercepted=False):
+        self.displayed = displayed
+        self.intercepted = intercepted
+
+    def is_displayed(self):
+        return self.displayed
+
+    def click(self):
+        if self.intercepted:
+            raise ElementClickInterceptedException("other element would receive the click")
+
+
+def test_actions_are_recorded_with_the_lookups(log):
+    driver = FakeDriver(set())
+    log.begin("tests/test_demo.py::test_click")
+    assert_element_visible(FakeElement(), "Learn More Link", "Dashboard", driver)
+    with pytest.raises(ElementClickInterceptedException):
+        click_element(FakeElement(intercepted=True), "Learn More Link", "Dashboard", driver)
+    log.end("failed")
+    log.close()
+
+    with open(log.events_path) as handle:
+        events = [json.loads(line) for line in handle]
+    assert [e["action"] for e in events] == ["visible", "click"]
+    assert events[0]["visible"] is True and "url" not in events[0]
+    assert events[1]["url"] == FakeDriver.current_url and "other element" in events[1]["error"]
+    with open(log.summary_path) as handle:
+        summary = json.loads(handle.readline())
+    assert summary["lookup_ms"] == 0 and summary["actions"] == {"visible": 1, "click": 1}
+
+
+def test_events_between_tests_are_not_buffered(log):
+    log.begin("tests/test_demo.py::test_banner")
+    log.end("passed")
+    # e.g. a unit test running after the last browser test, while its log is still the target
+    ElementFinder(FakeDriver({BANNER["text"][1]}), timeout=0.01, poll_frequency=0.01, use_strategy_cache=False).find(
+        "Welcome Banner", "Dashboard", BANNER)
+    assert list(log._events) == [] and log._recorded == 0
@@ -0,0 +1,100 @@
+# Filename: tests/test_failure_artifacts.py
+# Description: Verifies failure artifact capture, background writing, size caps and retention without a browser.
+
+import base64
+import json
+import os
+import zipfile
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.failure_artifacts import FailureArtifacts, activate
+from utils.selenium_actions import click_element
+
+SCREENSHOT = base64.b64encode(os.urandom(4000)).decode()
+
+
+class FakeDriver:
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_script(self, script, *args):
+        self.commands.append("executeScript")
+        return {
+            "url": self.current_url, "title": "Dashboard", "html": "<html><body>" + "<div>row</div>" * 500 + "</body></html>",
+            "console": [{"level": "error", "message": "TypeError: x is undefined", "time": 1}], "viewport": [1280, 720],
+        }
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append(cmd)
+        return {"data": SCREENSHOT}
+
+
+class BrokenElement:
+    def click(self):
+        raise WebDriverException("element click intercepted")
+
+
+def test_failed_action_captures_one_batched_artifact(tmp_path):
+    collector = FailureArtifacts(str(tmp_path), run_id="run-1")
+    collector.command_history = lambda: [{"command": "findElement", "ms": 12.0, "caller": "pages/dashboard_page.py"}]
+    collector.begin("tests/test_demo.py::test_install_link")
+    driver = FakeDriver()
+    activate(collector)
+    try:
+        with pytest.raises(WebDriverException):
+            click_element(BrokenElement(), "Install HP Smart App Button", "Dashboard", driver)
+    finally:
+        activate(None)
+    collector.close()
+
+    assert driver.commands == ["executeScript", "Page.captureScreenshot"]
+    [path] = (tmp_path / "run-1").glob("*.zip")
+    assert "test_install_link" in path.name
+    with zipfile.ZipFile(path) as archive:
+        assert sorted(archive.namelist()) == ["commands.json", "console.json", "dom.html", "meta.json", "screenshot.jpg"]
+        meta = json.loads(archive.read("meta.json"))
+        assert "Install HP Smart App Button" in meta["reason"] and meta["title"] == "Dashboard"
+        assert json.loads(archive.read("console.json"))[0]["level"] == "error"
+        assert json.loads(archive.read("commands.json"))[0]["command"] == "findElement"
+    assert collector.captured_for("tests/test_demo.py::test_install_link") == 1
+
+
+def test_size_cap_drops_screenshots_then_artifacts(tmp_path):
+    collector = FailureArtifacts(str(tmp_path), max_bytes=3000, run_id="run-1", max_per_test=5)
+    collector.begin("tests/test_demo.py::test_capped")
+    for _ in range(3):
+        collector.capture(FakeDriver(), "lookup failed")
+    collector.close()
+
+    assert collector.stats["screenshots_dropped"] >= 1
+    assert collector.stats["written"] + collector.stats["dropped"] == 3
+    assert sum(f.stat().st_size for f in (tmp_path / "run-1").iterdir()) <= 3000 + 1024
+
+
+def test_old_runs_are_pruned_and_per_test_cap_applies(tmp_path):
+    for i, name in enumerate(["run-a", "run-b", "run-c"]):
+        (tmp_path / name).mkdir()
+        os.utime(tmp_path / name, (1000 + i, 1000 + i))
+
+    collector = FailureArtifacts(str(tmp_path), keep_runs=2, max_per_test=1, run_id="run-d")
+    collector.begin("tests/test_demo.py::test_flaky")
+    first = collector.capture(FakeDriver(), "first failure")
+    second = collector.capture(FakeDriver(), "second failure")
+    collector.close()
+
+    assert sorted(os.listdir(tmp_path)) == ["run-c", "run-d"]
+    assert first is not None and second is None
+
+
+def test_nothing_is_captured_outside_a_test(tmp_path):
+    collector = FailureArtifacts(str(tmp_path), run_id="run-1")
+    driver = FakeDriver()
+    assert collector.capture(driver, "lookup failed") is None
+
+    collector.begin("tests/test_demo.py::test_install_link")
+    collector.end()
+    assert collector.capture(driver, "lookup failed") is None
+    collector.close()
+    assert driver.commands == [] and list((tmp_path / "run-1").iterdir()) == []
@@ -0,0 +1,85 @@
+# Filename: tests/test_http_archive.py
+# Description: Verifies HTTP archive deduplication and key normalization, and record/replay through the archive proxy against a local origin server.
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import urllib3
+from utils.archive_proxy import ArchiveProxy, RECORD, REPLAY
+from utils.http_archive import HttpArchive, request_key
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def do_GET(self):
+        OriginHandler.hits.append(self.path)
+        body = b"<html><body>dashboard</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def origin_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OriginHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_request_key_ignores_cache_busters_and_query_order():
+    assert request_key("get", "https://Portal.example/api?b=2&a=1&_=1700#top") == request_key("GET", "https://portal.example/api?a=1&b=2")
+    assert request_key("POST", "https://portal.example/api", b"{}") != request_key("POST", "https://portal.example/api", b"{\"a\":1}")
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    archive = HttpArchive(str(tmp_path / "archive.sqlite3"))
+    archive.put("GET", "https://portal.example/app.js", b"", 200, [("Content-Type", "text/javascript")], b"var a = 1;" * 100)
+    archive.put("GET", "https://portal.example/app.js?v=2", b"", 200, [("Transfer-Encoding", "chunked")], b"var a = 1;" * 100)
+
+    assert archive.stats()["exchanges"] == 2
+    assert archive.stats()["unique_bodies"] == 1
+    status, headers, body = archive.load()[archive.key("GET", "https://portal.example/app.js?v=2")]
+    assert (status, headers, body) == (200, [], b"var a = 1;" * 100)
+    archive.close()
+
+
+def test_records_then_replays_without_origin(tmp_path, origin_url):
+    path = str(tmp_path / "archive.sqlite3")
+    recorder = ArchiveProxy(HttpArchive(path), RECORD, str(tmp_path)).start()
+    recorded = urllib3.ProxyManager(recorder.url).request("GET", f"{origin_url}/dashboard?_=1")
+    recorder.stop()
+    assert recorded.status == 200
+    hits = len(OriginHandler.hits)
+
+    replayer = ArchiveProxy(HttpArchive(path), REPLAY, str(tmp_path)).start()
+    http = urllib3.ProxyManager(replayer.url)
+    replayed = http.request("GET", f"{origin_url}/dashboard?_=2")
+    missing = http.request("GET", f"{origin_url}/not-recorded")
+    replayer.stop()
+
+    assert replayed.data == recorded.data
+    assert len(OriginHandler.hits) == hits
+    assert missing.status == 404
+    assert replayer.missing == [f"GET {origin_url}/not-recorded"]
+    assert "1 missing" in replayer.summary()
+
+
+def test_replays_https_through_connect_tunnel(tmp_path):
+    archive = HttpArchive(str(tmp_path / "archive.sqlite3"))
+    archive.put("GET", "https://portal.example/dashboard", b"", 200, [("Content-Type", "text/html")], b"ok")
+    proxy = ArchiveProxy(archive, REPLAY, str(tmp_path)).start()
+    http = urllib3.ProxyManager(proxy.url, cert_reqs="CERT_NONE")
+    with pytest.warns(urllib3.exceptions.InsecureRequestWarning):
+        response = http.request("GET", "https://portal.example/dashboard")
+    proxy.stop()
+
+    assert (response.status, response.data) == (200, b"ok")
@@ -0,0 +1,80 @@
+# Filename: tests/test_link_checker.py
+# Description: Verifies redirect-chain resolution against a local redirecting HTTP server.
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils.link_checker import LinkChecker
+
+REDIRECTS = {
+    "/install": "/go/store",
+    "/go/store": "/apps/hp-smart",
+    "/learn-more": "/sustainability",
+    "/loop": "/loop",
+}
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        if self.path == "/no-head":
+            self.send_response(405)
+        elif self.path in REDIRECTS:
+            self.send_response(302)
+            self.send_header("Location", REDIRECTS[self.path])
+        elif self.path == "/private" and "session=ok" not in self.headers.get("Cookie", ""):
+            self.send_response(401)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"<html>store page</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RedirectHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_follows_redirect_chains_concurrently(server_url):
+    checker = LinkChecker()
+    chains = checker.resolve_all([f"{server_url}/install", f"{server_url}/learn-more"])
+
+    install = chains[f"{server_url}/install"]
+    assert install.final_url == f"{server_url}/apps/hp-smart"
+    assert [status for _, status in install.hops] == [302, 302, 200]
+    assert chains[f"{server_url}/learn-more"].final_url.endswith("/sustainability")
+
+
+def test_redirect_loop_is_reported(server_url):
+    chain = LinkChecker(max_redirects=3).resolve(f"{server_url}/loop")
+    assert chain.error
+    assert len(chain.hops) == 4
+
+
+def test_session_cookies_sent_to_matching_host(server_url):
+    cookies = [{"name": "session", "value": "ok", "domain": "127.0.0.1"}]
+    assert LinkChecker(cookies=cookies).resolve(f"{server_url}/private").status == 200
+    assert LinkChecker().resolve(f"{server_url}/private").status == 401
+
+
+def test_head_and_get_fallback_return_their_connection_to_the_pool(server_url):
+    checker = LinkChecker(pool_size=1)
+    assert checker.resolve(f"{server_url}/install").status == 200
+    assert checker.resolve(f"{server_url}/no-head").hops == [(f"{server_url}/no-head", 200)]
+
+    pool = checker.http.connection_from_url(server_url)
+    # Five requests (three HEAD hops, HEAD refused, GET) over one connection that is released after each
+    assert (pool.num_requests, pool.num_connections) == (5, 1)
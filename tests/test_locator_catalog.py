@@ -0,0 +1,86 @@
+# Filename: tests/test_locator_catalog.py
+# Description: Verifies locator catalog validation and compilation.
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages.locator_catalog import CATALOG, LocatorCatalogError, compile_catalog
+from utils.element_finder import ElementFinder
+
+
+def test_shipped_catalog_compiles_with_union_probes():
+    banner = CATALOG["Dashboard"]["Welcome Banner"]
+    assert list(banner) == ["accessibility", "data-testid", "semantic", "text"]
+    assert banner["text"] == (By.XPATH, "//*[normalize-space(text())='Welcome Banner']")
+    selector, covered = banner.probe
+    assert selector == "[aria-label='Welcome Banner'], [data-testid='welcome-banner'], .welcome-banner"
+    assert covered == {"accessibility", "data-testid", "semantic"}
+
+
+def test_entries_are_immutable():
+    with pytest.raises(TypeError):
+        CATALOG["Dashboard"]["Welcome Banner"]["semantic"] = (By.CSS_SELECTOR, "div")
+    with pytest.raises(TypeError):
+        CATALOG["Dashboard"]["Extra"] = {}
+
+
+def test_priority_order_comes_from_strategy_ranking():
+    catalog = compile_catalog({"Page": {"Link": {
+        "text": ["xpath", "//a[normalize-space()='Go']"],
+        "accessibility": ["css", "[aria-label='Go']"],
+    }}})
+    link = catalog["Page"]["Link"]
+    assert list(link) == ["accessibility", "text"]
+    assert link.probe is None
+
+
+def test_all_errors_reported_together():
+    with pytest.raises(LocatorCatalogError) as excinfo:
+        compile_catalog({"Page": {
+            "Broken XPath": {"text": ["xpath", "//a[normalize-space()='Go'"]},
+            "Broken CSS": {"semantic": ["css", "a.link,"]},
+            "Bad Strategy": {"aria": ["css", "[aria-label='x']"]},
+        }})
+    message = str(excinfo.value)
+    assert "Broken XPath [text]" in message
+    assert "Broken CSS [semantic]" in message
+    assert "unknown strategies ['aria']" in message
+
+
+def test_syntax_is_checked_by_the_xpath_and_css_parsers():
+    # Balanced brackets alone would accept both of these
+    with pytest.raises(LocatorCatalogError) as excinfo:
+        compile_catalog({"Page": {
+            "Bad Function Call": {"text": ["xpath", "//a[normalize-space()='Go' and ()]"]},
+            "Bad Pseudo": {"semantic": ["css", "a.link:()"]},
+        }})
+    message = str(excinfo.value)
+    assert "Bad Function Call [text]" in message
+    assert "Bad Pseudo [semantic]" in message
+
+
+class ProbeDriver:
+    """Only the data-testid selector matches; records every find command."""
+
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self):
+        self.finds = []
+
+    def find_element(self, by, selector):
+        self.finds.append(selector)
+        return "banner"
+
+    def find_elements(self, by, selector):
+        self.finds.append(selector)
+        return ["banner"] if selector == "[data-testid='welcome-banner']" else []
+
+
+def test_sequential_lookup_waits_once_on_union_probe():
+    driver = ProbeDriver()
+    finder = ElementFinder(driver, timeout=1, race=False, use_strategy_cache=False, wait_backend="poll")
+    assert finder.find("Welcome Banner", "Dashboard", CATALOG["Dashboard"]["Welcome Banner"]) == "banner"
+    assert driver.finds == [
+        CATALOG["Dashboard"]["Welcome Banner"].probe[0],
+        "[aria-label='Welcome Banner']",
+        "[data-testid='welcome-banner']",
+    ]
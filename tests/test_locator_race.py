@@ -0,0 +1,110 @@
+# Filename: tests/test_locator_race.py
+# Description: Verifies racing of fallback locator strategies without a browser.
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from utils.element_finder import ElementFinder
+from utils.locator_race import to_script_locator, CLICKABLE
+
+
+@pytest.fixture(autouse=True)
+def no_strategy_cache(monkeypatch):
+    monkeypatch.setenv("SELENIUM_STRATEGY_CACHE", "false")
+
+
+class ScriptDriver:
+    """Stands in for WebDriver; returns queued execute_script results."""
+
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.results.pop(0) if self.results else None
+
+
+LOCATORS = {
+    "accessibility": (By.XPATH, "//*[@aria-label='Download now']"),
+    "data-testid": (By.CSS_SELECTOR, "[data-testid='download-now']"),
+    "semantic": None,
+    "text": (By.LINK_TEXT, "Download now"),
+}
+
+
+def test_to_script_locator_converts_by_strategies():
+    assert to_script_locator((By.ID, "main")) == ["css", '[id="main"]']
+    assert to_script_locator((By.CLASS_NAME, "banner")) == ["css", ".banner"]
+    assert to_script_locator((By.XPATH, "//a")) == ["xpath", "//a"]
+    assert to_script_locator((By.LINK_TEXT, "Learn more")) == ["link", "Learn more"]
+
+
+def test_race_returns_first_match_with_one_call_per_poll():
+    driver = ScriptDriver([None, [1, "download-element"]])
+    finder = ElementFinder(driver, timeout=2, poll_frequency=0.01, race=True)
+
+    element = finder.find_clickable("Download Now Link", "Dashboard", LOCATORS)
+
+    assert element == "download-element"
+    assert len(driver.calls) == 2
+    script_locators, condition = driver.calls[0]
+    assert len(script_locators) == 3
+    assert condition == CLICKABLE
+
+
+def test_race_miss_uses_single_deadline():
+    driver = ScriptDriver([])
+    finder = ElementFinder(driver, timeout=0.2, poll_frequency=0.05, race=True)
+
+    with pytest.raises(NoSuchElementException):
+        finder.find("Download Now Link", "Dashboard", LOCATORS)
+    assert len(driver.calls) < 10
+
+
+class BulkDriver(ScriptDriver):
+    """Answers bulk scripts: the banner is visible, the card is present but hidden."""
+
+    def execute_script(self, script, groups, condition):
+        self.calls.append((groups, condition))
+        results = []
+        for group in groups:
+            if len(group) == 1:
+                results.append({"index": 0, "element": "banner", "visible": True, "href": None, "target": None})
+            elif condition != "visible":
+                results.append({"index": 1, "element": "card", "visible": False, "href": None, "target": None})
+            else:
+                results.append(None)
+        return results
+
+
+BULK_LOCATORS = {
+    "Welcome Banner": {"data-testid": (By.CSS_SELECTOR, "[data-testid='welcome-banner']")},
+    "Sustainability Card": {
+        "accessibility": (By.XPATH, "//*[@aria-label='Sustainability']"),
+        "data-testid": (By.CSS_SELECTOR, "[data-testid='sustainability-card']"),
+    },
+}
+
+
+def test_find_many_reports_strategy_per_element():
+    driver = BulkDriver([])
+    finder = ElementFinder(driver, timeout=1, poll_frequency=0.01)
+
+    results = finder.find_many("Dashboard", BULK_LOCATORS)
+
+    assert len(driver.calls) == 1
+    assert results["Welcome Banner"]["strategy"] == "data-testid"
+    assert results["Sustainability Card"]["strategy"] == "data-testid"
+
+
+def test_assert_all_visible_fails_with_combined_diagnostic():
+    driver = BulkDriver([])
+    finder = ElementFinder(driver, timeout=0.1, poll_frequency=0.02)
+
+    with pytest.raises(AssertionError) as excinfo:
+        finder.assert_all_visible("Dashboard", BULK_LOCATORS)
+    assert "1 of 2 elements not visible" in str(excinfo.value)
+    assert "'Sustainability Card': present via data-testid locator but not visible" in str(excinfo.value)
@@ -0,0 +1,94 @@
+# Filename: tests/test_mutation_wait.py
+# Description: Verifies the MutationObserver wait backend and its polling fallback without a browser.
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from utils.element_finder import ElementFinder
+from utils.mutation_wait import observe_first, observe_all
+
+LOCATORS = {
+    "accessibility": (By.CSS_SELECTOR, "[aria-label='Learn more']"),
+    "data-testid": (By.CSS_SELECTOR, "[data-testid='learn-more']"),
+}
+
+
+class AsyncDriver:
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.async_calls = 0
+        self.sync_calls = 0
+
+    def execute_async_script(self, script, groups, condition, mode, timeout_ms):
+        self.async_calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def execute_script(self, script, *args):
+        self.sync_calls += 1
+        return [1, "polled-element"]
+
+
+def test_observe_first_survives_navigation():
+    driver = AsyncDriver([JavascriptException("document unloaded"), [1, "learn-more"]])
+    assert observe_first(driver, LOCATORS, "clickable", timeout=1) == ("data-testid", "learn-more")
+    assert driver.async_calls == 2
+
+
+def test_observe_all_maps_results_to_names():
+    match = {"index": 0, "element": "banner", "visible": True, "href": None, "target": None}
+    driver = AsyncDriver([[match, None]])
+    results = observe_all(driver, {"Banner": LOCATORS, "Card": LOCATORS}, "visible", timeout=0)
+    assert results["Banner"]["strategy"] == "accessibility"
+    assert results["Card"] is None
+
+
+@pytest.fixture
+def finder_env(monkeypatch):
+    monkeypatch.setenv("SELENIUM_STRATEGY_CACHE", "false")
+    monkeypatch.setenv("SELENIUM_WAIT_BACKEND", "observer")
+
+
+def test_finder_uses_observer_backend(finder_env):
+    driver = AsyncDriver([[0, "learn-more"]])
+    assert ElementFinder(driver, timeout=1).find_clickable("Learn More Link", "Dashboard", LOCATORS) == "learn-more"
+    assert driver.sync_calls == 0
+
+
+def test_finder_falls_back_to_polling(finder_env):
+    driver = AsyncDriver([WebDriverException("async scripts unsupported")])
+    element = ElementFinder(driver, timeout=1, poll_frequency=0.01).find("Learn More Link", "Dashboard", LOCATORS)
+    assert element == "polled-element"
+    assert driver.sync_calls == 1
+
+
+class SettleDriver:
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.quiet_ms = []
+
+    def execute_async_script(self, script, groups, condition, quiet_ms, timeout_ms):
+        self.quiet_ms.append(quiet_ms)
+        state = self.states.pop(0)
+        if isinstance(state, Exception):
+            raise state
+        return state
+
+
+def test_assert_absent_decides_once_page_settles(finder_env):
+    driver = SettleDriver([JavascriptException("document unloaded"), {"settled": True, "quiet": 300, "matches": [None]}])
+    assert ElementFinder(driver, timeout=5).assert_absent("Learn More Link", "Dashboard", LOCATORS) is True
+    assert driver.quiet_ms == [300, 300]
+
+
+def test_assert_not_visible_names_the_matching_strategy(finder_env):
+    match = {"index": 1, "element": "learn-more", "visible": True, "href": None, "target": None}
+    driver = SettleDriver([{"settled": True, "quiet": 300, "matches": [match]}])
+    with pytest.raises(AssertionError, match="visible via data-testid locator"):
+        ElementFinder(driver, timeout=5).assert_not_visible("Learn More Link", "Dashboard", LOCATORS)
@@ -0,0 +1,104 @@
+# Filename: tests/test_offline_locators.py
+# Description: Runs catalog locators and page objects against DOM snapshots, with no browser or network.
+
+import os
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pages.dashboard_page import DashboardPage
+from pages.locator_catalog import CATALOG
+from utils.dom_snapshot import DomSnapshot, OfflineElementFinder, SnapshotRecorder, load_snapshots, unresolved
+
+SNAPSHOT_DIR = os.environ.get("SELENIUM_SNAPSHOT_DIR", os.path.join(os.path.dirname(__file__), "snapshots"))
+
+DASHBOARD_HTML = """
+<html><body>
+  <div class="welcome-banner">Welcome Banner</div>
+  <button data-testid="install-hp-smart-app" class="install-hp-smart-app">Install HP Smart App</button>
+  <a class="download-now" href="/download" data-offline-hidden="1">Download now</a>
+  <a href="/sustainability">Learn more</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    monkeypatch.setenv("SELENIUM_STRATEGY_CACHE", "false")
+    page = DashboardPage(driver=None)
+    page.element_finder = OfflineElementFinder(DomSnapshot(DASHBOARD_HTML, "Dashboard"))
+    return page
+
+
+def test_page_object_runs_against_snapshot(dashboard):
+    assert dashboard.get_welcome_banner().text_content() == "Welcome Banner"
+    assert dashboard.get_install_hp_smart_app_button().get("data-testid") == "install-hp-smart-app"
+    assert dashboard.get_learn_more_link().get("href") == "/sustainability"
+
+
+def test_hidden_elements_are_not_clickable(dashboard):
+    # Getters return lazy handles; the lookup fails on first use
+    with pytest.raises(NoSuchElementException):
+        dashboard.get_download_now_link().get("href")
+
+
+def test_report_names_resolving_strategy(dashboard):
+    report = dashboard.element_finder.report(CATALOG["Dashboard"])
+    assert report["Welcome Banner"]["strategy"] == "semantic"
+    assert report["Install HP Smart App Button"]["strategy"] == "data-testid"
+    assert report["Learn More Link"] == {
+        "strategy": "text",
+        "matches": {"accessibility": 0, "data-testid": 0, "semantic": 0, "text": 1},
+    }
+    assert report["Sustainability Page"]["strategy"] is None
+
+
+class NavigatingDriver:
+    """Answers the capture script once per document, as the in-page flag does."""
+
+    def __init__(self):
+        self.documents = []
+        self.captured = set()
+
+    def load(self, url, html):
+        self.documents.append((url, html))
+
+    def execute_script(self, script):
+        document = len(self.documents) - 1
+        if document in self.captured:
+            return None
+        self.captured.add(document)
+        url, html = self.documents[document]
+        return {"url": url, "title": "", "html": html}
+
+
+def test_snapshots_are_recorded_once_per_document_and_keyed_by_path(tmp_path):
+    recorder = SnapshotRecorder(str(tmp_path))
+    driver = NavigatingDriver()
+    driver.load("https://portal.test/dashboard", DASHBOARD_HTML)
+    first = recorder.record(driver, "Dashboard")
+    assert recorder.record(driver, "Dashboard") is None
+
+    # Learn more navigates within the same page object; the dashboard snapshot must survive
+    driver.load("https://portal.test/sustainability", '<html><body><section class="sustainability-page"></section></body></html>')
+    second = recorder.record(driver, "Dashboard")
+    assert os.path.basename(first) == "Dashboard__dashboard.html"
+    assert os.path.basename(second) == "Dashboard__sustainability.html"
+
+    snapshots = load_snapshots(str(tmp_path))["Dashboard"]
+    assert [snapshot.url for snapshot in snapshots] == ["https://portal.test/dashboard", "https://portal.test/sustainability"]
+    assert unresolved(snapshots, CATALOG["Dashboard"]) == ["Sustainability Card"]
+
+
+RECORDED = load_snapshots(SNAPSHOT_DIR)
+
+
+@pytest.mark.skipif(not RECORDED, reason=f"no recorded snapshots in {SNAPSHOT_DIR}")
+@pytest.mark.parametrize("page_name", sorted(name for name in RECORDED if name in CATALOG))
+def test_recorded_snapshots_resolve_catalog(page_name):
+    # A page object may span several URLs; each element must resolve in at least one of its snapshots
+    missing = unresolved(RECORDED[page_name], CATALOG[page_name])
+    reports = {snapshot.url: OfflineElementFinder(snapshot).report(CATALOG[page_name]) for snapshot in RECORDED[page_name]}
+    assert not missing, f"Locators unresolved in every {page_name} snapshot: {missing}\n{reports}"
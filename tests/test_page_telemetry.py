@@ -0,0 +1,71 @@
+# Filename: tests/test_page_telemetry.py
+# Description: Verifies page-load telemetry collection, its per-build time series and the regression report.
+
+import utils.page_telemetry
+from utils.page_telemetry import PageTelemetry, collect_page_telemetry
+
+
+def sample(time_origin, lcp=1200.0, cls=0.01, ttfb=180.0, build=None):
+    return {
+        "url": "https://portal.test/dashboard", "time_origin": time_origin, "build": build,
+        "ttfb": ttfb, "dom_content_loaded": 900.0, "load": 1500.0, "fcp": 800.0, "lcp": lcp, "cls": cls,
+        "resource_count": 42, "transfer_bytes": 800000, "slowest": [{"name": "app.js", "duration": 300.0, "initiator": "script"}],
+    }
+
+
+class FakeDriver:
+    def __init__(self, samples):
+        self.samples = list(samples)
+        self.calls = 0
+
+    def execute_script(self, script):
+        self.calls += 1
+        return self.samples.pop(0)
+
+
+def test_each_document_is_recorded_once_with_its_build(tmp_path, monkeypatch):
+    telemetry = PageTelemetry(str(tmp_path / "telemetry.sqlite3"), "STAGE")
+    driver = FakeDriver([sample(1.0, build="2024.10.1"), sample(1.0, build="2024.10.1"), sample(2.0, build="2024.10.1")])
+    telemetry.begin("tests/test_demo.py::test_dashboard")
+    assert telemetry.collect(driver, "Dashboard")["lcp"] == 1200.0
+    assert telemetry.collect(driver, "Dashboard") is None
+    assert telemetry.collect(driver, "Dashboard") is not None
+    telemetry.flush()
+    assert telemetry.recorded == 2
+    # Outside a browser test the page-object hook does nothing
+    monkeypatch.setattr(utils.page_telemetry, "_active", None)
+    assert collect_page_telemetry(driver, "Dashboard") is None and driver.calls == 3
+
+
+def test_report_flags_metrics_that_regressed_in_latest_build(tmp_path):
+    telemetry = PageTelemetry(str(tmp_path / "telemetry.sqlite3"), "STAGE")
+    loads = [sample(1 + i, build="41") for i in range(4)] + [sample(10 + i, lcp=2600.0, cls=0.2, build="42") for i in range(2)]
+    driver = FakeDriver(loads)
+    for _ in loads:
+        telemetry.collect(driver, "Dashboard")
+    telemetry.flush()
+
+    rows = telemetry.regressions("STAGE", threshold=1.2)
+    assert [row.metric for row in rows] == ["cls", "lcp"]
+    lcp = rows[1]
+    assert (lcp.baseline, lcp.recent, lcp.build, lcp.baseline_samples) == (1200.0, 2600.0, "42", 4)
+    assert telemetry.regressions("PIE") == []
+
+
+def test_small_absolute_changes_are_not_regressions(tmp_path):
+    telemetry = PageTelemetry(str(tmp_path / "telemetry.sqlite3"), "PIE", build="unknown")
+    loads = [sample(1 + i, ttfb=20.0) for i in range(6)] + [sample(10 + i, ttfb=60.0) for i in range(5)]
+    driver = FakeDriver(loads)
+    for _ in loads:
+        telemetry.collect(driver, "Dashboard")
+    telemetry.flush()
+    assert telemetry.regressions() == []
+
+
+def test_document_still_loading_is_measured_on_a_later_call(tmp_path):
+    telemetry = PageTelemetry(str(tmp_path / "telemetry.sqlite3"), "STAGE")
+    loading = dict(sample(1.0, lcp=300.0), ready_state="interactive", load=None)
+    driver = FakeDriver([loading, sample(1.0)])
+    assert telemetry.collect(driver, "Dashboard") is None
+    assert telemetry.collect(driver, "Dashboard")["lcp"] == 1200.0
+    assert telemetry.recorded == 1
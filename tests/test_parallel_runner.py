@@ -0,0 +1,79 @@
+# Filename: tests/test_parallel_runner.py
+# Description: Verifies duration history, longest-first shard planning and per-environment worker isolation of the parallel runner.
+
+import re
+from utils.parallel_runner import (
+    DurationHistory, Job, main, plan_jobs, plan_shards, shard_command, split_pytest_args, worker_environment,
+)
+
+
+def test_history_smooths_durations_per_environment(tmp_path):
+    history = DurationHistory(str(tmp_path / "durations.sqlite3"))
+    history.record("PIE", {"t::a": 10.0})
+    history.record("PIE", {"t::a": 20.0})
+    history.record("STAGE", {"t::a": 4.0})
+
+    assert history.durations("PIE") == {"t::a": 15.0}
+    assert history.durations("STAGE") == {"t::a": 4.0}
+
+
+def test_jobs_cover_every_environment_longest_first(tmp_path):
+    history = DurationHistory(str(tmp_path / "durations.sqlite3"))
+    history.record("PIE", {"t::slow": 40.0, "t::fast": 2.0})
+
+    jobs = plan_jobs(["t::slow", "t::fast", "t::new"], ["PIE", "STAGE"], history)
+
+    assert jobs[0] == Job("PIE", "t::slow", 40.0)
+    assert Job("PIE", "t::new", 21.0) in jobs
+    assert len([job for job in jobs if job.env == "STAGE"]) == 3
+
+
+def test_shards_balance_toward_longest_test():
+    jobs = [Job("PIE", f"t::{i}", seconds) for i, seconds in enumerate([30, 12, 10, 9, 8, 7, 4])]
+
+    shards = plan_shards(jobs, 3)
+
+    assert sorted(shard.estimate for shard in shards) == [24, 26, 30]
+    assert max(shard.estimate for shard in shards) == 30
+
+
+def test_worker_environment_is_isolated_per_target():
+    snapshot = {"TEST_ENV": "PIE", "BASE_URL": "https://pie", "BASE_URL_STAGE": "https://stage", "STAGE_USERNAME": "qa"}
+
+    environ = worker_environment(snapshot, "STAGE", "w1-stage")
+
+    assert (environ["TEST_ENV"], environ["BASE_URL"], environ["USERNAME"]) == ("STAGE", "https://stage", "qa")
+    assert snapshot["BASE_URL"] == "https://pie"
+
+
+def test_shards_get_options_and_their_node_ids_but_no_selection():
+    args = ["tests/", "-k", "dashboard and not slow", "-m=smoke", "--maxfail", "2", "-x", "--tb=short", "-p", "no:randomly",
+            "--ignore", "tests/tests", "tests/test_link_checker.py"]
+    selection, options = split_pytest_args(args)
+    assert selection == ["tests/", "-k", "dashboard and not slow", "-m=smoke", "--ignore", "tests/tests", "tests/test_link_checker.py"]
+    assert options == ["--maxfail", "2", "-x", "--tb=short", "-p", "no:randomly"]
+
+    command = shard_command(options, ["tests/test_a.py::test_one", "tests/test_b.py::test_two"])
+    assert command[command.index("pytest") + 1:] == [
+        "-p", "no:cacheprovider", "--maxfail", "2", "-x", "--tb=short", "-p", "no:randomly",
+        "tests/test_a.py::test_one", "tests/test_b.py::test_two",
+    ]
+
+
+def test_runs_shards_in_separate_processes(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("SELENIUM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SELENIUM_ARTIFACTS_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.chdir(tmp_path)
+    suite = tmp_path / "test_sample.py"
+    suite.write_text(
+        "import os\n"
+        "def test_env():\n    assert os.environ['TEST_ENV'] in ('PIE', 'STAGE')\n"
+        "def test_worker():\n    assert os.environ['SELENIUM_WORKER_ID'].startswith('w')\n"
+    )
+
+    assert main(["--workers", "2", "--envs", "PIE,STAGE", suite.name]) == 0
+    logs = [path.read_text() for path in (tmp_path / "artifacts" / "shards").glob("*.log")]
+    assert len(logs) >= 2
+    # Each test runs once per environment: the path given on the command line is not re-run by every shard
+    assert sum(int(re.search(r"(\d+) passed", log).group(1)) for log in logs) == 4
+    assert "4 tests across ['PIE', 'STAGE']" in capsys.readouterr().out
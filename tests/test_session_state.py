@@ -0,0 +1,122 @@
+# Filename: tests/test_session_state.py
+# Description: Verifies persistence and expiry of the cached login state, and how sign-in replays or replaces it.
+
+import time
+from selenium.common.exceptions import NoSuchElementException
+from pages import login_page
+from pages.login_page import LoginPage
+from utils.session_state import LoginStateCache
+
+
+def make_state(cookies):
+    return {
+        "url": "https://portal.test/dashboard",
+        "origin": "https://portal.test",
+        "cookies": cookies,
+        "local": {"token": "abc"},
+        "session": {},
+        "captured_at": time.time(),
+    }
+
+
+def test_saved_state_round_trips(tmp_path):
+    cache = LoginStateCache(str(tmp_path / "login_state_pie.json"), ttl=60)
+    cache.save(make_state([{"name": "sid", "value": "1", "expires": -1, "session": True}]))
+
+    state = cache.load()
+    assert state["local"] == {"token": "abc"}
+    cache.invalidate()
+    assert cache.load() is None
+
+
+def test_state_expires_with_first_persistent_cookie(tmp_path):
+    cache = LoginStateCache(str(tmp_path / "login_state_pie.json"), ttl=3600)
+    cache.save(make_state([{"name": "auth", "value": "1", "expiry": time.time() - 1}]))
+
+    assert cache.load() is None
+
+
+class FakePortalDriver:
+    """
+    Shows the dashboard for a valid replayed state. A rejected state first renders a blank page and
+    reaches the login form only after redirect_polls lookups, like an IdP redirecting by script.
+    """
+
+    def __init__(self, state_valid, redirect_polls=0):
+        self.state_valid = state_valid
+        self.redirect_polls = redirect_polls
+        self.page = None
+        self.loads = []
+
+    def get(self, url):
+        self.loads.append(url)
+        self.page = "login"
+
+    def _current(self):
+        if self.page == "replayed":
+            if self.state_valid:
+                return "dashboard"
+            if self.redirect_polls:
+                self.redirect_polls -= 1
+                return "blank"
+            self.page = "login"
+        return self.page
+
+    def find_elements(self, by, value):
+        page = self._current()
+        landing = (by, value) in LoginPage.LANDING.values()
+        return ["element"] if (page == "login" and (by, value) == LoginPage.USERNAME) or (page == "dashboard" and landing) else []
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+
+class FakeConfig:
+    env = "PIE"
+    base_url = "https://portal.test/"
+    username = "user@example.com"
+    password = "secret"
+
+
+def sign_in(monkeypatch, tmp_path, driver):
+    cache = LoginStateCache(str(tmp_path / "login_state_pie.json"), ttl=60)
+    cache.save(make_state([]))
+    replayed = []
+
+    def restore(driver, state, url):
+        replayed.append(state)
+        driver.page = "replayed"
+
+    logins = []
+
+    def login(username, password):
+        logins.append(username)
+        driver.page = "dashboard"
+
+    monkeypatch.setattr(login_page, "restore_session_state", restore)
+    monkeypatch.setattr(login_page, "capture_session_state", lambda driver: make_state([]))
+    page = LoginPage(driver, timeout=5)
+    monkeypatch.setattr(page, "login", login)
+    page.sign_in(FakeConfig(), cache)
+    return replayed, logins
+
+
+def test_valid_cached_state_is_replayed_without_a_login(monkeypatch, tmp_path):
+    driver = FakePortalDriver(state_valid=True)
+    replayed, logins = sign_in(monkeypatch, tmp_path, driver)
+
+    assert len(replayed) == 1
+    assert logins == [] and driver.loads == []
+
+
+def test_state_rejected_by_a_late_redirect_falls_back_to_a_full_login(monkeypatch, tmp_path):
+    # The login form only appears after the load event; deciding on the first lookup would accept the state
+    driver = FakePortalDriver(state_valid=False, redirect_polls=2)
+    replayed, logins = sign_in(monkeypatch, tmp_path, driver)
+
+    assert len(replayed) == 1
+    assert logins == ["user@example.com"]
+    assert driver.loads == ["https://portal.test/"]
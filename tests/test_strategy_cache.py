@@ -0,0 +1,87 @@
+# Filename: tests/test_strategy_cache.py
+# Description: Verifies the persistent winning-strategy cache and how ElementFinder uses it.
+
+from selenium.webdriver.common.by import By
+from utils.element_finder import ElementFinder
+from utils.strategy_cache import StrategyCache, activate
+
+LOCATORS = {
+    "accessibility": (By.CSS_SELECTOR, "[aria-label='Download now']"),
+    "data-testid": (By.CSS_SELECTOR, "[data-testid='download-now']"),
+    "text": (By.LINK_TEXT, "Download now"),
+}
+
+
+class RaceDriver:
+    """Answers race scripts by matching the first strategy whose selector is on the fake page."""
+
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, present):
+        self.present = present
+        self.orders = []
+
+    def execute_script(self, script, script_locators, condition):
+        self.orders.append([expr for _, expr in script_locators])
+        for index, (_, expr) in enumerate(script_locators):
+            if expr in self.present:
+                return [index, expr]
+        return None
+
+
+def test_record_get_and_invalidate(tmp_path):
+    cache = StrategyCache(str(tmp_path / "cache.sqlite3"))
+    assert cache.get("Dashboard", "Download Now Link") is None
+    cache.record("Dashboard", "Download Now Link", "data-testid")
+    assert cache.get("Dashboard", "Download Now Link") == "data-testid"
+    cache.invalidate("Dashboard", "Download Now Link")
+    assert cache.get("Dashboard", "Download Now Link") is None
+
+
+def test_entries_expire(tmp_path):
+    cache = StrategyCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+    cache.record("Dashboard", "Welcome Banner", "semantic")
+    assert cache.get("Dashboard", "Welcome Banner") is None
+
+
+def test_finder_tries_cached_strategy_first_and_replaces_stale_entry(tmp_path):
+    cache = StrategyCache(str(tmp_path / "cache.sqlite3"))
+    testid = LOCATORS["data-testid"][1]
+
+    driver = RaceDriver(present={testid})
+    ElementFinder(driver, timeout=1, poll_frequency=0.01, race=True, strategy_cache=cache).find_clickable(
+        "Download Now Link", "Dashboard", LOCATORS)
+    assert cache.get("Dashboard", "Download Now Link") == "data-testid"
+
+    driver = RaceDriver(present={"Download now"})
+    ElementFinder(driver, timeout=1, poll_frequency=0.01, race=True, strategy_cache=cache).find_clickable(
+        "Download Now Link", "Dashboard", LOCATORS)
+    assert driver.orders[0][0] == testid
+    assert cache.get("Dashboard", "Download Now Link") == "text"
+
+
+def test_disabled_cache_keeps_declared_order(tmp_path):
+    cache = StrategyCache(str(tmp_path / "cache.sqlite3"))
+    cache.record("Dashboard", "Download Now Link", "text")
+
+    driver = RaceDriver(present={"Download now"})
+    finder = ElementFinder(driver, timeout=1, poll_frequency=0.01, race=True, strategy_cache=cache, use_strategy_cache=False)
+    finder.find_clickable("Download Now Link", "Dashboard", LOCATORS)
+    assert finder.strategy_cache is None
+    assert driver.orders[0][0] == LOCATORS["accessibility"][1]
+
+
+def test_finder_outside_a_browser_test_uses_no_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("SELENIUM_CACHE_DIR", str(tmp_path))
+    driver = RaceDriver(present={"Download now"})
+    finder = ElementFinder(driver, timeout=1, poll_frequency=0.01, race=True)
+    finder.find_clickable("Download Now Link", "Dashboard", LOCATORS)
+    assert finder.strategy_cache is None
+    assert list(tmp_path.iterdir()) == []
+
+    cache = StrategyCache(str(tmp_path / "cache.sqlite3"))
+    activate(cache)
+    try:
+        assert ElementFinder(driver).strategy_cache is cache
+    finally:
+        activate(None)
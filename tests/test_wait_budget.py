@@ -0,0 +1,95 @@
+# Filename: tests/test_wait_budget.py
+# Description: Verifies learned per-element wait budgets, their use by ElementFinder and the drift report.
+
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from utils.element_finder import ElementFinder
+from utils.wait_budget import WaitBudgets, activate
+
+BANNER = {
+    "accessibility": (By.XPATH, "//*[@aria-label='Welcome']"),
+    "text": (By.XPATH, "//h1[contains(., 'Welcome')]"),
+}
+
+
+class FakeDriver:
+    current_url = "https://portal.test/dashboard"
+
+    def __init__(self, present):
+        self.present = present
+
+    def find_element(self, by, value):
+        if value in self.present:
+            return object()
+        raise NoSuchElementException(value)
+
+
+def learned(path, seconds, samples=20, **kwargs):
+    budgets = WaitBudgets(path, min_samples=samples, **kwargs)
+    for _ in range(samples):
+        budgets.observe("Dashboard", "Welcome Banner", "text", seconds)
+    budgets.flush()
+    return WaitBudgets(path, min_samples=samples, **kwargs)
+
+
+def test_budget_covers_percentile_with_margin_and_clamps(tmp_path):
+    path = str(tmp_path / "latency.sqlite3")
+    assert WaitBudgets(path).budget("Dashboard", "Welcome Banner", "text", default=10) == 10
+
+    budgets = learned(path, 0.2, floor=0.1)
+    assert 0.3 <= budgets.budget("Dashboard", "Welcome Banner", "text", default=10) <= 0.4
+    # A strategy that never won falls back to the element's history across strategies
+    assert budgets.budget("Dashboard", "Welcome Banner", "accessibility", default=10) == \
+        budgets.budget("Dashboard", "Welcome Banner", "text", default=10)
+    assert learned(path, 0.2, floor=1.0).budget("Dashboard", "Welcome Banner", default=10) == 1.0
+    assert learned(path, 30, floor=1.0).budget("Dashboard", "Welcome Banner", default=10) == 10
+
+
+def test_finder_reports_missing_element_within_learned_budget(tmp_path):
+    budgets = learned(str(tmp_path / "latency.sqlite3"), 0.02, floor=0.05)
+    finder = ElementFinder(FakeDriver(set()), timeout=5, poll_frequency=0.01, use_strategy_cache=False,
+                           wait_budgets=budgets)
+
+    start = time.perf_counter()
+    with pytest.raises(NoSuchElementException, match="learned budget"):
+        finder.find("Welcome Banner", "Dashboard", BANNER)
+    assert time.perf_counter() - start < 1
+
+    finder = ElementFinder(FakeDriver({BANNER["text"][1]}), timeout=5, poll_frequency=0.01, use_strategy_cache=False,
+                           wait_budgets=budgets)
+    finder.find("Welcome Banner", "Dashboard", BANNER)
+    assert budgets.stats["observed"] == 1 and budgets.stats["adaptive"] >= 3
+
+
+def test_finder_built_outside_a_browser_test_records_nothing(tmp_path):
+    budgets = WaitBudgets(str(tmp_path / "latency.sqlite3"))
+    text_only = {"text": BANNER["text"]}
+    finder = ElementFinder(FakeDriver({BANNER["text"][1]}), timeout=5, poll_frequency=0.01, use_strategy_cache=False)
+    finder.find("Welcome Banner", "Dashboard", text_only)
+    assert finder.wait_budgets is None and budgets.stats["observed"] == 0
+
+    activate(budgets)
+    try:
+        ElementFinder(FakeDriver({BANNER["text"][1]}), timeout=5, poll_frequency=0.01, use_strategy_cache=False).find(
+            "Welcome Banner", "Dashboard", text_only)
+    finally:
+        activate(None)
+    assert budgets.stats["observed"] == 1
+
+
+def test_drift_report_flags_elements_slower_than_their_baseline(tmp_path, monkeypatch):
+    budgets = WaitBudgets(str(tmp_path / "latency.sqlite3"), min_samples=5)
+    today = budgets._today()
+    for day, seconds in ((today - 6, 0.1), (today - 5, 0.1), (today, 0.45)):
+        monkeypatch.setattr(budgets, "_today", lambda day=day: day)
+        for _ in range(5):
+            budgets.observe("Dashboard", "Welcome Banner", "text", seconds)
+            budgets.observe("Dashboard", "Learn More Link", "data-testid", 0.1)
+        budgets.flush()
+    monkeypatch.setattr(budgets, "_today", lambda: today)
+
+    [row] = budgets.drift(threshold=1.5)
+    assert (row.element, row.strategy) == ("Welcome Banner", "text")
+    assert row.ratio > 3 and row.recent_samples == 5 and row.baseline_samples == 10
@@ -0,0 +1,199 @@
+# Filename: utils/archive_proxy.py
+# Description: Local HTTP(S) proxy that records the browser's traffic into an HttpArchive or replays it from one, so dashboard tests can run against a local portal stand-in.
+
+import logging
+import os
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+from utils.http_archive import HttpArchive, DROPPED_HEADERS
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+def proxy_mode(config):
+    """
+    TEST_ENV=REPLAY serves the archive; SELENIUM_HTTP_RECORD=true records while testing a real environment.
+    """
+    if config.env == "REPLAY":
+        return REPLAY
+    if config.get("SELENIUM_HTTP_RECORD", "false").lower() in ("1", "true"):
+        return RECORD
+    return None
+
+
+def ensure_certificate(directory):
+    """
+    Creates (once) the self-signed certificate used to terminate the browser's HTTPS tunnels.
+    The browser must be started with --ignore-certificate-errors.
+    """
+    cert = os.path.join(directory, "proxy_cert.pem")
+    key = os.path.join(directory, "proxy_key.pem")
+    if not (os.path.exists(cert) and os.path.exists(key)):
+        os.makedirs(directory, exist_ok=True)
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "825",
+             "-subj", "/CN=selenium-archive-proxy", "-keyout", key, "-out", cert],
+            check=True, capture_output=True,
+        )
+    return cert, key
+
+
+class _SocketWriter:
+    """Unbuffered writer over a (TLS) socket that never drops partial sends."""
+
+    closed = False
+
+    def __init__(self, sock):
+        self._sock = sock
+
+    def write(self, data):
+        self._sock.sendall(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    tunnel_host = None
+
+    def do_CONNECT(self):
+        host, _, port = self.path.partition(":")
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        # Terminate TLS here; the keep-alive loop in handle() then reads requests from the tunnel
+        self.connection = self.server.ssl_context.wrap_socket(self.connection, server_side=True)
+        self.rfile = self.connection.makefile("rb", self.rbufsize)
+        self.wfile = _SocketWriter(self.connection)
+        self.tunnel_host = host if port in ("", "443") else self.path
+        # Clients often send CONNECT as HTTP/1.0; the tunnel itself must stay open
+        self.close_connection = False
+
+    def _proxy(self):
+        url = f"https://{self.tunnel_host}{self.path}" if self.tunnel_host else self.path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server.proxy.respond(self.command, url, self.headers.items(), body)
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = do_HEAD = _proxy
+
+    def log_message(self, format, *args):
+        logger.debug("archive proxy: " + format % args)
+
+
+class ArchiveProxy:
+    """
+    Record mode forwards each request upstream and stores the exchange; replay mode answers from an
+    in-memory copy of the archive and reports requests it has no recording for.
+    """
+
+    def __init__(self, archive, mode, cert_dir, port=0):
+        self.archive = archive
+        self.mode = mode
+        self.missing = []
+        self.stats = {"served": 0, "recorded": 0, "missing": 0, "replay_seconds": 0.0, "slowest_replay": 0.0}
+        self._stats_lock = threading.Lock()
+        self._responses = archive.load() if mode == REPLAY else None
+        self._upstream = urllib3.PoolManager(retries=False, timeout=30, cert_reqs="CERT_REQUIRED") if mode == RECORD else None
+        cert, key = ensure_certificate(cert_dir)
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _ProxyHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self._server.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._server.ssl_context.load_cert_chain(cert, key)
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, config):
+        mode = proxy_mode(config)
+        if mode is None:
+            return None
+        archive = HttpArchive.from_env(config)
+        proxy = cls(archive, mode, config.cache_dir, int(config.get("SELENIUM_HTTP_PROXY_PORT", "0")))
+        logger.info(f"HTTP archive proxy in {mode} mode on {proxy.url} using {archive.path}")
+        return proxy
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="archive-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._upstream is not None:
+            self._upstream.clear()
+        self.archive.close()
+
+    def respond(self, method, url, headers, body):
+        if self.mode == REPLAY:
+            return self._replay(method, url, body)
+        return self._record(method, url, headers, body)
+
+    def _replay(self, method, url, body):
+        start = time.perf_counter()
+        response = self._responses.get(self.archive.key(method, url, body))
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            if response is None:
+                self.stats["missing"] += 1
+                self.missing.append(f"{method} {url}")
+            else:
+                self.stats["served"] += 1
+                self.stats["replay_seconds"] += elapsed
+                self.stats["slowest_replay"] = max(self.stats["slowest_replay"], elapsed)
+        if response is None:
+            logger.warning(f"Not in HTTP archive: {method} {url}")
+            return 404, [("Content-Type", "text/plain"), ("X-Archive-Missing", "1")], b"Not recorded in HTTP archive"
+        return response
+
+    def _record(self, method, url, headers, body):
+        forwarded = {name: value for name, value in headers if name.lower() not in DROPPED_HEADERS | {"host"}}
+        try:
+            upstream = self._upstream.request(method, url, body=body or None, headers=forwarded, redirect=False)
+        except urllib3.exceptions.HTTPError as e:
+            logger.warning(f"Upstream request failed while recording {method} {url}: {e}")
+            return 502, [("Content-Type", "text/plain")], str(e).encode()
+        response_headers = [(k, v) for k, v in upstream.headers.items() if k.lower() not in DROPPED_HEADERS]
+        self.archive.put(method, url, body, upstream.status, response_headers, upstream.data)
+        with self._stats_lock:
+            self.stats["recorded"] += 1
+        return upstream.status, response_headers, upstream.data
+
+    def summary(self):
+        if self.mode == RECORD:
+            archive = self.archive.stats()
+            return (
+                f"http archive: recorded {self.stats['recorded']} requests; archive holds {archive['exchanges']} exchanges, "
+                f"{archive['unique_bodies']} unique bodies, {archive['stored_bytes']} bytes"
+            )
+        average = self.stats["replay_seconds"] / self.stats["served"] * 1000 if self.stats["served"] else 0.0
+        return (
+            f"http archive: replayed {self.stats['served']} requests (avg {average:.3f} ms, "
+            f"max {self.stats['slowest_replay'] * 1000:.3f} ms lookup), {self.stats['missing']} missing"
+        )
@@ -0,0 +1,357 @@
+# Filename: utils/async_browser.py
+# Description: Asyncio Chrome DevTools Protocol client that runs many isolated browser contexts (own cookies and storage) inside one headless Chrome.
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+from urllib.request import urlopen
+
+import websocket
+from selenium.common.exceptions import WebDriverException
+
+from utils.browser_profiles import select_profile
+from utils.config_provider import ConfigProvider
+from utils.driver_factory import create_chrome_driver
+
+logger = logging.getLogger(__name__)
+
+# Page lifecycle event that ends a navigation, per browser profile page-load strategy
+_LOAD_EVENTS = {"normal": "Page.loadEventFired", "eager": "Page.domContentEventFired", "none": None}
+
+
+class CDPError(WebDriverException):
+    """A DevTools command failed or the connection to the browser was lost."""
+
+
+class CDPConnection:
+    """
+    One WebSocket to the browser endpoint, multiplexing every page session (flat session mode).
+    A reader thread resolves asyncio futures on the owning event loop, so coroutines waiting on
+    the browser cost nothing while idle.
+    """
+
+    def __init__(self, ws, loop):
+        self._ws = ws
+        self._loop = loop
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._waiters = []
+        self._closed = False
+        self._reader = threading.Thread(target=self._read, name="cdp-reader", daemon=True)
+        self._reader.start()
+
+    @classmethod
+    async def connect(cls, ws_url):
+        loop = asyncio.get_running_loop()
+        # Without an Origin header Chrome accepts the connection without --remote-allow-origins
+        ws = await loop.run_in_executor(None, lambda: websocket.create_connection(ws_url, suppress_origin=True))
+        return cls(ws, loop)
+
+    def _read(self):
+        while not self._closed:
+            try:
+                message = json.loads(self._ws.recv())
+            except (websocket.WebSocketException, OSError, ValueError) as e:
+                if not self._closed:
+                    logger.warning(f"DevTools connection lost: {e}")
+                    self._loop.call_soon_threadsafe(self._fail_all, CDPError(f"DevTools connection lost: {e}"))
+                return
+            self._loop.call_soon_threadsafe(self._dispatch, message)
+
+    def _dispatch(self, message):
+        if "id" in message:
+            future = self._pending.pop(message["id"], None)
+            if future is None or future.done():
+                return
+            if "error" in message:
+                future.set_exception(CDPError(f"{message['error'].get('message')} ({message['error'].get('code')})"))
+            else:
+                future.set_result(message.get("result", {}))
+            return
+        for waiter in list(self._waiters):
+            method, session_id, future = waiter
+            if message.get("method") == method and message.get("sessionId") == session_id:
+                self._waiters.remove(waiter)
+                if not future.done():
+                    future.set_result(message.get("params", {}))
+
+    def _fail_all(self, error):
+        for future in list(self._pending.values()) + [waiter[2] for waiter in self._waiters]:
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        self._waiters.clear()
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        if self._closed:
+            raise CDPError("DevTools connection is closed.")
+        message_id = next(self._ids)
+        future = self._loop.create_future()
+        self._pending[message_id] = future
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        # The socket write blocks, so it runs off the event loop (websocket-client serializes frames itself)
+        try:
+            await self._loop.run_in_executor(None, self._ws.send, json.dumps(message))
+        except (websocket.WebSocketException, OSError) as e:
+            self._pending.pop(message_id, None)
+            raise CDPError(f"{method} could not be sent: {e}") from None
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(message_id, None)
+            raise CDPError(f"{method} timed out after {timeout}s") from None
+
+    def expect_event(self, method, session_id=None):
+        """
+        Registers interest in the next `method` event before the command that triggers it is sent.
+        Returns a future resolving to the event params.
+        """
+        future = self._loop.create_future()
+        self._waiters.append((method, session_id, future))
+        return future
+
+    def discard(self, future):
+        """
+        Drops an expect_event() registration whose event will no longer be awaited (a no-op once it fired).
+        """
+        self._waiters = [waiter for waiter in self._waiters if waiter[2] is not future]
+        future.cancel()
+
+    async def close(self):
+        self._closed = True
+        await self._loop.run_in_executor(None, self._ws.close)
+
+
+class AsyncBrowser:
+    """
+    One headless Chrome, started through the regular driver factory (same options, profile and proxy),
+    driven over CDP. Each new_page() call opens an isolated browser context.
+    """
+
+    def __init__(self, connection, driver=None, profile=None):
+        self.connection = connection
+        self.driver = driver
+        self.profile = profile
+        self.pages = []
+
+    @classmethod
+    async def launch(cls, config=None, proxy_url=None):
+        config = config or ConfigProvider()
+        profile = select_profile(config)
+        loop = asyncio.get_running_loop()
+        driver = await loop.run_in_executor(None, lambda: create_chrome_driver(config, proxy_url=proxy_url, profile=profile))
+        try:
+            address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+            version = await loop.run_in_executor(None, lambda: json.load(urlopen(f"http://{address}/json/version", timeout=10)))
+            connection = await CDPConnection.connect(version["webSocketDebuggerUrl"])
+        except Exception:
+            driver.quit()
+            raise
+        logger.info(f"Async browser connected to {version.get('Browser')} at {address}")
+        return cls(connection, driver, profile)
+
+    async def new_page(self):
+        """
+        Opens a tab in a fresh browser context: cookies, storage and cache are not shared with other pages.
+        """
+        context = await self.connection.send("Target.createBrowserContext", {"disposeOnDetach": True})
+        context_id = context["browserContextId"]
+        target = await self.connection.send("Target.createTarget", {"url": "about:blank", "browserContextId": context_id})
+        attached = await self.connection.send("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        page = AsyncPage(self, context_id, target["targetId"], attached["sessionId"])
+        await page.send("Page.enable")
+        await page.send("Runtime.enable")
+        if self.profile is not None:
+            await page.send("Network.enable")
+            if self.profile.blocked_urls:
+                await page.send("Network.setBlockedURLs", {"urls": list(self.profile.blocked_urls)})
+            await page.send("Network.setCacheDisabled", {"cacheDisabled": self.profile.cache_disabled})
+        self.pages.append(page)
+        return page
+
+    def rss_bytes(self):
+        """
+        Resident memory of the browser process tree (Linux only; None elsewhere).
+        """
+        if self.driver is None or not os.path.isdir("/proc"):
+            return None
+        service = getattr(self.driver, "service", None)
+        root = getattr(getattr(service, "process", None), "pid", None)
+        if root is None:
+            return None
+        return _tree_rss(root)
+
+    async def close(self):
+        for page in list(self.pages):
+            await page.close()
+        await self.connection.close()
+        if self.driver is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.driver.quit)
+
+
+def _tree_rss(root):
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as handle:
+                    parents[int(entry)] = int(handle.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    tree, frontier = {root}, [root]
+    while frontier:
+        pid = frontier.pop()
+        children = [child for child, parent in parents.items() if parent == pid]
+        tree.update(children)
+        frontier.extend(children)
+    total = 0
+    for pid in tree:
+        try:
+            with open(f"/proc/{pid}/status") as handle:
+                for line in handle:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return total
+
+
+class AsyncPage:
+    """
+    A tab inside its own browser context, addressed through a flat CDP session.
+    """
+
+    # Remote objects handed to AsyncElements live in this group until release_handles() or the next goto()
+    OBJECT_GROUP = "finder"
+
+    def __init__(self, browser, context_id, target_id, session_id):
+        self.browser = browser
+        self.context_id = context_id
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None, timeout=30):
+        return await self.browser.connection.send(method, params, self.session_id, timeout)
+
+    async def goto(self, url, timeout=30):
+        """
+        Navigates and waits for the load event the browser profile's page-load strategy asks for.
+        Element handles from the previous document are released first.
+        Raises CDPError when the navigation fails or the load event does not arrive within timeout.
+        """
+        await self.release_handles()
+        strategy = self.browser.profile.page_load_strategy if self.browser.profile else "normal"
+        event = _LOAD_EVENTS.get(strategy)
+        connection = self.browser.connection
+        loaded = connection.expect_event(event, self.session_id) if event else None
+        try:
+            result = await self.send("Page.navigate", {"url": url}, timeout)
+            if result.get("errorText"):
+                raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+            if loaded is not None and result.get("loaderId"):
+                await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            raise CDPError(f"Navigation to {url}: {event} not received within {timeout}s") from None
+        finally:
+            if loaded is not None:
+                connection.discard(loaded)
+
+    async def evaluate(self, expression, by_value=True):
+        """
+        Evaluates an expression in the page, awaiting promises. Returns the value, or the remote object
+        description (with objectId) when by_value is False.
+        """
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression, "returnByValue": by_value, "awaitPromise": True, "objectGroup": self.OBJECT_GROUP,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise CDPError(f"Script error: {details.get('exception', {}).get('description') or details.get('text')}")
+        return result["result"].get("value") if by_value else result["result"]
+
+    async def call(self, object_id, function_declaration, *args, by_value=True):
+        result = await self.send("Runtime.callFunctionOn", {
+            "objectId": object_id, "functionDeclaration": function_declaration,
+            "arguments": [{"value": arg} for arg in args], "returnByValue": by_value, "awaitPromise": True,
+        })
+        if "exceptionDetails" in result:
+            raise CDPError(f"Script error: {result['exceptionDetails'].get('text')}")
+        return result["result"].get("value") if by_value else result["result"]
+
+    async def properties(self, object_id):
+        result = await self.send("Runtime.getProperties", {"objectId": object_id, "ownProperties": True})
+        return {prop["name"]: prop.get("value", {}) for prop in result["result"]}
+
+    async def release(self, object_id):
+        await self.send("Runtime.releaseObject", {"objectId": object_id})
+
+    async def release_handles(self):
+        """
+        Releases every remote object this page handed out; AsyncElements found earlier become unusable.
+        """
+        await self.send("Runtime.releaseObjectGroup", {"objectGroup": self.OBJECT_GROUP})
+
+    async def current_url(self):
+        return await self.evaluate("window.location.href")
+
+    async def cookies(self):
+        result = await self.browser.connection.send("Storage.getCookies", {"browserContextId": self.context_id})
+        return result["cookies"]
+
+    async def set_cookies(self, cookies):
+        await self.browser.connection.send("Storage.setCookies", {"cookies": cookies, "browserContextId": self.context_id})
+
+    async def add_init_script(self, source):
+        result = await self.send("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        return result["identifier"]
+
+    async def remove_init_script(self, identifier):
+        await self.send("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+
+    async def close(self):
+        if self in self.browser.pages:
+            self.browser.pages.remove(self)
+        try:
+            await self.browser.connection.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        except CDPError as e:
+            logger.debug(f"Ignoring error while disposing browser context: {e}")
+
+
+class AsyncElement:
+    """
+    Handle to a DOM node in an AsyncPage (a CDP remote object), with the strategy that resolved it.
+    """
+
+    def __init__(self, page, object_id, strategy=None, visible=None):
+        self.page = page
+        self.object_id = object_id
+        self.strategy = strategy
+        self.visible = visible
+
+    async def click(self):
+        # DOM click after scrolling into view, the equivalent of WebElement.click for links and buttons
+        await self.page.call(self.object_id, "function () { this.scrollIntoView({block: 'center'}); this.click(); }")
+
+    async def text(self):
+        return await self.page.call(self.object_id, "function () { return (this.innerText || '').trim(); }")
+
+    async def get_attribute(self, name):
+        return await self.page.call(self.object_id, "function (name) { return this.getAttribute(name); }", name)
+
+    async def type(self, value):
+        # Goes through the prototype's native value setter: frameworks that track inputs (React, Vue) shadow
+        # the instance property and would otherwise ignore the change
+        await self.page.call(
+            self.object_id,
+            "function (value) { this.focus();"
+            " var proto = this instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;"
+            " Object.getOwnPropertyDescriptor(proto, 'value').set.call(this, value);"
+            " this.dispatchEvent(new Event('input', {bubbles: true}));"
+            " this.dispatchEvent(new Event('change', {bubbles: true})); }",
+            value,
+        )
@@ -0,0 +1,120 @@
+# Filename: utils/async_element_finder.py
+# Description: Asyncio counterpart of ElementFinder for AsyncPage sessions; waits yield to the event loop so many flows can share one browser.
+
+import asyncio
+import json
+import logging
+import time
+from selenium.common.exceptions import NoSuchElementException
+from utils.async_browser import AsyncElement
+from utils.locator_race import SCRIPT_HELPERS, script_groups, PRESENT, VISIBLE, CLICKABLE
+
+logger = logging.getLogger(__name__)
+
+# Per element: the first strategy meeting the condition and what callers usually ask next, by value
+DESCRIBE_EXPRESSION = "(function (groups, condition) {" + SCRIPT_HELPERS + """
+return groups.map(function (locators) {
+    var found = describe(firstMatch(locators, condition));
+    if (found) { delete found.element; }
+    return found;
+});
+})(%s, %s)"""
+
+# Same lookup returning the nodes themselves, fetched once a poll has found every element
+HANDLES_EXPRESSION = "(function (groups, condition) {" + SCRIPT_HELPERS + """
+return groups.map(function (locators) { var match = firstMatch(locators, condition); return match ? match[1] : null; });
+})(%s, %s)"""
+
+
+class AsyncElementFinder:
+    """
+    Layered-fallback lookups with the same priority order and results as ElementFinder, evaluated in
+    one script call per poll. Between polls the coroutine sleeps, so other flows run meanwhile.
+    """
+
+    def __init__(self, page, timeout=10, poll_frequency=0.5):
+        self.page = page
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+    async def _poll(self, named_locators, condition):
+        entries, groups = script_groups(named_locators)
+        args = (json.dumps(groups), json.dumps(condition))
+        deadline = time.monotonic() + self.timeout
+        while True:
+            found = await self.page.evaluate(DESCRIBE_EXPRESSION % args)
+            if all(found):
+                handles = await self.page.evaluate(HANDLES_EXPRESSION % args, by_value=False)
+                nodes = await self.page.properties(handles["objectId"])
+                # Only the nodes are kept; they stay in the page's object group
+                await self.page.release(handles["objectId"])
+                results = {}
+                for i, (name, strategies) in enumerate(entries.items()):
+                    node = nodes.get(str(i), {})
+                    if node.get("subtype") != "node":
+                        break
+                    description = found[i]
+                    results[name] = {
+                        "strategy": strategies[description["index"]][0],
+                        "element": AsyncElement(self.page, node["objectId"], strategies[description["index"]][0], description["visible"]),
+                        "visible": description["visible"],
+                        "href": description["href"],
+                        "target": description["target"],
+                    }
+                else:
+                    return results, []
+            if time.monotonic() >= deadline:
+                return None, [name for name, description in zip(entries, found) if description is None] or list(entries)
+            await asyncio.sleep(self.poll_frequency)
+
+    async def _locate(self, element_name, page_name, locator_dict, condition):
+        results, _ = await self._poll({element_name: locator_dict}, condition)
+        if results is None:
+            kind = "Clickable element" if condition == CLICKABLE else "Element"
+            error_msg = (
+                f"{kind} '{element_name}' not found on page '{page_name}'. URL: {await self.page.current_url()}. "
+                f"Tried strategies: {list(locator_dict.keys())}"
+            )
+            logger.error(error_msg)
+            raise NoSuchElementException(error_msg)
+        result = results[element_name]
+        logger.info(f"[{page_name}] Found '{element_name}' using {result['strategy']} locator.")
+        return result["element"]
+
+    async def find(self, element_name, page_name, locator_dict):
+        return await self._locate(element_name, page_name, locator_dict, PRESENT)
+
+    async def find_clickable(self, element_name, page_name, locator_dict):
+        return await self._locate(element_name, page_name, locator_dict, CLICKABLE)
+
+    async def _resolve_many(self, page_name, named_locators, condition):
+        results, missing = await self._poll(named_locators, condition)
+        if results is None:
+            error_msg = (
+                f"{len(missing)} of {len(named_locators)} elements not {condition} on page '{page_name}'. "
+                f"URL: {await self.page.current_url()}. Missing: {missing}"
+            )
+            logger.error(error_msg)
+            return None, error_msg
+        found = ", ".join(f"'{name}' via {r['strategy']}" for name, r in results.items())
+        logger.info(f"[{page_name}] Found {found}.")
+        return results, None
+
+    async def find_many(self, page_name, named_locators, condition=PRESENT):
+        """
+        Returns {element_name: {'strategy', 'element', 'visible', 'href', 'target'}}; raises
+        NoSuchElementException naming every miss.
+        """
+        results, error_msg = await self._resolve_many(page_name, named_locators, condition)
+        if error_msg:
+            raise NoSuchElementException(error_msg)
+        return results
+
+    async def assert_all_visible(self, page_name, named_locators):
+        results, error_msg = await self._resolve_many(page_name, named_locators, VISIBLE)
+        assert not error_msg, error_msg
+        return results
+
+    async def read_links(self, page_name, named_locators):
+        results = await self.find_many(page_name, named_locators, PRESENT)
+        return {name: {"strategy": r["strategy"], "href": r["href"], "target": r["target"]} for name, r in results.items()}
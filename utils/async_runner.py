@@ -0,0 +1,93 @@
+# Filename: utils/async_runner.py
+# Description: Runs many dashboard flows concurrently in isolated contexts of one headless Chrome and reports timing and browser memory.
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.async_dashboard_page import AsyncDashboardPage
+from pages.async_login_page import AsyncLoginPage
+from utils.async_browser import AsyncBrowser
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+FlowResult = namedtuple("FlowResult", "name passed error seconds")
+
+
+async def run_flows(browser, flows, concurrency=4):
+    """
+    Runs (name, coroutine function) flows, each on a fresh page in its own browser context,
+    at most `concurrency` at a time. Returns a FlowResult per flow in input order.
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(name, flow):
+        async with slots:
+            page = None
+            start = time.perf_counter()
+            try:
+                # A context that fails to open fails only its own flow
+                page = await browser.new_page()
+                await flow(page)
+                return FlowResult(name, True, None, time.perf_counter() - start)
+            except (AssertionError, WebDriverException) as e:
+                logger.error(f"Flow '{name}' failed: {e}")
+                return FlowResult(name, False, str(e), time.perf_counter() - start)
+            finally:
+                if page is not None:
+                    await page.close()
+
+    return await asyncio.gather(*(run(name, flow) for name, flow in flows))
+
+
+async def dashboard_smoke(page, config=None):
+    """
+    Signs in and checks the dashboard smoke elements and link targets, like the synchronous suite.
+    """
+    await AsyncLoginPage(page).sign_in(config)
+    dashboard = AsyncDashboardPage(page)
+    await dashboard.assert_dashboard_visible()
+    await dashboard.get_link_targets()
+
+
+async def _main(flows, concurrency, config):
+    browser = await AsyncBrowser.launch(config)
+    try:
+        start = time.perf_counter()
+        results = await run_flows(
+            browser, [(f"dashboard-{i}", lambda page: dashboard_smoke(page, config)) for i in range(flows)], concurrency
+        )
+        elapsed = time.perf_counter() - start
+        rss = browser.rss_bytes()
+    finally:
+        await browser.close()
+    for result in results:
+        status = "passed" if result.passed else f"FAILED: {result.error}"
+        print(f"  {result.name}: {result.seconds:.1f}s {status}")
+    memory = f", browser RSS {rss / 2**20:.0f} MiB" if rss else ""
+    print(f"{sum(r.passed for r in results)}/{len(results)} flows passed in {elapsed:.1f}s with concurrency {concurrency}{memory}")
+    return 0 if all(r.passed for r in results) else 1
+
+
+def main(argv=None):
+    """
+    Usage: python -m utils.async_runner [--flows 8] [--concurrency 4]
+    """
+    config = ConfigProvider()
+    parser = argparse.ArgumentParser(prog="python -m utils.async_runner", description=main.__doc__)
+    parser.add_argument("--flows", type=int, default=int(config.get("SELENIUM_ASYNC_FLOWS", "8")))
+    parser.add_argument("--concurrency", type=int, default=int(config.get("SELENIUM_ASYNC_CONCURRENCY", "4")))
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    return asyncio.run(_main(args.flows, args.concurrency, config))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    sys.exit(main())
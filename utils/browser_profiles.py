@@ -0,0 +1,179 @@
+# Filename: utils/browser_profiles.py
+# Description: Named browser profiles (page-load strategy, CDP URL blocklist, Chrome switches, cache policy) chosen per environment, and a meter of the requests and bytes they save.
+
+import json
+import logging
+import os
+from collections import namedtuple
+from urllib.parse import urlsplit, urlunsplit
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# cache_disabled turns the HTTP cache off for the session; perf_log enables the network log ProfileMeter reads
+BrowserProfile = namedtuple("BrowserProfile", "name page_load_strategy blocked_urls arguments cache_disabled perf_log")
+
+# Resources no dashboard assertion depends on. Patterns use the CDP Network.setBlockedURLs wildcard syntax.
+IMAGE_PATTERNS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico")
+FONT_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+MEDIA_PATTERNS = ("*.mp4", "*.webm", "*.mp3", "*.m3u8")
+ANALYTICS_PATTERNS = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*adobedtm.com*",
+    "*demdex.net*", "*omtrdc.net*", "*hotjar.com*", "*optimizely.com*", "*nr-data.net*",
+    "*newrelic.com*", "*qualtrics.com*", "*facebook.net*",
+)
+
+QUIET_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--metrics-recording-only",
+)
+
+PROFILES = {
+    # Chrome defaults: full page loads, nothing blocked, no network log overhead
+    "standard": BrowserProfile("standard", "normal", (), (), False, False),
+    # Full page loads with the HTTP cache off: every resource crosses the network, so the meter records the
+    # real sizes that savings of the blocking profiles are estimated from
+    "cold": BrowserProfile("cold", "normal", (), (), True, True),
+    # DOMContentLoaded is enough for the explicit waits in ElementFinder; the cache serves repeat assets
+    "lean": BrowserProfile(
+        "lean", "eager", ANALYTICS_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + IMAGE_PATTERNS, QUIET_ARGUMENTS, False, True
+    ),
+    # Navigation returns immediately; every page object must wait for what it uses
+    "minimal": BrowserProfile(
+        "minimal", "none", ANALYTICS_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + IMAGE_PATTERNS,
+        QUIET_ARGUMENTS + ("--blink-settings=imagesEnabled=false",), False, True,
+    ),
+}
+
+
+def select_profile(config):
+    """
+    Resolves the active profile: SELENIUM_BROWSER_PROFILE_<TEST_ENV>, then SELENIUM_BROWSER_PROFILE, then 'standard'.
+    SELENIUM_BLOCKED_URLS (comma separated) adds patterns to whichever profile is chosen.
+    """
+    name = config.get(f"SELENIUM_BROWSER_PROFILE_{config.env}") or config.get("SELENIUM_BROWSER_PROFILE") or "standard"
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{name}'. Available profiles: {sorted(PROFILES)}")
+    profile = PROFILES[name]
+    extra = config.get("SELENIUM_BLOCKED_URLS")
+    if extra:
+        profile = profile._replace(blocked_urls=profile.blocked_urls + tuple(p.strip() for p in extra.split(",") if p.strip()))
+    return profile
+
+
+def apply_options(profile, options):
+    """
+    Applies the launch-time part of a profile to ChromeOptions, including the network performance log
+    read by ProfileMeter for profiles that enable it.
+    """
+    options.page_load_strategy = profile.page_load_strategy
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    if profile.perf_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    return options
+
+
+def apply_network(profile, driver):
+    """
+    Applies the CDP part of a profile (URL blocklist, cache policy) to a running session.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    if profile.blocked_urls:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": profile.cache_disabled})
+
+
+def _resource_key(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+class ProfileMeter:
+    """
+    Tallies requests, transferred bytes and blocked requests from the Chrome network performance log.
+    Bytes saved are estimated from the sizes of the same resources seen in earlier unblocked runs,
+    kept in a small JSON table (sizes_path) that every run updates.
+    """
+
+    def __init__(self, profile, sizes_path=None):
+        self.profile = profile
+        self.sizes_path = sizes_path
+        self.sizes = {}
+        if sizes_path and os.path.exists(sizes_path):
+            try:
+                with open(sizes_path) as handle:
+                    self.sizes = json.load(handle)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable resource size table {sizes_path}: {e}")
+        self.stats = {"requests": 0, "bytes": 0, "cached": 0, "blocked": 0, "blocked_bytes": 0, "blocked_unknown": 0}
+
+    def collect(self, driver):
+        """
+        Drains the session's performance log and adds its network events to the totals.
+        """
+        if not self.profile.perf_log:
+            return
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug(f"Performance log unavailable: {e.msg}")
+            return
+        urls = {}
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+                self.stats["requests"] += 1
+            elif method == "Network.requestServedFromCache":
+                self.stats["cached"] += 1
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                self.stats["bytes"] += size
+                url = urls.get(params["requestId"])
+                if url and size:
+                    self.sizes[_resource_key(url)] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                self.stats["blocked"] += 1
+                known = self.sizes.get(_resource_key(urls.get(params["requestId"], "")))
+                if known is None:
+                    self.stats["blocked_unknown"] += 1
+                else:
+                    self.stats["blocked_bytes"] += known
+
+    def save(self):
+        if not self.sizes_path:
+            return
+        directory = os.path.dirname(self.sizes_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.sizes_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as handle:
+            json.dump(self.sizes, handle)
+        os.replace(temp_path, self.sizes_path)
+
+    def summary(self):
+        if not self.profile.perf_log:
+            return f"browser profile '{self.profile.name}' (pageLoadStrategy={self.profile.page_load_strategy}): network meter off"
+        stats = self.stats
+        line = (
+            f"browser profile '{self.profile.name}' (pageLoadStrategy={self.profile.page_load_strategy}): "
+            f"{stats['requests']} requests, {stats['bytes']} bytes transferred, {stats['cached']} from cache; "
+            f"saved {stats['blocked']} blocked requests, ~{stats['blocked_bytes']} bytes"
+        )
+        if stats["blocked_unknown"]:
+            line += f" ({stats['blocked_unknown']} blocked resources never seen unblocked)"
+        return line
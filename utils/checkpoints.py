@@ -0,0 +1,188 @@
+# Filename: utils/checkpoints.py
+# Description: Step-level checkpoints for long linear tests: each completed step saves the browser state needed to resume, so a flaky step is retried from the last good checkpoint instead of rerunning the whole test.
+
+import json
+import logging
+import os
+import re
+import time
+from utils.config_provider import ConfigProvider
+from utils.event_log import record_event
+from utils.session_state import capture_session_state, restore_session_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 1800
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_")
+
+
+class CheckpointStore:
+    """
+    Per-test checkpoint files shared by the in-process retries of a session and by later reruns.
+    Args:
+        directory (str): Where <test>.json checkpoint files are kept.
+        retries (int): In-process retries of a failing step, each starting from the previous checkpoint.
+        resume (bool): Whether a rerun of a failed test skips the steps it already completed.
+        ttl (float): Seconds a saved checkpoint stays usable (bounded by the login session lifetime).
+    """
+
+    def __init__(self, directory, retries=1, resume=True, ttl=DEFAULT_TTL_SECONDS):
+        self.directory = directory
+        self.retries = retries
+        self.resume = resume
+        self.ttl = ttl
+        self.stats = {"steps": 0, "retried": 0, "skipped": 0, "resumed": 0, "saved_seconds": 0.0}
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls, config=None):
+        config = config or ConfigProvider()
+        return cls(
+            os.path.join(config.cache_dir, "checkpoints", config.env.lower()),
+            retries=int(config.get("SELENIUM_STEP_RETRIES", "1")),
+            resume=config.get("SELENIUM_CHECKPOINT_RESUME", "true").lower() not in ("0", "false", "off"),
+            ttl=float(config.get("SELENIUM_CHECKPOINT_TTL", DEFAULT_TTL_SECONDS)),
+        )
+
+    def path_for(self, test_id):
+        return os.path.join(self.directory, _slug(test_id) + ".json")
+
+    def load(self, test_id):
+        """
+        Returns the checkpoints a previous run of test_id saved before its failing step, or [] if none are usable.
+        """
+        try:
+            with open(self.path_for(test_id)) as handle:
+                saved = json.load(handle)
+        except (OSError, ValueError):
+            return []
+        # Only a step that raised leaves a resume point; anything else is not resumable
+        if not isinstance(saved, dict) or not saved.get("failed_step"):
+            return []
+        checkpoints = saved.get("checkpoints") or []
+        if not checkpoints or time.time() - checkpoints[-1]["state"]["captured_at"] > self.ttl:
+            return []
+        return checkpoints
+
+    def save(self, test_id, checkpoints, failed_step):
+        path = self.path_for(test_id)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as handle:
+            json.dump({"failed_step": failed_step, "checkpoints": checkpoints}, handle)
+        os.replace(tmp_path, path)
+
+    def clear(self, test_id):
+        try:
+            os.remove(self.path_for(test_id))
+        except FileNotFoundError:
+            pass
+
+    def runner(self, driver, test_id):
+        return StepRunner(self, driver, test_id)
+
+    def summary(self):
+        stats = self.stats
+        return (
+            f"checkpoints: {stats['steps']} steps, {stats['retried']} retried from a checkpoint, "
+            f"{stats['skipped']} skipped in {stats['resumed']} resumed tests; ~{stats['saved_seconds']:.1f}s of reruns saved"
+        )
+
+
+class StepRunner:
+    """
+    Runs a test's named steps in order, saving a checkpoint (URL, cookies, storage) after each one.
+    - A step that raises is retried up to store.retries times from the previous checkpoint.
+    - When a step of a previous run raised, the steps before it are skipped and the browser state of the
+      last one is restored before the first step that still has to run. A test that failed outside its
+      steps keeps no checkpoints.
+    Steps communicate through browser state only: a skipped step returns None.
+    """
+
+    def __init__(self, store, driver, test_id):
+        self.store = store
+        self.driver = driver
+        self.test_id = test_id
+        self.checkpoints = []
+        self._saved = store.load(test_id) if store.resume else []
+        self._index = 0
+        self._executed = 0
+        self._failed_index = None
+        self._failed_step = None
+        self._offset = 0.0
+        self._started = time.perf_counter()
+
+    def _elapsed(self):
+        # Time a from-scratch run needs to reach the current point
+        return self._offset + time.perf_counter() - self._started
+
+    def _restore(self, checkpoint):
+        # A step that failed halfway may have left popups open; checkpoints describe the main window
+        handles = getattr(self.driver, "window_handles", None) or []
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        if len(handles) > 1:
+            self.driver.switch_to.window(handles[0])
+        state = checkpoint["state"]
+        restore_session_state(self.driver, state, state["url"])
+        self.store.stats["saved_seconds"] += checkpoint["elapsed"]
+        self._offset = checkpoint["elapsed"]
+        self._started = time.perf_counter()
+
+    def run(self, name, func, *args, **kwargs):
+        """
+        Runs func(*args, **kwargs) as step name and checkpoints the browser afterwards.
+        Returns func's result, or None when the step is skipped on resume.
+        """
+        index = self._index
+        self._index += 1
+        if self._saved:
+            if index < len(self._saved) and self._saved[index]["name"] == name:
+                self.checkpoints.append(self._saved[index])
+                self.store.stats["skipped"] += 1
+                record_event("step_skipped", step=name)
+                logger.info(f"[Step] '{name}' completed in a previous run; skipped.")
+                return None
+            if self.checkpoints:
+                logger.info(f"[Step] Resuming {self.test_id} at '{name}' from checkpoint '{self.checkpoints[-1]['name']}'.")
+                self.store.stats["resumed"] += 1
+                self._restore(self.checkpoints[-1])
+            self._saved = []
+        self.store.stats["steps"] += 1
+        self._executed += 1
+        for attempt in range(self.store.retries + 1):
+            try:
+                result = func(*args, **kwargs)
+                break
+            except Exception as e:
+                if attempt == self.store.retries:
+                    self._failed_index, self._failed_step = index, name
+                    raise
+                self.store.stats["retried"] += 1
+                record_event("step_retried", step=name, error=str(e)[:200])
+                logger.warning(f"[Step] '{name}' failed ({type(e).__name__}); retrying from the previous checkpoint.")
+                if self.checkpoints:
+                    self._restore(self.checkpoints[-1])
+        checkpoint = {"name": name, "elapsed": self._elapsed(), "state": capture_session_state(self.driver)}
+        self.checkpoints.append(checkpoint)
+        record_event("step", step=name, elapsed=checkpoint["elapsed"] * 1000)
+        return result
+
+    @property
+    def skipped_every_step(self):
+        """
+        True when a resumed run skipped steps but executed none, i.e. it never reached the step that failed.
+        """
+        return bool(self.checkpoints) and not self._executed
+
+    def finish(self, outcome):
+        """
+        Keeps the checkpoints before the failing step of a failed test for its rerun and discards them otherwise.
+        """
+        if outcome == "failed" and self._failed_index:
+            self.store.save(self.test_id, self.checkpoints[:self._failed_index], self._failed_step)
+        else:
+            self.store.clear(self.test_id)
@@ -0,0 +1,119 @@
+# Filename: utils/command_profiler.py
+# Description: Records every WebDriver command a test sends (name, latency, originating page object or ElementFinder call) and summarizes round trips per test.
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LIBRARY_DIRS = tuple(os.path.join(_REPO_ROOT, name) + os.sep for name in ("pages", "utils"))
+_TESTS_DIR = os.path.join(_REPO_ROOT, "tests") + os.sep
+
+
+def _caller():
+    """
+    Attributes a command to the outermost page object / utility frame, else to the outermost test frame.
+    """
+    frame = sys._getframe(2)
+    library_frame = test_frame = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_LIBRARY_DIRS) and filename != __file__:
+            library_frame = frame
+        elif filename.startswith(_TESTS_DIR):
+            test_frame = frame
+        frame = frame.f_back
+    frame = library_frame or test_frame
+    if frame is None:
+        return "<framework>"
+    name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+    return f"{os.path.relpath(frame.f_code.co_filename, _REPO_ROOT)}:{name}"
+
+
+class CommandProfiler:
+    """
+    Wraps a driver's command executor and collects per-test command records.
+    Commands sent outside begin()/end() (e.g. pool resets) are not attributed to any test.
+    """
+
+    def __init__(self, slowest=5):
+        self.slowest = slowest
+        self.summaries = []
+        self._records = None
+        self._test_id = None
+
+    def attach(self, driver):
+        executor = driver.command_executor
+        if getattr(executor, "_command_profiler", None) is self:
+            return
+        original = executor.execute
+
+        def execute(command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                if self._records is not None:
+                    self._records.append((command, time.perf_counter() - start, _caller()))
+
+        executor.execute = execute
+        executor._command_profiler = self
+
+    def begin(self, test_id):
+        self._test_id = test_id
+        self._records = []
+
+    @property
+    def command_count(self):
+        return len(self._records or ())
+
+    def recent(self, limit=50):
+        """
+        The current test's last commands, oldest first, for failure artifacts.
+        """
+        return [
+            {"command": command, "ms": round(elapsed * 1000, 1), "caller": caller}
+            for command, elapsed, caller in (self._records or [])[-limit:]
+        ]
+
+    def end(self):
+        """
+        Stops recording for the current test and returns its summary.
+        """
+        records, self._records = self._records or [], None
+        by_command = {}
+        for command, elapsed, _ in records:
+            entry = by_command.setdefault(command, {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed * 1000
+        slowest = sorted(records, key=lambda record: record[1], reverse=True)[:self.slowest]
+        summary = {
+            "test": self._test_id,
+            "commands": len(records),
+            "total_ms": round(sum(elapsed for _, elapsed, _ in records) * 1000, 1),
+            "by_command": {name: {"count": e["count"], "total_ms": round(e["total_ms"], 1)} for name, e in by_command.items()},
+            "by_caller": dict(Counter(caller for _, _, caller in records).most_common()),
+            "slowest": [
+                {"command": command, "ms": round(elapsed * 1000, 1), "caller": caller}
+                for command, elapsed, caller in slowest
+            ],
+        }
+        self.summaries.append(summary)
+        return summary
+
+    def report_lines(self):
+        lines = []
+        for summary in self.summaries:
+            lines.append(f"{summary['test']}: {summary['commands']} commands, {summary['total_ms']} ms")
+            for slow in summary["slowest"]:
+                lines.append(f"    {slow['ms']:>8} ms  {slow['command']:<24} {slow['caller']}")
+        return lines
+
+    def write_json(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as handle:
+            json.dump(self.summaries, handle, indent=2)
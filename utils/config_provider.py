@@ -22,4 +22,16 @@ class ConfigProvider:
 
     @property
     def password(self):
-        return self.get('PASSWORD')
\ No newline at end of file
+        return self.get('PASSWORD')
+
+    @property
+    def cache_dir(self):
+        return self.get('SELENIUM_CACHE_DIR', '.selenium_cache')
+
+    @property
+    def env(self):
+        return self.get('TEST_ENV', 'PIE').upper()
+
+    @property
+    def artifacts_dir(self):
+        return self.get('SELENIUM_ARTIFACTS_DIR', 'artifacts')
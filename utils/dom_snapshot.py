@@ -0,0 +1,268 @@
+# Filename: utils/dom_snapshot.py
+# Description: Records DOM snapshots during normal runs and evaluates (By, selector) locators against them in-process, so locator changes can be checked without a browser.
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+from urllib.parse import urlsplit
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from utils.config_provider import ConfigProvider
+from utils.locator_race import SCRIPT_HELPERS, to_script_locator, PRESENT, VISIBLE, CLICKABLE
+
+try:
+    import lxml.html
+    from cssselect import GenericTranslator, SelectorError
+except ImportError:  # pragma: no cover - offline evaluation is optional
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+HIDDEN_ATTRIBUTE = "data-offline-hidden"
+
+# Visibility cannot be computed without a layout engine, so it is frozen into the snapshot at record time.
+# The window flag limits recording to once per document; a navigation starts a fresh window object.
+CAPTURE_SCRIPT = SCRIPT_HELPERS + """
+if (window.__offlineSnapshotTaken) { return null; }
+window.__offlineSnapshotTaken = true;
+var live = document.documentElement, clone = live.cloneNode(true);
+var liveEls = live.getElementsByTagName('*'), cloneEls = clone.getElementsByTagName('*');
+for (var i = 0; i < liveEls.length; i++) {
+    if (!isVisible(liveEls[i])) { cloneEls[i].setAttribute('%s', '1'); }
+}
+var scripts = clone.getElementsByTagName('script');
+for (var j = scripts.length - 1; j >= 0; j--) { scripts[j].parentNode.removeChild(scripts[j]); }
+return {url: window.location.href, title: document.title, html: clone.outerHTML};
+""" % HIDDEN_ATTRIBUTE
+
+_META = re.compile(r"^<!-- snapshot: (.*?) -->\n")
+
+
+def _slug(page_name):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", page_name).strip("_")
+
+
+def snapshot_filename(page_name, url):
+    """
+    <page>__<url path>.html: a page object spanning several URLs keeps one snapshot per URL.
+    """
+    return f"{_slug(page_name)}__{_slug(urlsplit(url).path) or 'root'}.html"
+
+
+class SnapshotRecorder:
+    """
+    Saves the DOM of each document the finder resolves elements in as <directory>/<page>__<path>.html,
+    once per document; a later document at the same path replaces the older snapshot.
+    Enabled in ElementFinder by setting SELENIUM_RECORD_SNAPSHOTS to the target directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        directory = ConfigProvider().get("SELENIUM_RECORD_SNAPSHOTS")
+        return cls(directory) if directory else None
+
+    def record(self, driver, page_name):
+        try:
+            captured = driver.execute_script(CAPTURE_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"[{page_name}] Snapshot capture failed: {e.msg}")
+            return None
+        if captured is None:
+            # This document was already recorded
+            return None
+        meta = {"page_name": page_name, "url": captured["url"], "title": captured["title"], "recorded_at": time.time()}
+        path = os.path.join(self.directory, snapshot_filename(page_name, captured["url"]))
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(f"<!-- snapshot: {json.dumps(meta)} -->\n<!DOCTYPE html>\n{captured['html']}")
+        return path
+
+
+def _require_lxml():
+    if lxml is None:
+        raise ImportError("Offline DOM evaluation requires the 'lxml' and 'cssselect' packages.")
+
+
+class DomSnapshot:
+    """
+    Parsed snapshot that evaluates Selenium locators the way the browser would.
+    """
+
+    def __init__(self, html, page_name=None, url=None):
+        _require_lxml()
+        self.page_name = page_name
+        self.url = url
+        self.tree = lxml.html.document_fromstring(html)
+        self._translator = GenericTranslator()
+        self._xpath_cache = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as handle:
+            html = handle.read()
+        meta = {}
+        match = _META.match(html)
+        if match:
+            meta = json.loads(match.group(1))
+            html = html[match.end():]
+        return cls(html, meta.get("page_name"), meta.get("url"))
+
+    def select(self, locator):
+        """
+        Returns all elements matched by a (By, selector) tuple, in document order.
+        """
+        kind, expr = to_script_locator(locator)
+        if kind in ("link", "partial"):
+            links = self.tree.iter("a")
+            if kind == "link":
+                return [a for a in links if a.text_content().strip() == expr]
+            return [a for a in links if expr in a.text_content().strip()]
+        if kind == "css":
+            if expr not in self._xpath_cache:
+                try:
+                    self._xpath_cache[expr] = self._translator.css_to_xpath(expr)
+                except SelectorError as e:
+                    raise ValueError(f"Invalid CSS selector {expr!r}: {e}") from None
+            expr = self._xpath_cache[expr]
+        return [node for node in self.tree.xpath(expr) if isinstance(node, lxml.html.HtmlElement)]
+
+    @staticmethod
+    def is_visible(element):
+        return element.get(HIDDEN_ATTRIBUTE) is None
+
+    @classmethod
+    def meets(cls, element, condition):
+        if condition == VISIBLE:
+            return cls.is_visible(element)
+        if condition == CLICKABLE:
+            return cls.is_visible(element) and element.get("disabled") is None
+        return True
+
+
+class OfflineElementFinder:
+    """
+    ElementFinder look-alike (find, find_clickable, find_many, absence checks) evaluated against a DomSnapshot.
+    Lookups resolve instantly: there is nothing to wait for in a snapshot.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def resolve(self, locator_dict, condition=PRESENT):
+        """
+        Returns (strategy, element) for the highest-priority strategy whose first match meets the condition.
+        """
+        for strategy, locator in locator_dict.items():
+            if not locator:
+                continue
+            elements = self.snapshot.select(locator)
+            if elements and DomSnapshot.meets(elements[0], condition):
+                return strategy, elements[0]
+        return None, None
+
+    def _find(self, element_name, page_name, locator_dict, condition):
+        strategy, element = self.resolve(locator_dict, condition)
+        if element is None:
+            raise NoSuchElementException(
+                f"Element '{element_name}' not {condition} in snapshot of page '{page_name}' ({self.snapshot.url}). "
+                f"Tried strategies: {list(locator_dict.keys())}"
+            )
+        logger.debug(f"[{page_name}] Offline: '{element_name}' resolved via {strategy} locator.")
+        return strategy, element
+
+    def find(self, element_name, page_name, locator_dict):
+        return self._find(element_name, page_name, locator_dict, PRESENT)[1]
+
+    def locate(self, element_name, page_name, locator_dict, condition=PRESENT):
+        return self._find(element_name, page_name, locator_dict, condition)
+
+    def find_clickable(self, element_name, page_name, locator_dict):
+        return self._find(element_name, page_name, locator_dict, CLICKABLE)[1]
+
+    def find_many(self, page_name, named_locators, condition=PRESENT):
+        results = {}
+        for name, locator_dict in named_locators.items():
+            strategy, element = self._find(name, page_name, locator_dict, condition)
+            results[name] = {"strategy": strategy, "element": element, "visible": DomSnapshot.is_visible(element)}
+        return results
+
+    def assert_absent(self, element_name, page_name, locator_dict):
+        strategy, _ = self.resolve(locator_dict, PRESENT)
+        assert strategy is None, f"'{element_name}' is present via {strategy} locator in snapshot of page '{page_name}'"
+        return True
+
+    def assert_not_visible(self, element_name, page_name, locator_dict):
+        strategy, _ = self.resolve(locator_dict, VISIBLE)
+        assert strategy is None, f"'{element_name}' is visible via {strategy} locator in snapshot of page '{page_name}'"
+        return True
+
+    def report(self, named_locators, condition=PRESENT):
+        """
+        For each element: the strategy it would resolve through and how many nodes every strategy matches.
+        """
+        report = {}
+        for name, locator_dict in named_locators.items():
+            strategy, _ = self.resolve(locator_dict, condition)
+            report[name] = {
+                "strategy": strategy,
+                "matches": {s: len(self.snapshot.select(l)) for s, l in locator_dict.items() if l},
+            }
+        return report
+
+
+def load_snapshots(directory):
+    """
+    Returns {page_name: [DomSnapshot, ...]} for every snapshot in directory, one per recorded URL path.
+    """
+    snapshots = {}
+    if not os.path.isdir(directory):
+        return snapshots
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".html"):
+            snapshot = DomSnapshot.load(os.path.join(directory, filename))
+            snapshots.setdefault(snapshot.page_name or filename[:-5].split("__")[0], []).append(snapshot)
+    return snapshots
+
+
+def unresolved(snapshots, named_locators, condition=PRESENT):
+    """
+    Names of the elements that resolve in none of a page's snapshots.
+    """
+    resolved = set()
+    for snapshot in snapshots:
+        finder = OfflineElementFinder(snapshot)
+        resolved.update(name for name, locator_dict in named_locators.items() if finder.resolve(locator_dict, condition)[0])
+    return [name for name in named_locators if name not in resolved]
+
+
+def main(argv=None):
+    """
+    Prints which strategy every catalog element resolves through in the recorded snapshots.
+    Usage: python -m utils.dom_snapshot [snapshot_dir]
+    """
+    from pages.locator_catalog import CATALOG
+
+    argv = sys.argv[1:] if argv is None else argv
+    directory = argv[0] if argv else ConfigProvider().get("SELENIUM_SNAPSHOT_DIR", "tests/snapshots")
+    failures = 0
+    for page_name, snapshots in load_snapshots(directory).items():
+        if page_name not in CATALOG:
+            continue
+        for snapshot in snapshots:
+            print(f"{page_name} ({snapshot.url})")
+            for name, row in OfflineElementFinder(snapshot).report(CATALOG[page_name]).items():
+                print(f"  {name:<32} {row['strategy'] or 'not found':<14} {row['matches']}")
+        missing = unresolved(snapshots, CATALOG[page_name])
+        failures += len(missing)
+        if missing:
+            print(f"  NOT FOUND in any {page_name} snapshot: {missing}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
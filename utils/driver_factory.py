@@ -0,0 +1,224 @@
+# Filename: utils/driver_factory.py
+# Description: Single place where test browsers are configured and launched, including a fast-launch mode with a shared chromedriver and a pre-warmed profile template.
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from contextlib import contextmanager
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from utils.config_provider import ConfigProvider
+from utils.browser_profiles import select_profile, apply_options, apply_network
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms build the template unlocked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Profile files that belong to a running browser and must not be cloned
+_PROFILE_RUNTIME_FILES = ("Singleton*", "lockfile", "*.lock", "Crashpad")
+
+
+def is_headless(config=None):
+    config = config or ConfigProvider()
+    return config.get('HEADLESS', 'true').lower() not in ('0', 'false')
+
+
+def chrome_options(config=None, proxy_url=None, profile=None):
+    """
+    Returns (Options, BrowserProfile) for a session configured from the environment.
+    """
+    config = config or ConfigProvider()
+    profile = profile or select_profile(config)
+    options = apply_options(profile, Options())
+    if is_headless(config):
+        options.add_argument('--headless')
+    if proxy_url:
+        options.add_argument(f'--proxy-server={proxy_url}')
+        # The archive proxy terminates TLS with its own self-signed certificate
+        options.add_argument('--ignore-certificate-errors')
+    return options, profile
+
+
+def create_chrome_driver(config=None, proxy_url=None, profile=None):
+    """
+    Launches a Chrome session configured from the environment (HEADLESS defaults to true).
+    proxy_url routes all traffic through the record/replay archive proxy.
+    profile is a BrowserProfile; by default it is selected from the environment.
+    """
+    options, profile = chrome_options(config, proxy_url, profile)
+    driver = webdriver.Chrome(options=options)
+    apply_network(profile, driver)
+    logger.info(f"Started Chrome with browser profile '{profile.name}' ({len(profile.blocked_urls)} blocked URL patterns)")
+    driver.maximize_window()
+    return driver
+
+
+class SharedService(Service):
+    """
+    chromedriver process serving many sessions: starting it again is a no-op and quitting a session
+    leaves it running. shutdown() stops it.
+    """
+
+    def start(self):
+        process = getattr(self, "process", None)
+        if process is None or process.poll() is not None:
+            super().start()
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        super().stop()
+
+
+class _FastChrome(webdriver.Chrome):
+    """Chrome session on a shared service that removes its cloned profile when it quits."""
+
+    profile_dir = None
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if self.profile_dir:
+                shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class ChromeLauncher:
+    """
+    Launches the Chrome sessions of one worker and measures how long each takes to start.
+    In fast mode (SELENIUM_FAST_LAUNCH=true) sessions share one chromedriver process, start from a clone of
+    a profile template whose first-run work is already done, and get their window size as a launch flag
+    instead of a maximize round trip.
+    Args:
+        config (ConfigProvider): Source of HEADLESS, SELENIUM_WINDOW_SIZE and the cache directory.
+        proxy_url (str): Optional record/replay proxy for every session.
+        profile (BrowserProfile): Browser profile; selected from the environment by default.
+        fast (bool): Overrides SELENIUM_FAST_LAUNCH.
+    """
+
+    def __init__(self, config=None, proxy_url=None, profile=None, fast=None):
+        self.config = config or ConfigProvider()
+        self.proxy_url = proxy_url
+        self.profile = profile or select_profile(self.config)
+        if fast is None:
+            fast = self.config.get("SELENIUM_FAST_LAUNCH", "false").lower() in ("1", "true")
+        self.fast = fast
+        self.window_size = self.config.get("SELENIUM_WINDOW_SIZE", "1920,1080")
+        self.template_dir = os.path.join(self.config.cache_dir, "chrome_profile_template")
+        self.launch_seconds = []
+        self._service = None
+        self._binary_location = None
+
+    def launch(self):
+        start = time.perf_counter()
+        driver = self._launch_fast() if self.fast else create_chrome_driver(self.config, self.proxy_url, self.profile)
+        seconds = time.perf_counter() - start
+        self.launch_seconds.append(seconds)
+        logger.info(f"Browser session {len(self.launch_seconds)} started in {seconds:.2f}s ({'fast' if self.fast else 'standard'} launch)")
+        return driver
+
+    def _options(self, user_data_dir):
+        options, _ = chrome_options(self.config, self.proxy_url, self.profile)
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+        options.add_argument(f"--window-size={self.window_size}")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+        if self._binary_location:
+            # Later sessions skip Selenium Manager; keep using the browser it resolved for the first one
+            options.binary_location = self._binary_location
+        return options
+
+    def _new_session(self, user_data_dir):
+        if self._service is None:
+            self._service = SharedService()
+        options = self._options(user_data_dir)
+        driver = _FastChrome(options=options, service=self._service)
+        self._binary_location = self._binary_location or options.binary_location
+        return driver
+
+    @contextmanager
+    def _template_lock(self):
+        os.makedirs(self.config.cache_dir, exist_ok=True)
+        with open(self.template_dir + ".lock", "w") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _ensure_template(self):
+        marker = os.path.join(self.template_dir, ".ready")
+        if os.path.exists(marker):
+            return
+        with self._template_lock():
+            # Another worker may have built it while we waited
+            if os.path.exists(marker):
+                return
+            shutil.rmtree(self.template_dir, ignore_errors=True)
+            start = time.perf_counter()
+            driver = self._new_session(self.template_dir)
+            try:
+                driver.get("about:blank")
+                version = driver.capabilities.get("browserVersion", "")
+            finally:
+                driver.quit()
+            with open(marker, "w") as handle:
+                handle.write(version)
+            logger.info(f"Built Chrome profile template {self.template_dir} in {time.perf_counter() - start:.2f}s")
+
+    def _launch_fast(self):
+        self._ensure_template()
+        clone = tempfile.mkdtemp(prefix="chrome-profile-")
+        shutil.rmtree(clone)
+        shutil.copytree(self.template_dir, clone, symlinks=True, ignore=shutil.ignore_patterns(*_PROFILE_RUNTIME_FILES))
+        try:
+            driver = self._new_session(clone)
+        except Exception:
+            shutil.rmtree(clone, ignore_errors=True)
+            raise
+        driver.profile_dir = clone
+        self._check_template_version(driver)
+        apply_network(self.profile, driver)
+        return driver
+
+    def _check_template_version(self, driver):
+        marker = os.path.join(self.template_dir, ".ready")
+        try:
+            with open(marker) as handle:
+                version = handle.read()
+        except OSError:
+            return
+        if version and version != driver.capabilities.get("browserVersion", version):
+            # Chrome was upgraded: every clone would migrate the old profile, so rebuild the template next time
+            logger.info(f"Chrome profile template was built by Chrome {version}; rebuilding it for the next session.")
+            try:
+                os.remove(marker)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        if self._service is not None:
+            self._service.shutdown()
+            self._service = None
+
+    def summary(self):
+        if not self.launch_seconds:
+            return f"browser launch: no sessions started ({'fast' if self.fast else 'standard'} launch)"
+        samples = self.launch_seconds
+        line = (
+            f"browser launch ({'fast' if self.fast else 'standard'}): {len(samples)} sessions, "
+            f"first {samples[0]:.2f}s, median {statistics.median(samples):.2f}s, max {max(samples):.2f}s"
+        )
+        if len(samples) > 1:
+            line += f", median after first {statistics.median(samples[1:]):.2f}s"
+        return line
@@ -0,0 +1,137 @@
+# Filename: utils/driver_pool.py
+# Description: Pool of warm WebDriver sessions reused across tests, with state reset between uses and recycling of worn or unhealthy sessions.
+
+import logging
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Hands out warm browser sessions instead of launching one per test.
+    Args:
+        factory (callable): Creates a new WebDriver session.
+        size (int): Maximum number of idle sessions kept warm.
+        max_uses (int): Sessions are quit and replaced after this many checkouts.
+    """
+
+    def __init__(self, factory, size=1, max_uses=20):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = []
+        self._uses = {}
+        self.stats = {"hits": 0, "misses": 0, "recycled": 0, "unhealthy": 0}
+
+    def acquire(self):
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_healthy(driver):
+                self.stats["hits"] += 1
+                self._uses[id(driver)] += 1
+                return driver
+            self.stats["unhealthy"] += 1
+            self._discard(driver)
+        self.stats["misses"] += 1
+        driver = self.factory()
+        self._uses[id(driver)] = 1
+        return driver
+
+    def release(self, driver):
+        """
+        Resets the session and returns it to the pool, or quits it when worn out, unhealthy or surplus.
+        """
+        if self._uses.get(id(driver), 0) >= self.max_uses:
+            self.stats["recycled"] += 1
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            logger.warning(f"Discarding pooled driver after failed reset: {e}")
+            self.stats["unhealthy"] += 1
+            self._discard(driver)
+            return
+        if len(self._idle) >= self.size:
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    @staticmethod
+    def reset(driver):
+        """
+        Clears cookies, storage and extra windows, then parks the session on about:blank.
+        With CDP, storage is cleared for every origin the session visited (e.g. the IdP), not only the current one.
+        """
+        cdp = hasattr(driver, "execute_cdp_cmd")
+        origins = set()
+        handles = driver.window_handles
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            if cdp:
+                origins.update(DriverPool._visited_origins(driver))
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        if cdp:
+            for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", []):
+                domain = cookie.get("domain", "").lstrip(".")
+                if domain:
+                    origins.add(f"{'https' if cookie.get('secure') else 'http'}://{domain}")
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                DriverPool._clear_session_storage(driver, origin)
+            # Clears cookies for every domain, not only the current document's
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    @staticmethod
+    def _visited_origins(driver):
+        # The tab's history includes the IdP pages a login redirected through
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for entry in history.get("entries", []):
+            parts = urlsplit(entry.get("url", ""))
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    @staticmethod
+    def _clear_session_storage(driver, origin):
+        # Storage.clearDataForOrigin leaves sessionStorage alone
+        try:
+            driver.execute_cdp_cmd("DOMStorage.clear", {"storageId": {"securityOrigin": origin, "isLocalStorage": False}})
+        except WebDriverException as e:
+            logger.debug(f"sessionStorage of {origin} not cleared: {e.msg}")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"Ignoring error while quitting pooled driver: {e}")
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def summary(self):
+        return (
+            f"driver pool: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+            f"{self.stats['recycled']} recycled, {self.stats['unhealthy']} unhealthy"
+        )
@@ -2,10 +2,20 @@
 # Description: Centralized locator utility with layered fallback strategy and explicit waits
 
 import logging
+import os
+import time
+from itertools import takewhile
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from utils.locator_race import race_locators, locate_many, PRESENT, VISIBLE, CLICKABLE
+from utils.mutation_wait import observe_first, observe_all, wait_until_settled
+from utils.strategy_cache import active_cache
+from utils.dom_snapshot import SnapshotRecorder
+from utils.failure_artifacts import capture_failure
+from utils.event_log import record_event
+from utils.wait_budget import active_budgets
 
 logger = logging.getLogger(__name__)
 
@@ -15,43 +25,327 @@ class ElementFinder:
     Priority: accessibility selectors > data-testid > semantic selectors > visible text.
     """
 
-    def __init__(self, driver, timeout=10, poll_frequency=0.5):
+    def __init__(self, driver, timeout=10, poll_frequency=0.5, race=None, strategy_cache=None, wait_backend=None, wait_budgets=None,
+                 use_strategy_cache=True):
         self.driver = driver
         self.timeout = timeout
         self.poll_frequency = poll_frequency
+        # Race mode checks every strategy in each poll under one overall deadline
+        if race is None:
+            race = os.environ.get("SELENIUM_RACE_LOCATORS", "false").lower() in ("1", "true")
+        self.race = race
+        # Remembers the strategy that last resolved each element so it is tried first next time. Defaults to the
+        # cache conftest activates for browser tests; use_strategy_cache=False always starts from the declared order
+        if not use_strategy_cache:
+            strategy_cache = None
+        elif strategy_cache is None:
+            strategy_cache = active_cache()
+        self.strategy_cache = strategy_cache
+        # 'poll' uses WebDriverWait; 'observer' waits on in-page DOM mutations and implies racing strategies
+        self.wait_backend = (wait_backend or os.environ.get("SELENIUM_WAIT_BACKEND", "poll")).lower()
+        # Saves DOM snapshots for offline locator checks when SELENIUM_RECORD_SNAPSHOTS is set
+        self.snapshot_recorder = SnapshotRecorder.from_env()
+        # Per-element wait budgets learned from past find latencies (False keeps the fixed timeout)
+        self.wait_budgets = wait_budgets if wait_budgets is not None else active_budgets()
+        # Absence checks decide once the page has had no requests or DOM mutations for this long
+        self.quiet_window_ms = int(os.environ.get("SELENIUM_QUIET_WINDOW_MS", "300"))
 
-    def find(self, element_name, page_name, locator_dict):
-        current_url = self.driver.current_url
+    def _timeout(self, element_name, page_name, strategy=None):
+        if not self.wait_budgets:
+            return self.timeout
+        return self.wait_budgets.budget(page_name, element_name, strategy, self.timeout)
+
+    def _learn(self, element_name, page_name, strategy, started):
+        if self.wait_budgets and strategy is not None:
+            self.wait_budgets.observe(page_name, element_name, strategy, time.perf_counter() - started)
+
+    def _prioritize(self, element_name, page_name, locator_dict):
+        """
+        Moves the cached winning strategy to the front; the declared order remains the fallback.
+        Returns (ordered locator dict, cached strategy or None).
+        """
+        if self.strategy_cache is None:
+            return locator_dict, None
+        cached = self.strategy_cache.get(page_name, element_name)
+        if not locator_dict.get(cached):
+            return locator_dict, None
+        record_event("cached", page_name, element_name, cached)
+        ordered = {cached: locator_dict[cached]}
+        ordered.update((strategy, locator) for strategy, locator in locator_dict.items() if strategy != cached)
+        return ordered, cached
+
+    def _remember(self, element_name, page_name, cached, strategy):
+        if self.strategy_cache is None:
+            return
+        if strategy is None:
+            if cached:
+                self.strategy_cache.invalidate(page_name, element_name)
+        elif strategy != cached:
+            self.strategy_cache.record(page_name, element_name, strategy)
+
+    def _race(self, element_name, page_name, locator_dict, condition, current_url):
+        try:
+            record_event("race", page_name, element_name, url=current_url, strategies=tuple(locator_dict))
+            started = time.perf_counter()
+            timeout = self._timeout(element_name, page_name, next(iter(locator_dict), None))
+            strategy, element = race_locators(self.driver, locator_dict, condition, timeout, self.poll_frequency)
+            self._learn(element_name, page_name, strategy, started)
+            return strategy, element
+        except TimeoutException:
+            return None, None
+
+    def _observe(self, element_name, page_name, locator_dict, condition, current_url):
+        try:
+            record_event("observe", page_name, element_name, url=current_url, strategies=tuple(locator_dict))
+            started = time.perf_counter()
+            timeout = self._timeout(element_name, page_name, next(iter(locator_dict), None))
+            strategy, element = observe_first(self.driver, locator_dict, condition, timeout)
+            self._learn(element_name, page_name, strategy, started)
+            return strategy, element
+        except TimeoutException:
+            return None, None
+        except ValueError as e:
+            # Locator kinds the page script cannot evaluate are waited for with WebDriverWait
+            logger.debug("[%s] %s; polling for '%s' instead.", page_name, e, element_name)
+            return self._sequential(element_name, page_name, locator_dict, condition, current_url)
+        except WebDriverException as e:
+            logger.warning(f"[{page_name}] Observer wait unavailable for '{element_name}', falling back to polling: {e.msg}")
+            return self._race(element_name, page_name, locator_dict, condition, current_url)
+
+    def _sequential(self, element_name, page_name, locator_dict, condition, current_url, probe=None):
+        expected = EC.element_to_be_clickable if condition == CLICKABLE else EC.presence_of_element_located
+        skipped = set()
+        if probe:
+            strategy, element, skipped = self._probe(element_name, page_name, locator_dict, condition, current_url, probe)
+            if element is not None:
+                return strategy, element
         for strategy, locator in locator_dict.items():
-            if not locator:
+            if not locator or strategy in skipped:
                 continue
             try:
-                logger.info(f"[{page_name}] Trying {strategy} locator for '{element_name}' on {current_url}: {locator}")
-                wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
-                element = wait.until(EC.presence_of_element_located(locator))
-                logger.info(f"[{page_name}] Found '{element_name}' using {strategy} locator.")
-                return element
+                record_event("try", page_name, element_name, strategy, url=current_url)
+                started = time.perf_counter()
+                wait = WebDriverWait(self.driver, self._timeout(element_name, page_name, strategy), self.poll_frequency)
+                element = wait.until(expected(locator))
+                self._learn(element_name, page_name, strategy, started)
+                return strategy, element
             except (TimeoutException, NoSuchElementException):
-                logger.debug(f"[{page_name}] '{element_name}' not found with {strategy} locator.")
+                record_event("miss", page_name, element_name, strategy)
                 continue
-        error_msg = f"Element '{element_name}' not found on page '{page_name}'. URL: {current_url}. Tried strategies: {list(locator_dict.keys())}"
+        return None, None
+
+    def _probe(self, element_name, page_name, locator_dict, condition, current_url, probe):
+        """
+        Waits once on a catalog entry's union CSS selector instead of once per CSS strategy, then picks
+        the highest-priority strategy that matches right now.
+        Returns (strategy, element, strategies to skip in the per-strategy fallback).
+        """
+        selector, covered = probe
+        leading = list(takewhile(lambda s: s in covered, (s for s, locator in locator_dict.items() if locator)))
+        if len(leading) != len(covered):
+            # A cached strategy outside the union was moved in front; keep plain sequential order
+            return None, None, set()
+        try:
+            record_event("probe", page_name, element_name, url=current_url, strategies=tuple(leading))
+            started = time.perf_counter()
+            WebDriverWait(self.driver, self._timeout(element_name, page_name), self.poll_frequency).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        except TimeoutException:
+            record_event("miss", page_name, element_name, "union")
+            return None, None, covered
+        for strategy in leading:
+            elements = self.driver.find_elements(*locator_dict[strategy])
+            if not elements:
+                continue
+            if condition == CLICKABLE and not (elements[0].is_displayed() and elements[0].is_enabled()):
+                continue
+            self._learn(element_name, page_name, strategy, started)
+            return strategy, elements[0], set()
+        return None, None, set()
+
+    def _locate(self, element_name, page_name, locator_dict, condition):
+        start = time.perf_counter()
+        current_url = self.driver.current_url
+        ordered, cached = self._prioritize(element_name, page_name, locator_dict)
+        if self.wait_backend == "observer":
+            strategy, element = self._observe(element_name, page_name, ordered, condition, current_url)
+        elif self.race:
+            strategy, element = self._race(element_name, page_name, ordered, condition, current_url)
+        else:
+            # Catalog entries carry a union selector for their leading CSS strategies
+            probe = getattr(locator_dict, "probe", None)
+            strategy, element = self._sequential(element_name, page_name, ordered, condition, current_url, probe)
+        self._remember(element_name, page_name, cached, strategy)
+        record_event(
+            "found" if element is not None else "not_found", page_name, element_name, strategy,
+            (time.perf_counter() - start) * 1000, current_url, condition=condition,
+        )
+        if element is not None:
+            logger.debug("[%s] Found '%s' using %s locator.", page_name, element_name, strategy)
+            if self.snapshot_recorder:
+                self.snapshot_recorder.record(self.driver, page_name)
+            return strategy, element
+        kind = "Clickable element" if condition == CLICKABLE else "Element"
+        error_msg = f"{kind} '{element_name}' not found on page '{page_name}'. URL: {current_url}. Tried strategies: {list(locator_dict.keys())}"
+        budget = self._timeout(element_name, page_name)
+        if budget < self.timeout:
+            error_msg += f". Waited up to the learned budget of {budget:.1f}s instead of {self.timeout}s"
         logger.error(error_msg)
+        capture_failure(self.driver, error_msg)
         raise NoSuchElementException(error_msg)
 
+    def find(self, element_name, page_name, locator_dict):
+        return self._locate(element_name, page_name, locator_dict, PRESENT)[1]
+
     def find_clickable(self, element_name, page_name, locator_dict):
-        current_url = self.driver.current_url
-        for strategy, locator in locator_dict.items():
-            if not locator:
-                continue
+        return self._locate(element_name, page_name, locator_dict, CLICKABLE)[1]
+
+    def locate(self, element_name, page_name, locator_dict, condition=PRESENT):
+        """
+        Like find/find_clickable, but returns (strategy, element) so callers can prefer that strategy next time.
+        """
+        return self._locate(element_name, page_name, locator_dict, condition)
+
+    def _poll_many(self, page_name, named_locators, condition):
+        """
+        Polls all named elements with one script call per poll until every one meets the condition
+        or the shared deadline passes. Returns the last per-element results (None for unresolved).
+        """
+        start = time.perf_counter()
+        # The batch waits as long as its slowest member's budget
+        timeout = max(self._timeout(name, page_name) for name in named_locators) if named_locators else self.timeout
+        results = None
+        if self.wait_backend == "observer":
             try:
-                logger.info(f"[{page_name}] Trying {strategy} locator for clickable '{element_name}' on {current_url}: {locator}")
-                wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
-                element = wait.until(EC.element_to_be_clickable(locator))
-                logger.info(f"[{page_name}] Found clickable '{element_name}' using {strategy} locator.")
-                return element
-            except (TimeoutException, NoSuchElementException):
-                logger.debug(f"[{page_name}] Clickable '{element_name}' not found with {strategy} locator.")
-                continue
-        error_msg = f"Clickable element '{element_name}' not found on page '{page_name}'. URL: {current_url}. Tried strategies: {list(locator_dict.keys())}"
-        logger.error(error_msg)
-        raise NoSuchElementException(error_msg)
\ No newline at end of file
+                results = observe_all(self.driver, named_locators, condition, timeout)
+            except WebDriverException as e:
+                logger.warning(f"Observer wait unavailable, falling back to polling: {e.msg}")
+        if results is None:
+            results = {}
+
+            def all_resolved(driver):
+                results.update(locate_many(driver, named_locators, condition))
+                return all(result is not None for result in results.values())
+
+            try:
+                WebDriverWait(self.driver, timeout, self.poll_frequency).until(all_resolved)
+            except TimeoutException:
+                pass
+        record_event(
+            "wait_many", elapsed=(time.perf_counter() - start) * 1000, condition=condition,
+            elements=len(named_locators), resolved=sum(result is not None for result in results.values()),
+        )
+        return results
+
+    def read_links(self, page_name, named_locators):
+        """
+        Reads href and target of several link-like elements in one script call per poll.
+        Returns {element_name: {'strategy', 'href', 'target'}}; raises NoSuchElementException if any is missing.
+        """
+        results = self._poll_many(page_name, named_locators, PRESENT)
+        missing = [name for name, result in results.items() if result is None]
+        if missing:
+            error_msg = self._many_diagnostic(page_name, named_locators, PRESENT, missing)
+            logger.error(error_msg)
+            capture_failure(self.driver, error_msg)
+            raise NoSuchElementException(error_msg)
+        links = {}
+        for name, result in results.items():
+            record_event("link", page_name, name, result["strategy"], href=result["href"], target=result["target"])
+            links[name] = {"strategy": result["strategy"], "href": result["href"], "target": result["target"]}
+        return links
+
+    def find_many(self, page_name, named_locators, condition=PRESENT):
+        """
+        Resolves several elements at once with one script call per poll under a single deadline.
+        Args:
+            page_name (str): Page/component context.
+            named_locators (dict): Mapping of element name to an ordered locator dict.
+            condition (str): PRESENT, VISIBLE or CLICKABLE.
+        Returns:
+            {element_name: {'strategy', 'element', 'visible'}}; raises NoSuchElementException naming every miss.
+        """
+        results, error_msg = self._resolve_many(page_name, named_locators, condition)
+        if error_msg:
+            raise NoSuchElementException(error_msg)
+        return results
+
+    def assert_all_visible(self, page_name, named_locators):
+        """
+        Asserts that every named element is visible; fails once with a combined diagnostic.
+        Returns the per-element result map of find_many.
+        """
+        results, error_msg = self._resolve_many(page_name, named_locators, VISIBLE)
+        assert not error_msg, error_msg
+        return results
+
+    def assert_absent(self, element_name, page_name, locator_dict):
+        """
+        Asserts that no strategy of locator_dict matches once the page has settled, instead of waiting for
+        find to time out through every strategy. Returns whether the page settled before the timeout.
+        """
+        return self._assert_missing(page_name, {element_name: locator_dict}, PRESENT)
+
+    def assert_not_visible(self, element_name, page_name, locator_dict):
+        """
+        Asserts that the element is absent or hidden once the page has settled.
+        Returns whether the page settled before the timeout.
+        """
+        return self._assert_missing(page_name, {element_name: locator_dict}, VISIBLE)
+
+    def _assert_missing(self, page_name, named_locators, condition):
+        start = time.perf_counter()
+        try:
+            settled, results = wait_until_settled(self.driver, named_locators, condition, self.quiet_window_ms, self.timeout)
+        except WebDriverException as e:
+            logger.warning(f"[{page_name}] Settle detection unavailable, checking the current DOM: {e.msg}")
+            settled, results = False, locate_many(self.driver, named_locators, condition)
+        if not settled:
+            logger.warning(f"[{page_name}] Page still busy after {self.timeout}s; checked {list(named_locators)} on the current DOM.")
+        found = {name: result for name, result in results.items() if result is not None}
+        for name in named_locators:
+            record_event(
+                "absent" if name not in found else condition, page_name, name,
+                found[name]["strategy"] if name in found else None,
+                (time.perf_counter() - start) * 1000, settled=settled,
+            )
+        if found:
+            state = "present" if condition == PRESENT else "visible"
+            error_msg = f"Expected {list(found)} not to be {state} on page '{page_name}'. URL: {self.driver.current_url}.\n" + "\n".join(
+                f"  '{name}': {state} via {result['strategy']} locator" for name, result in found.items()
+            )
+            logger.error(error_msg)
+            capture_failure(self.driver, error_msg)
+            raise AssertionError(error_msg)
+        return settled
+
+    def _resolve_many(self, page_name, named_locators, condition):
+        results = self._poll_many(page_name, named_locators, condition)
+        missing = [name for name, result in results.items() if result is None]
+        if missing:
+            error_msg = self._many_diagnostic(page_name, named_locators, condition, missing)
+            logger.error(error_msg)
+            capture_failure(self.driver, error_msg)
+            return None, error_msg
+        for name, r in results.items():
+            record_event("found", page_name, name, r["strategy"], condition=condition)
+        if self.snapshot_recorder:
+            self.snapshot_recorder.record(self.driver, page_name)
+        return {
+            name: {"strategy": r["strategy"], "element": r["element"], "visible": r["visible"]}
+            for name, r in results.items()
+        }, None
+
+    def _many_diagnostic(self, page_name, named_locators, condition, missing):
+        # Only runs on failure, so the extra round trips stay off the happy path
+        present = locate_many(self.driver, {name: named_locators[name] for name in missing}, PRESENT)
+        lines = []
+        for name in missing:
+            if present[name] is None:
+                lines.append(f"  '{name}': not found. Tried strategies: {[k for k, v in named_locators[name].items() if v]}")
+            else:
+                lines.append(f"  '{name}': present via {present[name]['strategy']} locator but not {condition}")
+        return (
+            f"{len(missing)} of {len(named_locators)} elements not {condition} on page '{page_name}'. "
+            f"URL: {self.driver.current_url}.\n" + "\n".join(lines)
+        )
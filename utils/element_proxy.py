@@ -0,0 +1,87 @@
+# Filename: utils/element_proxy.py
+# Description: Lazy element handles for page objects: resolved through the finder on first use, cached, and re-resolved once (winning strategy first) when the DOM re-renders and the handle goes stale.
+
+import logging
+from selenium.common.exceptions import StaleElementReferenceException
+from utils.event_log import record_event
+from utils.locator_race import PRESENT
+
+logger = logging.getLogger(__name__)
+
+
+class LazyElement:
+    """
+    Stands in for the element a page-object getter used to return. Attribute access and method calls
+    are forwarded to the resolved element; the first one triggers the lookup.
+    A handle is not a WebElement: pass unwrap(handle) to Selenium APIs that take one (execute_script
+    arguments, ActionChains, expected conditions). The selenium_actions helpers resolve handles themselves.
+    Args:
+        finder: ElementFinder (or OfflineElementFinder) providing locate().
+        element_name (str): Element name for logs and diagnostics.
+        page_name (str): Page/component context.
+        locator_dict (dict): Ordered locator strategies.
+        condition (str): PRESENT, VISIBLE or CLICKABLE, as for the finder.
+        on_resolve (callable): Called with the element after the first successful lookup.
+    """
+
+    def __init__(self, finder, element_name, page_name, locator_dict, condition=PRESENT, on_resolve=None):
+        self._finder = finder
+        self.element_name = element_name
+        self.page_name = page_name
+        self.locator_dict = locator_dict
+        self.condition = condition
+        self.strategy = None
+        self._element = None
+        self._on_resolve = on_resolve
+
+    def resolve(self):
+        """
+        Returns the underlying element, looking it up if it is not cached.
+        Re-resolution tries the strategy that matched last time first.
+        """
+        if self._element is not None:
+            return self._element
+        locators = self.locator_dict
+        if self.strategy and locators.get(self.strategy):
+            locators = {self.strategy: locators[self.strategy]}
+            locators.update((s, l) for s, l in self.locator_dict.items() if s != self.strategy)
+        first = self.strategy is None
+        self.strategy, self._element = self._finder.locate(self.element_name, self.page_name, locators, self.condition)
+        if first and self._on_resolve is not None:
+            self._on_resolve(self._element)
+        return self._element
+
+    def invalidate(self):
+        self._element = None
+
+    def _with_retry(self, operation):
+        try:
+            return operation(self.resolve())
+        except StaleElementReferenceException:
+            # The page re-rendered since the lookup; one fresh lookup, then let a second staleness fail the test
+            logger.debug("[%s] '%s' went stale; re-resolving via %s first.", self.page_name, self.element_name, self.strategy)
+            record_event("stale", self.page_name, self.element_name, self.strategy)
+            self._element = None
+            return operation(self.resolve())
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = self._with_retry(lambda element: getattr(element, name))
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            return self._with_retry(lambda element: getattr(element, name)(*args, **kwargs))
+        return call
+
+    def __repr__(self):
+        state = f"resolved via {self.strategy}" if self._element is not None else "unresolved"
+        return f"<LazyElement '{self.element_name}' on '{self.page_name}' ({state})>"
+
+
+def unwrap(value):
+    """
+    Returns the WebElement behind a LazyElement, looking it up if needed; any other value is returned unchanged.
+    """
+    return value.resolve() if isinstance(value, LazyElement) else value
@@ -0,0 +1,139 @@
+# Filename: utils/event_log.py
+# Description: Structured per-test event log: lookups and actions are kept unformatted in a bounded ring buffer, written as JSONL only when the test fails, with a one-line summary otherwise.
+
+import json
+import os
+import time
+from collections import Counter, deque
+from utils.config_provider import ConfigProvider
+
+# Field order of the tuples kept in the ring buffer
+_FIELDS = ("time", "action", "page", "element", "strategy", "elapsed_ms", "url")
+
+# Events recorded by utils.selenium_actions; every other event belongs to an element lookup
+ACTIONS = ("click", "visible")
+
+
+class EventLog:
+    """
+    Records (action, page, element, strategy, elapsed, url) tuples for the current test.
+    Nothing is formatted until a test fails; passing tests cost one tuple per event and one summary line.
+    Args:
+        directory (str): Where events<_worker>.jsonl and summary<_worker>.jsonl are appended.
+        capacity (int): Events kept per test; older events are dropped first.
+        worker (str): Parallel worker id, used to keep files separate per process.
+    """
+
+    def __init__(self, directory, capacity=500, worker=""):
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity)
+        self._recorded = 0
+        self._test_id = None
+        self._started = None
+        os.makedirs(directory, exist_ok=True)
+        suffix = f"_{worker}" if worker else ""
+        self.events_path = os.path.join(directory, f"events{suffix}.jsonl")
+        self.summary_path = os.path.join(directory, f"summary{suffix}.jsonl")
+        self._events_file = None
+        self._summary_file = None
+        self.stats = {"tests": 0, "failed": 0, "events": 0}
+
+    @classmethod
+    def from_env(cls, config=None):
+        """
+        Builds the log from SELENIUM_EVENT_LOG / SELENIUM_EVENT_LOG_CAPACITY; returns None when disabled.
+        """
+        config = config or ConfigProvider()
+        if config.get("SELENIUM_EVENT_LOG", "true").lower() in ("0", "false", "off"):
+            return None
+        worker = config.get("PYTEST_XDIST_WORKER") or config.get("SELENIUM_WORKER_ID", "")
+        return cls(
+            os.path.join(config.artifacts_dir, "events"),
+            capacity=int(config.get("SELENIUM_EVENT_LOG_CAPACITY", "500")),
+            worker=worker,
+        )
+
+    def begin(self, test_id):
+        self._events.clear()
+        self._recorded = 0
+        self._test_id = test_id
+        self._started = time.time()
+
+    def record(self, action, page=None, element=None, strategy=None, elapsed=None, url=None, **extra):
+        # Between tests there is no buffer to add to; the next begin() would clear it anyway
+        if self._test_id is None:
+            return
+        self._recorded += 1
+        self._events.append((time.time(), action, page, element, strategy, elapsed, url, extra))
+
+    def end(self, outcome):
+        """
+        Closes the current test: failed tests get their buffered events as JSONL, every test a summary line.
+        """
+        if self._test_id is None:
+            return
+        events = list(self._events)
+        self.stats["tests"] += 1
+        self.stats["events"] += self._recorded
+        if outcome == "failed":
+            self.stats["failed"] += 1
+            if self._events_file is None:
+                self._events_file = open(self.events_path, "a")
+            lines = []
+            for event in events:
+                row = {"test": self._test_id}
+                row.update((name, value) for name, value in zip(_FIELDS, event) if value is not None)
+                if event[-1]:
+                    row.update(event[-1])
+                if row.get("elapsed_ms") is not None:
+                    row["elapsed_ms"] = round(row["elapsed_ms"], 1)
+                lines.append(json.dumps(row, default=str))
+            self._events_file.write("\n".join(lines) + "\n" if lines else "")
+            self._events_file.flush()
+        if self._summary_file is None:
+            self._summary_file = open(self.summary_path, "a")
+        summary = {
+            "test": self._test_id,
+            "outcome": outcome,
+            "seconds": round(time.time() - self._started, 2),
+            "events": self._recorded,
+            "dropped": max(self._recorded - len(events), 0),
+            "actions": dict(Counter(event[1] for event in events)),
+            "lookup_ms": round(sum(event[5] for event in events if event[5] is not None and event[1] not in ACTIONS), 1),
+            "action_ms": round(sum(event[5] for event in events if event[5] is not None and event[1] in ACTIONS), 1),
+        }
+        self._summary_file.write(json.dumps(summary) + "\n")
+        self._summary_file.flush()
+        self._test_id = None
+
+    def close(self):
+        for handle in (self._events_file, self._summary_file):
+            if handle is not None:
+                handle.close()
+        self._events_file = self._summary_file = None
+
+    def summary(self):
+        line = f"event log: {self.stats['events']} events over {self.stats['tests']} tests; summaries in {self.summary_path}"
+        if self.stats["failed"]:
+            line += f"; events of {self.stats['failed']} failed tests in {self.events_path}"
+        return line
+
+
+_active = None
+
+
+def activate(event_log):
+    """
+    Makes event_log the target of record_event for this process (None deactivates recording).
+    conftest activates the session's log for each browser test only.
+    """
+    global _active
+    _active = event_log
+
+
+def record_event(action, page=None, element=None, strategy=None, elapsed=None, url=None, **extra):
+    """
+    Records one event in the active log; a no-op outside a browser test.
+    """
+    if _active is not None:
+        _active.record(action, page, element, strategy, elapsed, url, **extra)
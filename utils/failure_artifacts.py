@@ -0,0 +1,254 @@
+# Filename: utils/failure_artifacts.py
+# Description: Captures a screenshot, the serialized DOM, the browser console and recent WebDriver commands when a lookup, action or test fails; compression and disk writes run on a background thread under per-run size caps and retention limits.
+
+import base64
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import zipfile
+from selenium.common.exceptions import WebDriverException
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+CONSOLE_BUFFER_SIZE = 200
+
+# Installed before any page script runs; keeps the last console messages and uncaught errors in the page
+CONSOLE_HOOK_SCRIPT = """
+(function () {
+    if (window.__seleniumConsole) { return; }
+    var buffer = window.__seleniumConsole = [];
+    function push(level, args) {
+        var parts = [];
+        for (var i = 0; i < args.length; i++) {
+            try { parts.push(typeof args[i] === 'string' ? args[i] : JSON.stringify(args[i])); } catch (e) { parts.push(String(args[i])); }
+        }
+        buffer.push({level: level, message: parts.join(' '), time: Date.now()});
+        if (buffer.length > %d) { buffer.shift(); }
+    }
+    ['log', 'info', 'warn', 'error', 'debug'].forEach(function (level) {
+        var original = console[level];
+        console[level] = function () { push(level, arguments); return original.apply(console, arguments); };
+    });
+    window.addEventListener('error', function (e) { push('uncaught', [e.message + ' at ' + e.filename + ':' + e.lineno]); });
+    window.addEventListener('unhandledrejection', function (e) { push('unhandledrejection', [String(e.reason)]); });
+})();
+""" % CONSOLE_BUFFER_SIZE
+
+# Everything except the screenshot in one round trip
+CAPTURE_SCRIPT = """
+return {
+    url: window.location.href,
+    title: document.title,
+    html: document.documentElement ? document.documentElement.outerHTML : '',
+    console: window.__seleniumConsole || [],
+    viewport: [window.innerWidth, window.innerHeight]
+};
+"""
+
+
+def _slug(text, length=60):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", text).strip("_")[:length] or "failure"
+
+
+def _directory_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+class FailureArtifacts:
+    """
+    Collects failure artifacts into <directory>/<run_id>/<seq>-<pid>-<test>.zip.
+    Args:
+        directory (str): Root for all runs' artifacts.
+        max_bytes (int): Cap on one run's total artifact size, shared by parallel workers of the run.
+        keep_runs (int): Older run directories beyond this many are deleted at start-up.
+        max_dom_bytes (int): Serialized DOM is truncated past this size.
+        max_per_test (int): Captures kept per test; later failures in the same test are skipped.
+        run_id (str): Groups the workers of one run; defaults to a timestamp.
+    """
+
+    def __init__(self, directory, max_bytes=200 * 2**20, keep_runs=5, max_dom_bytes=5 * 2**20, max_per_test=3, run_id=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.keep_runs = keep_runs
+        self.max_dom_bytes = max_dom_bytes
+        self.max_per_test = max_per_test
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.run_dir = os.path.join(directory, self.run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.command_history = None
+        self.stats = {"captured": 0, "written": 0, "bytes": 0, "dropped": 0, "screenshots_dropped": 0}
+        self._test_id = None
+        self._per_test = {}
+        self._sequence = 0
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name="failure-artifacts", daemon=True)
+        self._writer.start()
+        self._prune()
+
+    @classmethod
+    def from_env(cls, config=None):
+        """
+        Builds the collector from SELENIUM_FAILURE_ARTIFACTS* settings; returns None when disabled.
+        """
+        config = config or ConfigProvider()
+        if config.get("SELENIUM_FAILURE_ARTIFACTS", "true").lower() in ("0", "false", "off"):
+            return None
+        return cls(
+            os.path.join(config.artifacts_dir, "failures"),
+            max_bytes=int(float(config.get("SELENIUM_FAILURE_ARTIFACTS_MAX_MB", "200")) * 2**20),
+            keep_runs=int(config.get("SELENIUM_FAILURE_ARTIFACTS_KEEP_RUNS", "5")),
+            max_per_test=int(config.get("SELENIUM_FAILURE_ARTIFACTS_PER_TEST", "3")),
+            run_id=config.get("SELENIUM_RUN_ID"),
+        )
+
+    def _prune(self):
+        runs = [entry for entry in os.scandir(self.directory) if entry.is_dir() and entry.name != self.run_id]
+        runs.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in runs[max(self.keep_runs - 1, 0):]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            logger.debug(f"Removed old failure artifacts {entry.path}")
+
+    @staticmethod
+    def install_console_hook(driver):
+        """
+        Starts buffering console output in every document the session loads (Chrome only, once per session).
+        """
+        if getattr(driver, "_console_hook_installed", False) or not hasattr(driver, "execute_cdp_cmd"):
+            return
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": CONSOLE_HOOK_SCRIPT})
+            driver._console_hook_installed = True
+        except WebDriverException as e:
+            logger.debug(f"Console hook unavailable: {e.msg}")
+
+    def begin(self, test_id):
+        self._test_id = test_id
+
+    def end(self):
+        self._test_id = None
+
+    def captured_for(self, test_id):
+        return self._per_test.get(test_id, 0)
+
+    def capture(self, driver, reason):
+        """
+        Grabs the artifacts for the current failure (one screenshot command and one script call) and hands
+        them to the writer thread. Never raises: a dead session only yields fewer artifacts.
+        Returns the artifact path, or None when nothing was captured (no test running, or its cap reached).
+        """
+        test_id = self._test_id
+        if test_id is None or self._per_test.get(test_id, 0) >= self.max_per_test:
+            return None
+        self._per_test[test_id] = self._per_test.get(test_id, 0) + 1
+        self._sequence += 1
+        self.stats["captured"] += 1
+        artifact = {"test": test_id, "reason": reason, "captured_at": time.time(), "page": None, "screenshot": None}
+        # Capture must never mask the failure being reported, whatever state the session is in
+        try:
+            artifact["page"] = driver.execute_script(CAPTURE_SCRIPT)
+        except Exception as e:
+            artifact["page_error"] = str(e)
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                # JPEG keeps screenshots an order of magnitude smaller than PNG
+                shot = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 60})
+                artifact["screenshot"] = ("screenshot.jpg", shot["data"])
+            else:
+                artifact["screenshot"] = ("screenshot.png", driver.get_screenshot_as_base64())
+        except Exception as e:
+            artifact["screenshot_error"] = str(e)
+        if self.command_history is not None:
+            artifact["commands"] = self.command_history()
+        path = os.path.join(self.run_dir, f"{self._sequence:04d}-{os.getpid()}-{_slug(test_id.split('::')[-1])}.zip")
+        self._queue.put((path, artifact))
+        return path
+
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:  # the writer thread must survive any single bad artifact
+                logger.warning(f"Could not write failure artifact {item[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, artifact):
+        page = artifact.pop("page") or {}
+        screenshot = artifact.pop("screenshot")
+        html = page.pop("html", "")
+        if len(html) > self.max_dom_bytes:
+            html = html[:self.max_dom_bytes] + "\n<!-- truncated -->"
+        files = {
+            "dom.html": html.encode("utf-8"),
+            "console.json": json.dumps(page.pop("console", []), indent=1).encode(),
+            "commands.json": json.dumps(artifact.pop("commands", []), indent=1).encode(),
+            "meta.json": json.dumps(dict(artifact, **page), indent=1).encode(),
+        }
+        image = (screenshot[0], base64.b64decode(screenshot[1])) if screenshot else None
+        used = _directory_size(self.run_dir)
+        # Compressed text is usually a small fraction of the DOM; the image is already compressed
+        estimate = sum(len(data) for data in files.values()) // 4 + (len(image[1]) if image else 0)
+        if image and used + estimate > self.max_bytes:
+            self.stats["screenshots_dropped"] += 1
+            estimate -= len(image[1])
+            image = None
+        if used + estimate > self.max_bytes:
+            self.stats["dropped"] += 1
+            logger.warning(f"Failure artifact for {artifact['test']} dropped: run cap of {self.max_bytes} bytes reached")
+            return
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in files.items():
+                archive.writestr(name, data)
+            if image:
+                archive.writestr(image[0], image[1], compress_type=zipfile.ZIP_STORED)
+        self.stats["written"] += 1
+        self.stats["bytes"] += os.path.getsize(path)
+        logger.info(f"Failure artifacts for {artifact['test']} written to {path}")
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+
+    def summary(self):
+        stats = self.stats
+        line = f"failure artifacts: {stats['written']} written ({stats['bytes']} bytes) to {self.run_dir}"
+        if stats["dropped"] or stats["screenshots_dropped"]:
+            line += f"; size cap dropped {stats['dropped']} artifacts and {stats['screenshots_dropped']} screenshots"
+        return line
+
+
+_collector = None
+
+
+def activate(collector):
+    """
+    Makes collector the target of capture_failure for this process (None deactivates capture).
+    conftest activates the session's collector for each browser test; anywhere else nothing is captured.
+    """
+    global _collector
+    _collector = collector
+
+
+def capture_failure(driver, reason):
+    if _collector is not None:
+        return _collector.capture(driver, reason)
+    return None
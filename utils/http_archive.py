@@ -0,0 +1,98 @@
+# Filename: utils/http_archive.py
+# Description: Compact, indexed, content-deduplicated store of recorded HTTP exchanges used by the record/replay proxy.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Cache-busting query parameters that change on every request and must not affect matching
+DEFAULT_IGNORED_PARAMS = ("_", "cb", "t", "ts", "timestamp")
+
+# Headers that describe one connection or encoding rather than the resource itself
+DROPPED_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailers", "transfer-encoding", "upgrade", "content-length", "content-encoding",
+}
+
+
+def request_key(method, url, body=b"", ignored_params=DEFAULT_IGNORED_PARAMS):
+    """
+    Normalized lookup key: method, URL without fragment or cache busters (query sorted), and a body digest.
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in ignored_params)
+    normalized = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+    key = f"{method.upper()} {normalized}"
+    if body:
+        key += " " + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+class HttpArchive:
+    """
+    SQLite archive with two tables: exchanges (indexed by request key) and blobs (zlib-compressed bodies
+    keyed by SHA-256, so identical payloads such as shared scripts are stored once).
+    """
+
+    def __init__(self, path, ignored_params=DEFAULT_IGNORED_PARAMS):
+        self.path = path
+        self.ignored_params = tuple(ignored_params)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS exchanges (key TEXT PRIMARY KEY, method TEXT NOT NULL, url TEXT NOT NULL, "
+                "status INTEGER NOT NULL, headers TEXT NOT NULL, body_digest TEXT NOT NULL, recorded_at REAL NOT NULL)"
+            )
+
+    @classmethod
+    def from_env(cls, config):
+        path = config.get("SELENIUM_HTTP_ARCHIVE") or os.path.join(config.cache_dir, "http_archive.sqlite3")
+        ignored = config.get("SELENIUM_HTTP_ARCHIVE_IGNORE_PARAMS")
+        return cls(path, ignored.split(",") if ignored else DEFAULT_IGNORED_PARAMS)
+
+    def key(self, method, url, body=b""):
+        return request_key(method, url, body, self.ignored_params)
+
+    def put(self, method, url, request_body, status, headers, body):
+        """
+        Stores one exchange; a later recording of the same request replaces the earlier one.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        headers = [(k, v) for k, v in headers if k.lower() not in DROPPED_HEADERS]
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO blobs (digest, data) VALUES (?, ?)", (digest, zlib.compress(body, 6)))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO exchanges (key, method, url, status, headers, body_digest, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.key(method, url, request_body), method.upper(), url, status, json.dumps(headers), digest, time.time()),
+            )
+
+    def load(self):
+        """
+        Reads the whole archive into memory: {key: (status, headers, body)}, bodies decompressed once.
+        """
+        with self._lock:
+            blobs = {digest: zlib.decompress(data) for digest, data in self._conn.execute("SELECT digest, data FROM blobs")}
+            rows = self._conn.execute("SELECT key, status, headers, body_digest FROM exchanges").fetchall()
+        return {key: (status, [tuple(h) for h in json.loads(headers)], blobs[digest]) for key, status, headers, digest in rows}
+
+    def stats(self):
+        with self._lock:
+            exchanges = self._conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+            blobs, stored = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM blobs").fetchone()
+        return {"exchanges": exchanges, "unique_bodies": blobs, "stored_bytes": stored}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,158 @@
+# Filename: utils/locator_race.py
+# Description: Evaluates every fallback locator strategy in a single script round trip per poll, so ElementFinder can race strategies under one overall deadline.
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+# Conditions understood by RACE_SCRIPT and BULK_SCRIPT, mirroring the expected_conditions used by ElementFinder.
+PRESENT = "present"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+
+SCRIPT_HELPERS = """
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') { return false; }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 || rect.height > 0;
+}
+function lookup(kind, expr) {
+    try {
+        if (kind === 'css') { return document.querySelector(expr); }
+        if (kind === 'xpath') {
+            return document.evaluate(expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        var links = document.getElementsByTagName('a');
+        for (var i = 0; i < links.length; i++) {
+            var text = (links[i].innerText || '').trim();
+            if (kind === 'link' ? text === expr : text.indexOf(expr) !== -1) { return links[i]; }
+        }
+    } catch (e) {}
+    return null;
+}
+function firstMatch(locators, condition) {
+    for (var i = 0; i < locators.length; i++) {
+        var el = lookup(locators[i][0], locators[i][1]);
+        if (!el) { continue; }
+        if (condition === 'visible' && !isVisible(el)) { continue; }
+        if (condition === 'clickable' && !(isVisible(el) && !el.disabled)) { continue; }
+        return [i, el];
+    }
+    return null;
+}
+function describe(match) {
+    if (!match) { return null; }
+    var el = match[1], anchor = el.closest ? el.closest('a') : null;
+    return {
+        index: match[0],
+        element: el,
+        visible: isVisible(el),
+        href: el.href || (anchor && anchor.href) || el.getAttribute('data-href'),
+        target: el.getAttribute('target') || (anchor && anchor.getAttribute('target'))
+    };
+}
+"""
+
+RACE_SCRIPT = SCRIPT_HELPERS + """
+return firstMatch(arguments[0], arguments[1]);
+"""
+
+# Resolves several elements at once and reports what a test usually asks next about each of them.
+BULK_SCRIPT = SCRIPT_HELPERS + """
+var groups = arguments[0], condition = arguments[1];
+return groups.map(function (locators) { return describe(firstMatch(locators, condition)); });
+"""
+
+
+def to_script_locator(locator):
+    """
+    Converts a Selenium (By, selector) tuple into the (kind, expression) pair evaluated by RACE_SCRIPT.
+    """
+    by, selector = locator
+    if by == By.CSS_SELECTOR:
+        return ["css", selector]
+    if by == By.XPATH:
+        return ["xpath", selector]
+    if by == By.ID:
+        return ["css", f'[id="{selector}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{selector}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{selector}"]
+    if by == By.TAG_NAME:
+        return ["css", selector]
+    if by == By.LINK_TEXT:
+        return ["link", selector]
+    if by == By.PARTIAL_LINK_TEXT:
+        return ["partial", selector]
+    raise ValueError(f"Unsupported locator strategy for racing: {by}")
+
+
+def race_locators(driver, locator_dict, condition, timeout, poll_frequency):
+    """
+    Polls all strategies in locator_dict at once until one satisfies the condition.
+    Args:
+        driver: WebDriver instance.
+        locator_dict (dict): Ordered mapping of strategy name to (By, selector); empty entries are skipped.
+        condition (str): One of PRESENT, VISIBLE or CLICKABLE.
+        timeout (float): Overall deadline shared by every strategy.
+        poll_frequency (float): Delay between script round trips.
+    Returns:
+        (strategy, WebElement) for the highest-priority strategy matching in the first successful poll.
+    Raises:
+        TimeoutException if no strategy matched before the deadline.
+    """
+    entries = [(strategy, locator) for strategy, locator in locator_dict.items() if locator]
+    if not entries:
+        raise TimeoutException("No locator strategies to race.")
+    script_locators = [to_script_locator(locator) for _, locator in entries]
+    wait = WebDriverWait(driver, timeout, poll_frequency)
+    index, element = wait.until(lambda d: d.execute_script(RACE_SCRIPT, script_locators, condition))
+    return entries[index][0], element
+
+
+def locate_many(driver, named_locators, condition):
+    """
+    Resolves every named locator dict in one script round trip, without waiting.
+    Args:
+        named_locators (dict): Mapping of element name to an ordered locator dict.
+        condition (str): One of PRESENT, VISIBLE or CLICKABLE.
+    Returns:
+        dict of element name to None (no strategy matched) or
+        {'strategy', 'element', 'visible', 'href', 'target'}.
+    """
+    entries, groups = script_groups(named_locators)
+    return named_results(entries, driver.execute_script(BULK_SCRIPT, groups, condition))
+
+
+def script_groups(named_locators):
+    """
+    Returns (entries, groups): the non-empty (strategy, locator) pairs per element name, and the same
+    locators converted for the page scripts, in matching order.
+    """
+    entries = {
+        name: [(strategy, locator) for strategy, locator in locator_dict.items() if locator]
+        for name, locator_dict in named_locators.items()
+    }
+    groups = [[to_script_locator(locator) for _, locator in strategies] for strategies in entries.values()]
+    return entries, groups
+
+
+def named_results(entries, matches):
+    """
+    Maps the per-group matches returned by BULK_SCRIPT back to element and strategy names.
+    """
+    results = {}
+    for (name, strategies), match in zip(entries.items(), matches):
+        if match is None:
+            results[name] = None
+            continue
+        results[name] = {
+            "strategy": strategies[match["index"]][0],
+            "element": match["element"],
+            "visible": match["visible"],
+            "href": match["href"],
+            "target": match["target"],
+        }
+    return results
@@ -0,0 +1,179 @@
+# Filename: utils/mutation_wait.py
+# Description: Event-driven waits that install a MutationObserver in the page and resolve as soon as a locator condition holds, instead of polling over WebDriver; also detects when a page has settled (no requests, no mutations) for absence checks.
+
+import logging
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from utils.locator_race import SCRIPT_HELPERS, script_groups, named_results, locate_many
+
+logger = logging.getLogger(__name__)
+
+# Stay below the default 30s WebDriver script timeout; longer waits are split into several calls.
+MAX_SCRIPT_WAIT = 25
+
+OBSERVE_SCRIPT = SCRIPT_HELPERS + """
+var groups = arguments[0], condition = arguments[1], mode = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+function check(final) {
+    if (mode === 'first') { return firstMatch(groups[0], condition); }
+    var matches = groups.map(function (locators) { return describe(firstMatch(locators, condition)); });
+    var complete = matches.every(function (m) { return m !== null; });
+    return complete || final ? matches : null;
+}
+var result = check(false);
+if (result) { done(result); return; }
+var finished = false, observer, safety, timer;
+function finish(value) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(safety);
+    clearTimeout(timer);
+    done(value);
+}
+function recheck() { var r = check(false); if (r) { finish(r); } }
+observer = new MutationObserver(recheck);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+// Layout-only changes (stylesheets, transitions) produce no mutations; re-check those in-page at a low rate
+safety = setInterval(recheck, 250);
+timer = setTimeout(function () { finish(check(true)); }, timeoutMs);
+"""
+
+# Tracks in-flight fetch/XHR requests and the time of the last request or DOM mutation in the page.
+# Installed on every new document through CDP when available, or on first use by SETTLE_SCRIPT.
+ACTIVITY_HOOK_SCRIPT = """
+(function () {
+    if (window.__seleniumActivity) { return; }
+    var activity = window.__seleniumActivity = {pending: 0, last: Date.now()};
+    function touch() { activity.last = Date.now(); }
+    function start() { activity.pending++; touch(); }
+    function end() { activity.pending = Math.max(0, activity.pending - 1); touch(); }
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return fetch.apply(this, arguments).then(function (r) { end(); return r; }, function (e) { end(); throw e; });
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start();
+        this.addEventListener('loadend', end);
+        try { return send.apply(this, arguments); } catch (e) { end(); throw e; }
+    };
+    function observe() {
+        new MutationObserver(touch).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+    if (document.documentElement) { observe(); } else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+"""
+
+SETTLE_SCRIPT = SCRIPT_HELPERS + ACTIVITY_HOOK_SCRIPT + """
+var groups = arguments[0], condition = arguments[1], quietMs = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var activity = window.__seleniumActivity, started = Date.now(), resources = -1;
+function poll() {
+    var now = Date.now(), count = performance.getEntriesByType('resource').length;
+    // Resource entries also catch requests that started before the hook was installed
+    if ((resources >= 0 && count !== resources) || activity.pending > 0 || document.readyState !== 'complete') {
+        activity.last = now;
+    }
+    resources = count;
+    var quiet = now - activity.last;
+    if (quiet >= quietMs || now - started >= timeoutMs) {
+        done({
+            settled: quiet >= quietMs,
+            quiet: quiet,
+            matches: groups.map(function (locators) { return describe(firstMatch(locators, condition)); })
+        });
+        return;
+    }
+    setTimeout(poll, Math.max(10, Math.min(50, quietMs - quiet)));
+}
+poll();
+"""
+
+
+def install_activity_hook(driver):
+    """
+    Tracks requests and mutations from the start of every document the session loads (Chrome only, once per session),
+    so settle checks on an already quiet page return without waiting out a fresh quiet window.
+    """
+    if getattr(driver, "_activity_hook_installed", False) or not hasattr(driver, "execute_cdp_cmd"):
+        return
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": ACTIVITY_HOOK_SCRIPT})
+        driver._activity_hook_installed = True
+    except WebDriverException as e:
+        logger.debug(f"Activity hook unavailable: {e.msg}")
+
+
+def _observe(driver, groups, condition, mode, timeout, is_complete):
+    deadline = time.monotonic() + timeout
+    result = None
+    while True:
+        remaining = deadline - time.monotonic()
+        chunk_ms = int(max(0, min(remaining, MAX_SCRIPT_WAIT)) * 1000)
+        try:
+            result = driver.execute_async_script(OBSERVE_SCRIPT, groups, condition, mode, chunk_ms)
+        except (JavascriptException, TimeoutException) as e:
+            # The page navigated (unloading the observer) or the script timed out; observe the new document
+            logger.debug(f"Observer interrupted, re-installing: {e.msg}")
+            time.sleep(0.05)
+        if is_complete(result) or time.monotonic() >= deadline:
+            return result
+
+
+def observe_first(driver, locator_dict, condition, timeout):
+    """
+    Waits for the highest-priority strategy in locator_dict that satisfies the condition.
+    Returns (strategy, WebElement); raises TimeoutException when nothing matched before the deadline.
+    """
+    entries, groups = script_groups({"element": locator_dict})
+    if not groups[0]:
+        raise TimeoutException("No locator strategies to observe.")
+    match = _observe(driver, groups, condition, "first", timeout, lambda r: r is not None)
+    if match is None:
+        raise TimeoutException(f"No strategy became {condition} within {timeout}s.")
+    index, element = match
+    return entries["element"][index][0], element
+
+
+def observe_all(driver, named_locators, condition, timeout):
+    """
+    Waits until every named element satisfies the condition.
+    Returns the same per-element map as locate_many (None for elements still unresolved at the deadline).
+    """
+    entries, groups = script_groups(named_locators)
+    matches = _observe(
+        driver, groups, condition, "all", timeout,
+        lambda r: r is not None and all(m is not None for m in r),
+    )
+    return named_results(entries, matches or [None] * len(groups))
+
+
+def wait_until_settled(driver, named_locators, condition, quiet_ms, timeout):
+    """
+    Waits until the page has had no pending fetch/XHR requests and no DOM mutations for quiet_ms, then
+    evaluates every named element once.
+    Returns (settled, results): settled is False when the page was still busy at the deadline, and results
+    is the same per-element map as locate_many, taken at the moment the page settled or the deadline passed.
+    """
+    entries, groups = script_groups(named_locators)
+    deadline = time.monotonic() + timeout
+    state = None
+    while True:
+        remaining = deadline - time.monotonic()
+        chunk_ms = int(max(0, min(remaining, MAX_SCRIPT_WAIT)) * 1000)
+        try:
+            state = driver.execute_async_script(SETTLE_SCRIPT, groups, condition, quiet_ms, chunk_ms)
+        except (JavascriptException, TimeoutException) as e:
+            # A navigation restarts the quiet window on the new document
+            logger.debug(f"Settle check interrupted, retrying: {e.msg}")
+            state = None
+            time.sleep(0.05)
+        if (state and state["settled"]) or time.monotonic() >= deadline:
+            break
+    if state is None:
+        return False, locate_many(driver, named_locators, condition)
+    return state["settled"], named_results(entries, state["matches"])
@@ -0,0 +1,260 @@
+# Filename: utils/page_telemetry.py
+# Description: Collects the portal's own load performance (Navigation/Resource Timing, FCP, LCP, CLS, TTFB) after each page load into a SQLite time series keyed by environment and build, with a regression report.
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from collections import namedtuple
+from contextlib import closing
+from selenium.common.exceptions import WebDriverException
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+# Everything in one round trip. Buffered PerformanceObservers hand over earlier LCP and layout-shift entries
+# synchronously through takeRecords(), so no hook has to be installed before the page loads.
+COLLECT_SCRIPT = """
+function observed(type) {
+    try {
+        var observer = new PerformanceObserver(function () {});
+        observer.observe({type: type, buffered: true});
+        var entries = observer.takeRecords();
+        observer.disconnect();
+        return entries;
+    } catch (e) { return []; }
+}
+var nav = performance.getEntriesByType('navigation')[0];
+var paint = performance.getEntriesByName('first-contentful-paint')[0];
+var lcp = observed('largest-contentful-paint').pop();
+var cls = observed('layout-shift').reduce(function (sum, e) { return e.hadRecentInput ? sum : sum + e.value; }, 0);
+var resources = performance.getEntriesByType('resource');
+var build = document.querySelector('meta[name="build"], meta[name="version"], meta[name="app-version"]');
+return {
+    url: location.href,
+    ready_state: document.readyState,
+    time_origin: performance.timeOrigin,
+    build: build ? build.getAttribute('content') : null,
+    ttfb: nav ? nav.responseStart : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+    fcp: paint ? paint.startTime : null,
+    lcp: lcp ? (lcp.renderTime || lcp.loadTime || lcp.startTime) : null,
+    cls: cls,
+    resource_count: resources.length,
+    transfer_bytes: resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, nav ? nav.transferSize || 0 : 0),
+    slowest: resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, 5)
+        .map(function (r) { return {name: r.name, duration: r.duration, initiator: r.initiatorType}; })
+};
+"""
+
+METRICS = ("ttfb", "fcp", "lcp", "cls", "dom_content_loaded", "load", "transfer_bytes")
+# A regression must also clear these absolute deltas, so noise on fast pages is not reported
+MIN_DELTA = {"cls": 0.05, "transfer_bytes": 50 * 1024}
+MIN_DELTA_MS = 100
+
+Regression = namedtuple("Regression", "env page metric baseline recent ratio baseline_samples recent_samples build")
+
+
+class PageTelemetry:
+    """
+    Time series of page-load measurements, one row per (environment, build, page) load.
+    Args:
+        path (str): SQLite file shared by runs and parallel workers.
+        env (str): TEST_ENV the measurements belong to.
+        build (str): Portal build under test; read from the page's build/version meta tag when not configured.
+        run_id (str): Groups the page loads of one run.
+    """
+
+    def __init__(self, path, env, build=None, run_id=None):
+        self.path = path
+        self.env = env
+        self.build = build
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.recorded = 0
+        self._test_id = None
+        self._seen = set()
+        self._pending = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS page_load ("
+                "recorded_at REAL NOT NULL, env TEXT NOT NULL, build TEXT NOT NULL, page TEXT NOT NULL, url TEXT, "
+                "run_id TEXT, test TEXT, ttfb REAL, fcp REAL, lcp REAL, cls REAL, dom_content_loaded REAL, load REAL, "
+                "resource_count INTEGER, transfer_bytes INTEGER, slowest TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS page_load_series ON page_load (env, page, recorded_at)")
+
+    @classmethod
+    def from_env(cls, config=None):
+        """
+        Builds the store from SELENIUM_PAGE_TELEMETRY* settings; returns None when disabled.
+        """
+        config = config or ConfigProvider()
+        if config.get("SELENIUM_PAGE_TELEMETRY", "true").lower() in ("0", "false", "off"):
+            return None
+        return cls(
+            config.get("SELENIUM_PAGE_TELEMETRY_DB") or os.path.join(config.cache_dir, "page_telemetry.sqlite3"),
+            config.env,
+            build=config.get("PORTAL_BUILD"),
+            run_id=config.get("SELENIUM_RUN_ID"),
+        )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def begin(self, test_id):
+        self._test_id = test_id
+
+    def collect(self, driver, page_name):
+        """
+        Measures the document currently loaded in driver once it has finished loading; later calls for the
+        same document are ignored. Returns the measurement, or None when nothing was recorded.
+        """
+        try:
+            sample = driver.execute_script(COLLECT_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"[{page_name}] Page telemetry unavailable: {e.msg}")
+            return None
+        if not sample or not sample.get("time_origin") or not sample["url"].startswith("http"):
+            return None
+        # Until the load event LCP, CLS and load are still moving; a later call measures the finished document
+        if sample.get("ready_state", "complete") != "complete":
+            return None
+        key = (sample["time_origin"], sample["url"])
+        if key in self._seen:
+            return None
+        self._seen.add(key)
+        self._pending.append((
+            time.time(), self.env, self.build or sample.get("build") or "unknown", page_name, sample["url"],
+            self.run_id, self._test_id, *(sample.get(metric) for metric in METRICS[:-1]),
+            sample.get("resource_count"), sample.get("transfer_bytes"), json.dumps(sample.get("slowest") or []),
+        ))
+        self.recorded += 1
+        logger.debug(
+            "[%s] LCP %s ms, CLS %.3f, TTFB %s ms, %s resources", page_name, sample.get("lcp"), sample.get("cls") or 0,
+            sample.get("ttfb"), sample.get("resource_count"),
+        )
+        return sample
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO page_load (recorded_at, env, build, page, url, run_id, test, ttfb, fcp, lcp, cls, "
+                "dom_content_loaded, load, resource_count, transfer_bytes, slowest) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                pending,
+            )
+
+    def regressions(self, env=None, threshold=1.2, window_days=30, recent_samples=5):
+        """
+        Compares each page's latest build with the builds before it (medians per metric).
+        When only one build is known, the last recent_samples loads are compared with the earlier ones.
+        Returns Regression rows for metrics at least threshold times worse, worst first.
+        """
+        since = time.time() - window_days * 86400
+        query = "SELECT env, page, build, " + ", ".join(METRICS) + " FROM page_load WHERE recorded_at >= ?"
+        params = [since]
+        if env:
+            query += " AND env = ?"
+            params.append(env)
+        series = {}
+        with closing(self._connect()) as conn:
+            for row in conn.execute(query + " ORDER BY recorded_at", params):
+                series.setdefault((row[0], row[1]), []).append(row[2:])
+        rows = []
+        for (series_env, page), loads in series.items():
+            latest = loads[-1][0]
+            if len({load[0] for load in loads}) > 1:
+                recent = [load for load in loads if load[0] == latest]
+                baseline = [load for load in loads if load[0] != latest]
+            else:
+                recent, baseline = loads[-recent_samples:], loads[:-recent_samples]
+            if len(recent) < 1 or len(baseline) < 3:
+                continue
+            for index, metric in enumerate(METRICS, start=1):
+                before = [load[index] for load in baseline if load[index] is not None]
+                now = [load[index] for load in recent if load[index] is not None]
+                if len(before) < 3 or not now:
+                    continue
+                base, current = statistics.median(before), statistics.median(now)
+                if current - base < MIN_DELTA.get(metric, MIN_DELTA_MS) or (base > 0 and current / base < threshold):
+                    continue
+                ratio = current / base if base > 0 else float("inf")
+                rows.append(Regression(series_env, page, metric, base, current, ratio, len(before), len(now), latest))
+        return sorted(rows, key=lambda row: row.ratio, reverse=True)
+
+    def summary(self):
+        return (
+            f"page telemetry: {self.recorded} page loads recorded for {self.env} (build {self.build or 'from page'}) "
+            f"in {self.path}; check with python -m utils.page_telemetry"
+        )
+
+
+_active = None
+
+
+def activate(telemetry):
+    """
+    Makes telemetry the target of collect_page_telemetry for this process (None deactivates collection).
+    """
+    global _active
+    _active = telemetry
+
+
+def collect_page_telemetry(driver, page_name):
+    """
+    Records load performance of the page in driver; a no-op outside a pytest session.
+    """
+    if _active is not None and driver is not None:
+        return _active.collect(driver, page_name)
+    return None
+
+
+def _format(metric, value):
+    if metric == "cls":
+        return f"{value:.3f}"
+    if metric == "transfer_bytes":
+        return f"{value / 1024:.0f}KB"
+    return f"{value:.0f}ms"
+
+
+def main(argv=None):
+    """
+    Usage: python -m utils.page_telemetry [--env STAGE] [--threshold 1.2] [--days 30]
+    Lists pages whose latest build loads slower than the builds before it; exits with 1 when any do.
+    """
+    config = ConfigProvider()
+    parser = argparse.ArgumentParser(prog="python -m utils.page_telemetry", description=main.__doc__)
+    parser.add_argument("--env", help="only this TEST_ENV (default: all)")
+    parser.add_argument("--threshold", type=float, default=float(config.get("SELENIUM_PAGE_TELEMETRY_THRESHOLD", "1.2")))
+    parser.add_argument("--days", type=int, default=30, help="history window")
+    args = parser.parse_args(argv)
+    telemetry = PageTelemetry(
+        config.get("SELENIUM_PAGE_TELEMETRY_DB") or os.path.join(config.cache_dir, "page_telemetry.sqlite3"), config.env
+    )
+    rows = telemetry.regressions(args.env and args.env.upper(), args.threshold, args.days)
+    if not rows:
+        print(f"No page-load regressions of {args.threshold}x or more in the last {args.days} days.")
+        return 0
+    print(f"{len(rows)} page-load regressions (median, baseline -> latest):")
+    for row in rows:
+        print(
+            f"  [{row.env}] {row.page} {row.metric}: {_format(row.metric, row.baseline)} -> {_format(row.metric, row.recent)} "
+            f"({row.ratio:.2f}x, build {row.build}, {row.baseline_samples}/{row.recent_samples} loads)"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
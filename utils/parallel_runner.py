@@ -0,0 +1,238 @@
+# Filename: utils/parallel_runner.py
+# Description: Runs the suite sharded across worker processes and environments, scheduling tests longest-first from their recorded durations.
+
+import argparse
+import heapq
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+# Estimate for tests that have never run in an environment and have no history to average
+DEFAULT_ESTIMATE_SECONDS = 30.0
+
+Job = namedtuple("Job", "env nodeid estimate")
+Shard = namedtuple("Shard", "worker jobs estimate")
+ShardRun = namedtuple("ShardRun", "worker env tests returncode seconds log_path")
+
+
+class DurationHistory:
+    """
+    Per-environment test durations (exponential moving average over runs), written by conftest at the end
+    of every session and read by the parallel runner to order tests. Shared safely between processes.
+    """
+
+    def __init__(self, path, smoothing=0.5):
+        self.path = path
+        self.smoothing = smoothing
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS test_duration ("
+                "env TEXT NOT NULL, nodeid TEXT NOT NULL, seconds REAL NOT NULL, runs INTEGER NOT NULL, "
+                "updated_at REAL NOT NULL, PRIMARY KEY (env, nodeid))"
+            )
+
+    @classmethod
+    def from_env(cls, config=None):
+        config = config or ConfigProvider()
+        return cls(config.get("SELENIUM_DURATION_HISTORY") or os.path.join(config.cache_dir, "test_durations.sqlite3"))
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, env, durations):
+        """
+        Folds {nodeid: seconds} from one session into the history.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            for nodeid, seconds in durations.items():
+                conn.execute(
+                    "INSERT INTO test_duration (env, nodeid, seconds, runs, updated_at) VALUES (?, ?, ?, 1, ?) "
+                    "ON CONFLICT (env, nodeid) DO UPDATE SET "
+                    "seconds = seconds * (1 - ?) + excluded.seconds * ?, runs = runs + 1, updated_at = excluded.updated_at",
+                    (env, nodeid, seconds, now, self.smoothing, self.smoothing),
+                )
+
+    def durations(self, env):
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT nodeid, seconds FROM test_duration WHERE env = ?", (env,)))
+
+
+def plan_jobs(nodeids, envs, history):
+    """
+    Returns one Job per (environment, test), longest estimate first.
+    Tests without history are estimated at the average of the environment's known durations.
+    """
+    jobs = []
+    for env in envs:
+        known = history.durations(env)
+        default = sum(known.values()) / len(known) if known else DEFAULT_ESTIMATE_SECONDS
+        jobs.extend(Job(env, nodeid, known.get(nodeid, default)) for nodeid in nodeids)
+    return sorted(jobs, key=lambda job: job.estimate, reverse=True)
+
+
+def plan_shards(jobs, workers):
+    """
+    Longest-processing-time-first: each job, longest first, goes to the currently least-loaded worker.
+    The busiest shard then finishes within 4/3 of the optimum and is never shorter than the longest test.
+    """
+    heap = [(0.0, worker, []) for worker in range(workers)]
+    for job in sorted(jobs, key=lambda job: job.estimate, reverse=True):
+        load, worker, assigned = heapq.heappop(heap)
+        assigned.append(job)
+        heapq.heappush(heap, (load + job.estimate, worker, assigned))
+    shards = [Shard(worker, assigned, load) for load, worker, assigned in heap if assigned]
+    return sorted(shards, key=lambda shard: shard.worker)
+
+
+# Options that only decide which tests are collected; shards receive the resulting node ids instead
+SELECTION_OPTIONS = ("-k", "-m", "--deselect", "--ignore", "--ignore-glob")
+# Options whose value may follow as a separate argument, so the value is not taken for a test path
+VALUE_OPTIONS = SELECTION_OPTIONS + (
+    "-p", "-c", "-o", "-r", "-W", "--maxfail", "--tb", "--durations", "--capture", "--color", "--rootdir",
+    "--basetemp", "--confcutdir", "--import-mode", "--junitxml", "--junit-xml", "--log-level", "--log-cli-level",
+)
+
+
+def split_pytest_args(pytest_args):
+    """
+    Splits passthrough pytest arguments into (selection, options).
+    Selection (test paths, -k, -m, --deselect, --ignore) is applied once when collecting; options go to every shard.
+    """
+    selection, options = [], []
+    args = iter(pytest_args)
+    for arg in args:
+        if not arg.startswith("-"):
+            selection.append(arg)
+            continue
+        option = arg.split("=", 1)[0] if arg.startswith("--") else arg[:2]
+        target = selection if option in SELECTION_OPTIONS else options
+        target.append(arg)
+        if arg == option and option in VALUE_OPTIONS:
+            value = next(args, None)
+            if value is not None:
+                target.append(value)
+    return selection, options
+
+
+def shard_command(pytest_options, nodeids):
+    """
+    Command line of one shard process: the passthrough options and the shard's own node ids, nothing else.
+    """
+    return [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", *pytest_options, *nodeids]
+
+
+def collect(pytest_args):
+    """
+    Returns the node ids pytest would run for pytest_args, in collection order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        capture_output=True, text=True,
+    )
+    nodeids = [line.strip() for line in result.stdout.splitlines() if "::" in line and not line.startswith(" ")]
+    if result.returncode not in (0, 5):
+        logger.warning(f"Collection reported errors (exit code {result.returncode}); running the {len(nodeids)} tests that collected.")
+    return nodeids
+
+
+def worker_environment(snapshot, env, worker_id):
+    """
+    Isolated configuration for one worker process: a copy of the launch-time environment with TEST_ENV,
+    BASE_URL and credentials switched to the target environment.
+    """
+    environ = dict(snapshot)
+    environ["TEST_ENV"] = env
+    environ["SELENIUM_WORKER_ID"] = worker_id
+    for target, source in (("BASE_URL", f"BASE_URL_{env}"), ("USERNAME", f"{env}_USERNAME"), ("PASSWORD", f"{env}_PASSWORD")):
+        if snapshot.get(source):
+            environ[target] = snapshot[source]
+    return environ
+
+
+def run_shard(shard, pytest_options, snapshot, log_dir):
+    """
+    Runs a shard's tests in one pytest process per environment, one browser per process.
+    pytest_options must not select tests (see split_pytest_args): the shard runs exactly its node ids.
+    """
+    runs = []
+    envs = []
+    for job in shard.jobs:
+        if job.env not in envs:
+            envs.append(job.env)
+    for env in envs:
+        nodeids = [job.nodeid for job in shard.jobs if job.env == env]
+        worker_id = f"w{shard.worker}-{env.lower()}"
+        log_path = os.path.join(log_dir, f"{worker_id}.log")
+        start = time.perf_counter()
+        with open(log_path, "w") as log:
+            returncode = subprocess.call(
+                shard_command(pytest_options, nodeids),
+                env=worker_environment(snapshot, env, worker_id), stdout=log, stderr=subprocess.STDOUT,
+            )
+        runs.append(ShardRun(shard.worker, env, len(nodeids), returncode, time.perf_counter() - start, log_path))
+    return runs
+
+
+def main(argv=None):
+    """
+    Usage: python -m utils.parallel_runner [--workers N] [--envs PIE,STAGE] [--dry-run] [pytest args...]
+    """
+    config = ConfigProvider()
+    parser = argparse.ArgumentParser(prog="python -m utils.parallel_runner", description=main.__doc__)
+    parser.add_argument("--workers", type=int, default=int(config.get("SELENIUM_PARALLEL_WORKERS", "2")))
+    parser.add_argument("--envs", default=config.get("SELENIUM_PARALLEL_ENVS", config.env))
+    parser.add_argument("--dry-run", action="store_true", help="print the schedule without running it")
+    args, pytest_args = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    pytest_args = [arg for arg in pytest_args if arg != "--"]
+    envs = [env.strip().upper() for env in args.envs.split(",") if env.strip()]
+    _, pytest_options = split_pytest_args(pytest_args)
+
+    jobs = plan_jobs(collect(pytest_args), envs, DurationHistory.from_env(config))
+    if not jobs:
+        print("No tests collected.")
+        return 5
+    shards = plan_shards(jobs, args.workers)
+    longest = max(job.estimate for job in jobs)
+    print(
+        f"{len(jobs)} tests across {envs} on {len(shards)} workers: estimated {max(s.estimate for s in shards):.1f}s "
+        f"(serial {sum(job.estimate for job in jobs):.1f}s, longest test {longest:.1f}s)"
+    )
+    for shard in shards:
+        print(f"  worker {shard.worker}: {len(shard.jobs)} tests, ~{shard.estimate:.1f}s")
+    if args.dry_run:
+        return 0
+
+    log_dir = os.path.join(config.artifacts_dir, "shards")
+    os.makedirs(log_dir, exist_ok=True)
+    snapshot = dict(os.environ)
+    # One failure-artifact directory (and size cap) for every worker of this run
+    snapshot.setdefault("SELENIUM_RUN_ID", time.strftime("%Y%m%d-%H%M%S"))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        results = [run for runs in executor.map(lambda s: run_shard(s, pytest_options, snapshot, log_dir), shards) for run in runs]
+    elapsed = time.perf_counter() - start
+
+    for run in results:
+        status = "passed" if run.returncode == 0 else f"exit code {run.returncode}"
+        print(f"  worker {run.worker} [{run.env}]: {run.tests} tests in {run.seconds:.1f}s, {status} (log: {run.log_path})")
+    print(f"Wall clock {elapsed:.1f}s for an estimated serial time of {sum(job.estimate for job in jobs):.1f}s")
+    return max(run.returncode for run in results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
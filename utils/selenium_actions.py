@@ -2,27 +2,48 @@
 # Description: Lightweight logging wrappers and error handling for Selenium actions
 
 import logging
+import time
 from selenium.common.exceptions import WebDriverException
+from utils.element_proxy import unwrap
+from utils.event_log import record_event
+from utils.failure_artifacts import capture_failure
 
 logger = logging.getLogger(__name__)
 
+def _current_url(driver):
+    # Only read for failure messages: one round trip less per action on the passing path
+    try:
+        return driver.current_url
+    except WebDriverException:
+        return "unknown"
+
 def click_element(element, element_name, page_name, driver):
-    current_url = driver.current_url
+    # Lazy handles are looked up before acting, so a missing element fails with the finder's own error and artifacts
+    unwrap(element)
+    start = time.perf_counter()
+    logger.debug("[%s] Clicking '%s'", page_name, element_name)
     try:
-        logger.info(f"[{page_name}] Attempting to click '{element_name}' on {current_url}")
         element.click()
-        logger.info(f"[{page_name}] Clicked '{element_name}' on {current_url}")
     except WebDriverException as e:
+        current_url = _current_url(driver)
+        record_event("click", page_name, element_name, elapsed=(time.perf_counter() - start) * 1000, url=current_url, error=e.msg)
         error_msg = f"Error clicking '{element_name}' on page '{page_name}'. URL: {current_url}. Exception: {e}"
         logger.error(error_msg)
+        capture_failure(driver, error_msg)
         raise
+    record_event("click", page_name, element_name, elapsed=(time.perf_counter() - start) * 1000)
+    logger.debug("[%s] Clicked '%s'", page_name, element_name)
 
 def assert_element_visible(element, element_name, page_name, driver):
-    current_url = driver.current_url
+    unwrap(element)
+    start = time.perf_counter()
+    visible = element.is_displayed()
+    record_event("visible", page_name, element_name, elapsed=(time.perf_counter() - start) * 1000, visible=visible)
     try:
-        assert element.is_displayed(), f"Element '{element_name}' not visible on page '{page_name}' ({current_url})"
-        logger.info(f"[{page_name}] Verified visibility of '{element_name}' on {current_url}")
+        assert visible, f"Element '{element_name}' not visible on page '{page_name}' ({_current_url(driver)})"
+        logger.debug("[%s] Verified visibility of '%s'", page_name, element_name)
     except AssertionError as e:
-        error_msg = f"Visibility assertion failed for '{element_name}' on page '{page_name}'. URL: {current_url}. Exception: {e}"
+        error_msg = f"Visibility assertion failed for '{element_name}' on page '{page_name}'. URL: {_current_url(driver)}. Exception: {e}"
         logger.error(error_msg)
-        raise
\ No newline at end of file
+        capture_failure(driver, error_msg)
+        raise
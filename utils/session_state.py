@@ -0,0 +1,188 @@
+# Filename: utils/session_state.py
+# Description: Captures an authenticated browser session (cookies, local and session storage) once per environment and replays it into new sessions.
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from utils.config_provider import ConfigProvider
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to unlocked writes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 1800
+
+# Fields accepted by CDP Network.setCookies
+_CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) { var key = storage.key(i); out[key] = storage.getItem(key); }
+    return out;
+}
+return {origin: window.location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+(function (state) {
+    if (window.location.origin !== state.origin) { return; }
+    try {
+        Object.keys(state.local).forEach(function (k) { window.localStorage.setItem(k, state.local[k]); });
+        Object.keys(state.session).forEach(function (k) { window.sessionStorage.setItem(k, state.session[k]); });
+    } catch (e) {}
+})(%s);
+"""
+
+
+class LoginStateCache:
+    """
+    JSON file holding the captured login state for one environment.
+    A lock file serializes sign-in so parallel workers log in once and share the result.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def for_env(cls, config=None):
+        config = config or ConfigProvider()
+        ttl = float(config.get("SELENIUM_LOGIN_STATE_TTL", DEFAULT_TTL_SECONDS))
+        return cls(os.path.join(config.cache_dir, f"login_state_{config.env.lower()}.json"), ttl)
+
+    @contextmanager
+    def lock(self):
+        with open(self.path + ".lock", "w") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def load(self):
+        """
+        Returns the saved state, or None if missing, unreadable or expired.
+        """
+        try:
+            with open(self.path) as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if time.time() >= state.get("expires_at", 0):
+            logger.info(f"Cached login state {self.path} has expired.")
+            return None
+        return state
+
+    def save(self, state):
+        state["expires_at"] = _expires_at(state, self.ttl)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as handle:
+            json.dump(state, handle)
+        os.replace(tmp_path, self.path)
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _expires_at(state, ttl):
+    """
+    The state expires at the TTL or when its first persistent cookie expires, whichever comes first.
+    """
+    expiries = [c.get("expires", c.get("expiry")) for c in state["cookies"]]
+    expiries = [e for e in expiries if e and e > 0]
+    return min([state["captured_at"] + ttl] + expiries)
+
+
+def capture_session_state(driver):
+    if hasattr(driver, "execute_cdp_cmd"):
+        # Includes HttpOnly cookies and those of the identity provider's domain
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    else:
+        cookies = driver.get_cookies()
+    storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+    return {
+        "url": driver.current_url,
+        "origin": storage["origin"],
+        "cookies": cookies,
+        "local": storage["local"],
+        "session": storage["session"],
+        "captured_at": time.time(),
+    }
+
+
+def restore_session_state(driver, state, url):
+    """
+    Loads saved cookies and storage into the session, then navigates to url.
+    With CDP this costs a single page load.
+    """
+    storage_script = RESTORE_STORAGE_SCRIPT % json.dumps(
+        {"origin": state["origin"], "local": state["local"], "session": state["session"]}
+    )
+    if hasattr(driver, "execute_cdp_cmd"):
+        cookies = [{k: c[k] for k in _CDP_COOKIE_FIELDS if k in c} for c in state["cookies"]]
+        for cookie in cookies:
+            if cookie.get("expires", 0) <= 0:
+                cookie.pop("expires", None)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": storage_script})
+        try:
+            driver.get(url)
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+        return
+    driver.get(state["origin"])
+    for cookie in state["cookies"]:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            logger.debug(f"Skipping cookie '{cookie.get('name')}' for domain {cookie.get('domain')}")
+    driver.execute_script(storage_script)
+    driver.get(url)
+
+
+async def capture_async_session_state(page):
+    """
+    capture_session_state for an AsyncPage; cookies come from the page's own browser context.
+    """
+    storage = await page.evaluate("(function () {" + CAPTURE_STORAGE_SCRIPT + "})()")
+    return {
+        "url": await page.current_url(),
+        "origin": storage["origin"],
+        "cookies": await page.cookies(),
+        "local": storage["local"],
+        "session": storage["session"],
+        "captured_at": time.time(),
+    }
+
+
+async def restore_async_session_state(page, state, url):
+    """
+    restore_session_state for an AsyncPage: cookies go into the page's browser context only.
+    """
+    cookies = [{k: c[k] for k in _CDP_COOKIE_FIELDS if k in c} for c in state["cookies"]]
+    for cookie in cookies:
+        if cookie.get("expires", 0) <= 0:
+            cookie.pop("expires", None)
+    await page.set_cookies(cookies)
+    identifier = await page.add_init_script(RESTORE_STORAGE_SCRIPT % json.dumps(
+        {"origin": state["origin"], "local": state["local"], "session": state["session"]}
+    ))
+    try:
+        await page.goto(url)
+    finally:
+        await page.remove_init_script(identifier)
@@ -0,0 +1,115 @@
+# Filename: utils/strategy_cache.py
+# Description: Persistent record of which locator strategy last resolved each element, shared safely between concurrent test processes.
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class StrategyCache:
+    """
+    SQLite-backed store of winning strategies keyed by (page_name, element_name).
+    Entries expire after ttl seconds so the declared priority order is periodically re-checked.
+    Storage errors are logged and treated as cache misses; the cache never fails a lookup.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS winning_strategy ("
+                    "page_name TEXT NOT NULL, element_name TEXT NOT NULL, strategy TEXT NOT NULL, "
+                    "recorded_at REAL NOT NULL, PRIMARY KEY (page_name, element_name))"
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Strategy cache unavailable at {path}: {e}")
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds the cache from SELENIUM_STRATEGY_CACHE / SELENIUM_STRATEGY_CACHE_TTL.
+        Returns None when the cache is disabled.
+        """
+        config = ConfigProvider()
+        if config.get("SELENIUM_STRATEGY_CACHE", "true").lower() in ("0", "false", "off"):
+            return None
+        ttl = float(config.get("SELENIUM_STRATEGY_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        return cls(os.path.join(config.cache_dir, "strategy_cache.sqlite3"), ttl)
+
+    def _connect(self):
+        # A generous busy timeout lets parallel workers queue on the write lock instead of failing
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, page_name, element_name):
+        """
+        Returns the cached winning strategy, or None if missing or expired.
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT strategy, recorded_at FROM winning_strategy WHERE page_name = ? AND element_name = ?",
+                    (page_name, element_name),
+                ).fetchone()
+                if row is None:
+                    return None
+                strategy, recorded_at = row
+                if time.time() - recorded_at > self.ttl:
+                    conn.execute(
+                        "DELETE FROM winning_strategy WHERE page_name = ? AND element_name = ?",
+                        (page_name, element_name),
+                    )
+                    return None
+                return strategy
+        except sqlite3.Error as e:
+            logger.warning(f"Strategy cache read failed for '{element_name}' on '{page_name}': {e}")
+            return None
+
+    def record(self, page_name, element_name, strategy):
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO winning_strategy (page_name, element_name, strategy, recorded_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (page_name, element_name, strategy, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Strategy cache write failed for '{element_name}' on '{page_name}': {e}")
+
+    def invalidate(self, page_name, element_name):
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "DELETE FROM winning_strategy WHERE page_name = ? AND element_name = ?",
+                    (page_name, element_name),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Strategy cache invalidation failed for '{element_name}' on '{page_name}': {e}")
+
+
+_active = None
+
+
+def activate(cache):
+    """
+    Makes cache the default of every ElementFinder in this process (None starts every lookup from the declared order).
+    """
+    global _active
+    _active = cache
+
+
+def active_cache():
+    return _active
@@ -7,6 +7,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from utils.locator_race import race_locators, PRESENT, VISIBLE, CLICKABLE
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +17,34 @@ class ElementFinder:
     Priority: accessibility selectors > data-testid > semantic selectors > visible text.
     """
 
-    def __init__(self, driver, timeout=None, poll_frequency=None):
+    def __init__(self, driver, timeout=None, poll_frequency=None, race=None):
         self.driver = driver
         # Configurable timeout and polling interval with environment variable fallback
         self.timeout = int(timeout or os.environ.get("SELENIUM_WAIT_TIMEOUT", 10))
         self.poll_frequency = float(poll_frequency or os.environ.get("SELENIUM_WAIT_POLL", 0.5))
+        # Race mode checks every strategy in each poll under one overall deadline
+        if race is None:
+            race = os.environ.get("SELENIUM_RACE_LOCATORS", "false").lower() in ("1", "true")
+        self.race = race
+
+    def _race(self, element_name, page_name, locator_dict, condition):
+        """
+        Races all strategies in locator_dict with one script round trip per poll.
+        Returns the element matched by the highest-priority strategy, else raises NoSuchElementException.
+        """
+        current_url = self.driver.current_url
+        try:
+            logger.info(f"Racing {list(locator_dict.keys())} locators for '{element_name}' on page '{page_name}' ({current_url})")
+            strategy, element = race_locators(self.driver, locator_dict, condition, self.timeout, self.poll_frequency)
+            logger.info(f"Located '{element_name}' using {strategy} strategy.")
+            return element
+        except TimeoutException:
+            error_msg = (
+                f"ERROR: Could not locate {condition} element '{element_name}' on page '{page_name}' ({current_url}) "
+                f"using any locator strategy. Locators raced: {locator_dict}"
+            )
+            logger.error(error_msg)
+            raise NoSuchElementException(error_msg)
 
     def find(self, element_name, page_name, locator_dict):
         """
@@ -39,6 +63,8 @@ class ElementFinder:
         Returns:
             WebElement if found, else raises NoSuchElementException.
         """
+        if self.race:
+            return self._race(element_name, page_name, locator_dict, PRESENT)
         current_url = self.driver.current_url
         for strategy, locator in locator_dict.items():
             if not locator:
@@ -64,9 +90,12 @@ class ElementFinder:
         Clicks an element found by the fallback strategy, with error handling and logging.
         """
         try:
-            element = self.find(element_name, page_name, locator_dict)
-            wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
-            wait.until(EC.element_to_be_clickable(locator_dict[next(iter(locator_dict))]))
+            if self.race:
+                element = self._race(element_name, page_name, locator_dict, CLICKABLE)
+            else:
+                element = self.find(element_name, page_name, locator_dict)
+                wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
+                wait.until(EC.element_to_be_clickable(locator_dict[next(iter(locator_dict))]))
             element.click()
             logger.info(f"Clicked '{element_name}' on page '{page_name}' ({self.driver.current_url})")
         except Exception as e:
@@ -82,9 +111,12 @@ class ElementFinder:
         Asserts that an element is visible, with diagnostics.
         """
         try:
-            element = self.find(element_name, page_name, locator_dict)
-            wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
-            wait.until(EC.visibility_of(element))
+            if self.race:
+                element = self._race(element_name, page_name, locator_dict, VISIBLE)
+            else:
+                element = self.find(element_name, page_name, locator_dict)
+                wait = WebDriverWait(self.driver, self.timeout, self.poll_frequency)
+                wait.until(EC.visibility_of(element))
             logger.info(f"Verified visibility of '{element_name}' on page '{page_name}' ({self.driver.current_url})")
             assert element.is_displayed(), f"Element '{element_name}' not visible on '{page_name}'"
         except Exception as e:
@@ -0,0 +1,247 @@
+# Filename: utils/wait_budget.py
+# Description: Learns per-element wait budgets from a persistent histogram of find latencies and reports elements whose latency drifts upward.
+
+import argparse
+import logging
+import math
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter, namedtuple
+from contextlib import closing
+
+from utils.config_provider import ConfigProvider
+
+logger = logging.getLogger(__name__)
+
+# Quarter-octave buckets: each bucket's upper edge is ~19% above the previous one
+BUCKETS_PER_OCTAVE = 4
+DAY = 86400
+
+Drift = namedtuple("Drift", "page element strategy baseline_ms recent_ms baseline_samples recent_samples ratio")
+
+
+def bucket_for(seconds):
+    ms = max(seconds * 1000, 1.0)
+    return math.ceil(math.log2(ms) * BUCKETS_PER_OCTAVE)
+
+
+def bucket_upper_ms(bucket):
+    return 2 ** (bucket / BUCKETS_PER_OCTAVE)
+
+
+def percentile_ms(histogram, percentile):
+    """
+    Upper edge of the bucket holding the given percentile (0-100) of a {bucket: count} histogram.
+    """
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = total * percentile / 100
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= rank:
+            return bucket_upper_ms(bucket)
+    return bucket_upper_ms(max(histogram))
+
+
+class WaitBudgets:
+    """
+    Per (page, element, strategy) latency histograms, bucketed by day, shared between processes through SQLite.
+    A wait budget is the configured percentile of the recent histogram plus a margin, clamped to [floor, ceiling].
+    Lookups with too little history keep the finder's fixed timeout.
+    Args:
+        path (str): SQLite file holding the histograms.
+        percentile (float): Percentile of observed latency the budget covers.
+        margin (float): Fraction added on top of that percentile.
+        floor (float): Shortest budget in seconds.
+        ceiling (float): Longest budget in seconds; defaults to the finder's own timeout.
+        min_samples (int): Observations needed before a budget replaces the fixed timeout.
+        window_days (int): Days of history budgets and drift baselines are computed from.
+        recent_days (int): Trailing days compared against the rest of the window in the drift report.
+    """
+
+    def __init__(self, path, percentile=99, margin=0.5, floor=1.0, ceiling=None, min_samples=20, window_days=14, recent_days=2):
+        self.path = path
+        self.percentile = percentile
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.window_days = window_days
+        self.recent_days = recent_days
+        self.stats = {"adaptive": 0, "fixed": 0, "observed": 0}
+        self._pending = Counter()
+        self._histograms = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS find_latency ("
+                    "page_name TEXT NOT NULL, element_name TEXT NOT NULL, strategy TEXT NOT NULL, day INTEGER NOT NULL, "
+                    "bucket INTEGER NOT NULL, count INTEGER NOT NULL, "
+                    "PRIMARY KEY (page_name, element_name, strategy, day, bucket))"
+                )
+            self._histograms = self._load()
+        except sqlite3.Error as e:
+            logger.warning(f"Wait budget history unavailable at {path}: {e}")
+
+    @classmethod
+    def from_env(cls, config=None):
+        """
+        Builds the budgets from SELENIUM_WAIT_BUDGET* settings; returns None when disabled.
+        """
+        config = config or ConfigProvider()
+        if config.get("SELENIUM_WAIT_BUDGET", "true").lower() in ("0", "false", "off"):
+            return None
+        ceiling = config.get("SELENIUM_WAIT_BUDGET_CEILING")
+        return cls(
+            config.get("SELENIUM_WAIT_BUDGET_HISTORY") or os.path.join(config.cache_dir, "find_latency.sqlite3"),
+            percentile=float(config.get("SELENIUM_WAIT_BUDGET_PERCENTILE", "99")),
+            margin=float(config.get("SELENIUM_WAIT_BUDGET_MARGIN", "0.5")),
+            floor=float(config.get("SELENIUM_WAIT_BUDGET_FLOOR", "1.0")),
+            ceiling=float(ceiling) if ceiling else None,
+            min_samples=int(config.get("SELENIUM_WAIT_BUDGET_MIN_SAMPLES", "20")),
+            window_days=int(config.get("SELENIUM_WAIT_BUDGET_WINDOW_DAYS", "14")),
+        )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _today(self):
+        return int(time.time() // DAY)
+
+    def _rows(self, conn, since):
+        return conn.execute(
+            "SELECT page_name, element_name, strategy, day, bucket, count FROM find_latency WHERE day >= ?", (since,)
+        )
+
+    def _load(self):
+        # Histograms are read once per session; lookups never touch the database
+        histograms = {}
+        with closing(self._connect()) as conn:
+            for page, element, strategy, _, bucket, count in self._rows(conn, self._today() - self.window_days + 1):
+                histograms.setdefault((page, element, strategy), Counter())[bucket] += count
+        return histograms
+
+    def budget(self, page_name, element_name, strategy=None, default=10):
+        """
+        Seconds to wait for element_name. With a strategy, that strategy's own history is used; without one,
+        or when the strategy has never won, the element's history across all strategies (once the page has
+        rendered, a fallback locator matches as soon as the winning one would). Returns default without history.
+        """
+        histogram = self._histograms.get((page_name, element_name, strategy)) if strategy else None
+        if not histogram or sum(histogram.values()) < self.min_samples:
+            histogram = Counter()
+            for (page, element, _), counts in self._histograms.items():
+                if page == page_name and element == element_name:
+                    histogram.update(counts)
+        if sum(histogram.values()) < self.min_samples:
+            self.stats["fixed"] += 1
+            return default
+        self.stats["adaptive"] += 1
+        seconds = percentile_ms(histogram, self.percentile) / 1000 * (1 + self.margin)
+        ceiling = self.ceiling if self.ceiling is not None else default
+        return min(max(seconds, self.floor), ceiling)
+
+    def observe(self, page_name, element_name, strategy, seconds):
+        """
+        Records how long the winning strategy's wait took; buffered and written by flush().
+        """
+        self.stats["observed"] += 1
+        self._pending[(page_name, element_name, strategy, self._today(), bucket_for(seconds))] += 1
+        if len(self._pending) >= 500:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, Counter()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT INTO find_latency (page_name, element_name, strategy, day, bucket, count) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (page_name, element_name, strategy, day, bucket) DO UPDATE SET count = count + excluded.count",
+                    [key + (count,) for key, count in pending.items()],
+                )
+                # History older than twice the window can no longer affect budgets or drift baselines
+                conn.execute("DELETE FROM find_latency WHERE day < ?", (self._today() - 2 * self.window_days,))
+        except sqlite3.Error as e:
+            logger.warning(f"Wait budget history write failed: {e}")
+
+    def drift(self, threshold=1.5, percentile=50):
+        """
+        Elements whose latency over the last recent_days exceeds the rest of the window by threshold times or more.
+        Returns Drift rows, worst first.
+        """
+        baseline, recent = {}, {}
+        since = self._today() - self.recent_days + 1
+        with closing(self._connect()) as conn:
+            for page, element, strategy, day, bucket, count in self._rows(conn, self._today() - self.window_days + 1):
+                target = recent if day >= since else baseline
+                target.setdefault((page, element, strategy), Counter())[bucket] += count
+        rows = []
+        for key, now in recent.items():
+            before = baseline.get(key)
+            if not before or sum(before.values()) < self.min_samples or sum(now.values()) < self.min_samples:
+                continue
+            baseline_ms, recent_ms = percentile_ms(before, percentile), percentile_ms(now, percentile)
+            ratio = recent_ms / baseline_ms
+            if ratio >= threshold:
+                rows.append(Drift(*key, baseline_ms, recent_ms, sum(before.values()), sum(now.values()), ratio))
+        return sorted(rows, key=lambda row: row.ratio, reverse=True)
+
+    def summary(self):
+        learned = len({(page, element) for page, element, _ in self._histograms})
+        return (
+            f"wait budgets: {self.stats['adaptive']} adaptive and {self.stats['fixed']} fixed waits, "
+            f"{learned} elements with history, {self.stats['observed']} latencies recorded to {self.path}"
+        )
+
+
+_active = None
+
+
+def activate(budgets):
+    """
+    Makes budgets the default of every ElementFinder in this process (None restores fixed timeouts).
+    conftest activates the session's budgets for each browser test only, so fake drivers never add latencies.
+    """
+    global _active
+    _active = budgets
+
+
+def active_budgets():
+    return _active
+
+
+def main(argv=None):
+    """
+    Usage: python -m utils.wait_budget [--threshold 1.5] [--percentile 50]
+    Lists elements whose find latency over the last days is drifting upward.
+    """
+    parser = argparse.ArgumentParser(prog="python -m utils.wait_budget", description=main.__doc__)
+    parser.add_argument("--threshold", type=float, default=1.5, help="recent/baseline latency ratio to report")
+    parser.add_argument("--percentile", type=float, default=50, help="latency percentile compared")
+    args = parser.parse_args(argv)
+    budgets = WaitBudgets.from_env() or WaitBudgets(os.path.join(ConfigProvider().cache_dir, "find_latency.sqlite3"))
+    rows = budgets.drift(args.threshold, args.percentile)
+    if not rows:
+        print(f"No element latency drifted by {args.threshold}x or more in the last {budgets.recent_days} days.")
+        return 0
+    print(f"{len(rows)} elements slower in the last {budgets.recent_days} days (p{args.percentile:g}, baseline -> recent):")
+    for row in rows:
+        print(
+            f"  [{row.page}] {row.element} via {row.strategy}: {row.baseline_ms:.0f}ms -> {row.recent_ms:.0f}ms "
+            f"({row.ratio:.1f}x, {row.baseline_samples}/{row.recent_samples} samples)"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())